@@ -1,14 +1,448 @@
 """The main entry point for the application."""
 
+##############################################################################
+# Python imports.
+from argparse import ArgumentParser, Namespace
+from asyncio import run as run_async
+from datetime import datetime, timedelta
+from os import O_WRONLY, devnull, dup2
+from os import open as open_file
+from pathlib import Path
+from sys import exit, stderr, stdout
+from time import perf_counter
+from typing import TYPE_CHECKING
+
 ##############################################################################
 # Local imports.
-from .app import OSHit
+from . import __version__
+from .profiling import ComposeTimer, ImportTimer, startup_report
+
+if TYPE_CHECKING:
+    from .hn import Bundle
+    from .startup import Startup
+
+##############################################################################
+# NOTE: The bulk of the application is imported within the functions below,
+# rather than up here, so that the imports can be profiled.
+##############################################################################
+
+
+##############################################################################
+def get_args() -> Namespace:
+    """Get the command line arguments.
+
+    Returns:
+        The arguments.
+    """
+    from .cli.output import FORMATS
+
+    parser = ArgumentParser(
+        prog="oshit",
+        description="A terminal-based HackerNews reader.",
+        epilog=f"v{__version__}",
+    )
+    parser.add_argument(
+        "-v",
+        "--version",
+        help="Show version information",
+        action="version",
+        version=f"%(prog)s v{__version__}",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        help="Report on the time taken by imports, composing and startup, on exit",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--offline",
+        help="Read HackerNews from a bundle created with `snapshot create`",
+        metavar="BUNDLE",
+        type=Path,
+    )
+
+    commands = parser.add_subparsers(
+        title="commands", dest="command", metavar="COMMAND"
+    )
+
+    snapshot = commands.add_parser(
+        "snapshot", help="Work with offline bundles of HackerNews data"
+    )
+    snapshot_commands = snapshot.add_subparsers(
+        dest="snapshot_command", metavar="COMMAND", required=True
+    )
+    create = snapshot_commands.add_parser(
+        "create",
+        help="Create an offline bundle of the tabs and the top threads",
+    )
+    create.add_argument(
+        "-o",
+        "--output",
+        help="The bundle to create",
+        type=Path,
+        default=Path(f"oshit-{datetime.now():%Y%m%d-%H%M%S}.bundle"),
+    )
+    create.add_argument(
+        "-t",
+        "--threads",
+        help="The number of top stories to include the full threads of (default: %(default)s)",
+        type=int,
+        default=30,
+    )
+
+    dump = commands.add_parser(
+        "dump", help="Dump HackerNews lists and threads to standard output"
+    )
+    dump_commands = dump.add_subparsers(
+        dest="dump_command", metavar="LIST", required=True
+    )
+    output_format = ArgumentParser(add_help=False)
+    output_format.add_argument(
+        "-f",
+        "--format",
+        help="The format to write in (default: %(default)s)",
+        choices=FORMATS,
+        default="jsonl",
+    )
+    for list_name in ("top", "new", "best", "ask", "show", "jobs"):
+        dump_list = dump_commands.add_parser(
+            list_name,
+            help=f"Dump the {list_name} stories",
+            parents=[output_format],
+        )
+        dump_list.add_argument(
+            "-l", "--limit", help="The maximum number of stories to dump", type=int
+        )
+    dump_thread = dump_commands.add_parser(
+        "thread",
+        help="Dump an item and all of the replies to it",
+        parents=[output_format],
+    )
+    dump_thread.add_argument("item_id", help="The ID of the item", type=int)
+
+    crawl = commands.add_parser(
+        "crawl", help="Crawl a range of item IDs into the local archive"
+    )
+    crawl.add_argument(
+        "--from",
+        help="The first item ID to crawl (default: %(default)s)",
+        dest="first",
+        type=int,
+        default=1,
+    )
+    crawl.add_argument(
+        "--to",
+        help="The last item ID to crawl, or `max` for the latest item (default: %(default)s)",
+        dest="last",
+        type=lambda last: None if last == "max" else int(last),
+        default="max",
+    )
+    crawl.add_argument(
+        "--archive",
+        help="The archive to crawl into (default: the archive in the data directory)",
+        type=Path,
+    )
+    crawl.add_argument(
+        "-p",
+        "--processes",
+        help="The number of worker processes to crawl with (default: %(default)s)",
+        type=int,
+        default=1,
+    )
+    crawl.add_argument(
+        "--chunk-size",
+        help="The number of IDs to crawl and store at a time (default: %(default)s)",
+        type=int,
+        default=1_000,
+    )
+
+    serve = commands.add_parser(
+        "serve", help="Serve the HackerNews API locally, from a shared cache"
+    )
+    serve.add_argument(
+        "--host",
+        help="The host to serve on (default: %(default)s)",
+        default="127.0.0.1",
+    )
+    serve.add_argument(
+        "--port",
+        help="The port to serve on (default: %(default)s)",
+        type=int,
+        default=8_000,
+    )
+    serve.add_argument(
+        "--ttl",
+        help="The time in seconds to serve items and users before refreshing them (default: the item cache TTL)",
+        type=float,
+    )
+    serve.add_argument(
+        "--list-ttl",
+        help="The time in seconds to serve lists before refreshing them (default: %(default)s)",
+        type=float,
+        default=10,
+    )
+
+    query = commands.add_parser("query", help="Query the local archive")
+    query_commands = query.add_subparsers(
+        dest="query_command", metavar="QUERY", required=True
+    )
+    # The query commands have their own take on the format, rather than
+    # sharing the dump commands', as they default to something different.
+    query_options = ArgumentParser(add_help=False)
+    query_options.add_argument(
+        "-f",
+        "--format",
+        help="The format to write in (default: %(default)s)",
+        choices=FORMATS,
+        default="text",
+    )
+    query_options.add_argument(
+        "--archive",
+        help="The archive to query (default: the archive in the data directory)",
+        type=Path,
+    )
+    time_range = ArgumentParser(add_help=False)
+    time_range.add_argument(
+        "--since",
+        help="Only look at items from this date (YYYY-MM-DD) on",
+        type=datetime.fromisoformat,
+    )
+    time_range.add_argument(
+        "--until",
+        help="Only look at items from before this date (YYYY-MM-DD)",
+        type=datetime.fromisoformat,
+    )
+    time_range.add_argument(
+        "--days",
+        help="Only look at items from the last this many days",
+        type=int,
+    )
+    limit = ArgumentParser(add_help=False)
+    limit.add_argument(
+        "-l",
+        "--limit",
+        help="The maximum number of results (default: %(default)s)",
+        type=int,
+        default=25,
+    )
+    query_commands.add_parser(
+        "top",
+        help="The highest scoring stories",
+        parents=[query_options, time_range, limit],
+    )
+    query_commands.add_parser(
+        "domains",
+        help="The most-submitted domains",
+        parents=[query_options, time_range, limit],
+    )
+    user = query_commands.add_parser(
+        "user",
+        help="How much a user has posted over time",
+        parents=[query_options, time_range],
+    )
+    user.add_argument("user", help="The user to look at")
+    user.add_argument(
+        "--by",
+        help="The period to group the posts by (default: %(default)s)",
+        choices=("day", "week", "month", "year"),
+        default="month",
+    )
+    user.add_argument(
+        "--type",
+        help="The type of post to count (default: %(default)s)",
+        default="comment",
+    )
+    replies = query_commands.add_parser(
+        "replies", help="The direct replies to an item", parents=[query_options]
+    )
+    replies.add_argument("item_id", help="The ID of the item", type=int)
+    sql = query_commands.add_parser(
+        "sql",
+        help="Run some read-only SQL against the archive's `items` table",
+        parents=[query_options],
+    )
+    sql.add_argument("statement", help="The SQL to run")
+
+    return parser.parse_args()
+
+
+##############################################################################
+async def launch(
+    started: float, bundle: "Bundle | None", composes: ComposeTimer | None = None
+) -> "Startup":
+    """Launch the application, getting a head start on loading the data.
+
+    Args:
+        started: The time at which the application started.
+        bundle: The offline bundle to read from, if there is one.
+        composes: The timer to time the composing of widgets with, if any.
+
+    Returns:
+        The details of the startup of the application.
+    """
+    from .app.data import load_configuration
+    from .hn import HN
+    from .startup import Startup
+
+    startup = Startup(started)
+    config = load_configuration()
+    startup.head_start(
+        HN(
+            max_concurrency=config.maximum_concurrency,
+            timeout=config.connection_timeout,
+            cache_ttl=config.item_cache_ttl,
+            user_cache_ttl=config.user_cache_ttl,
+            base_urls=config.api_base_urls,
+            bundle=bundle,
+        ),
+        config.maximum_top,
+    )
+
+    from .app import OSHit
+
+    startup.mark("application imported")
+    if composes is not None:
+        composes.install()
+    await OSHit(startup).run_async()
+    return startup
+
+
+##############################################################################
+def dump(args: Namespace) -> int:
+    """Dump a list or a thread to standard output.
+
+    Args:
+        args: The command line arguments.
+
+    Returns:
+        The exit status for the command.
+    """
+    from .cli.dump import dump_list, dump_thread
+
+    try:
+        return run_async(
+            dump_thread(args.item_id, args.format)
+            if args.dump_command == "thread"
+            else dump_list(args.dump_command, args.limit, args.format)
+        )
+    except BrokenPipeError:
+        # Whatever we were writing to has stopped reading, which is fine;
+        # but make sure Python doesn't complain about it on the way out.
+        dup2(open_file(devnull, O_WRONLY), stdout.fileno())
+        return 0
+
+
+##############################################################################
+def crawl(args: Namespace) -> int:
+    """Crawl a range of items into the local archive.
+
+    Args:
+        args: The command line arguments.
+
+    Returns:
+        The exit status for the command.
+    """
+    from .cli.crawl import crawl
+
+    try:
+        return run_async(
+            crawl(args.first, args.last, args.archive, args.processes, args.chunk_size)
+        )
+    except KeyboardInterrupt:
+        print(
+            "\nThe crawl was interrupted; run it again to carry on from here.",
+            file=stderr,
+        )
+        return 1
+
+
+##############################################################################
+def serve(args: Namespace) -> int:
+    """Serve the HackerNews API locally.
+
+    Args:
+        args: The command line arguments.
+
+    Returns:
+        The exit status for the command.
+    """
+    from .cli.serve import serve
+
+    try:
+        return run_async(serve(args.host, args.port, args.ttl, args.list_ttl))
+    except KeyboardInterrupt:
+        return 0
+
+
+##############################################################################
+def query(args: Namespace) -> int:
+    """Query the local archive.
+
+    Args:
+        args: The command line arguments.
+
+    Returns:
+        The exit status for the command.
+    """
+    from .archive import query as queries
+    from .cli.query import query
+
+    since = getattr(args, "since", None)
+    if (days := getattr(args, "days", None)) is not None:
+        since = datetime.now() - timedelta(days=days)
+    until = getattr(args, "until", None)
+    return query(
+        args.archive,
+        args.format,
+        {
+            "top": lambda archive: queries.top_stories(
+                archive, since, until, args.limit
+            ),
+            "domains": lambda archive: queries.top_domains(
+                archive, since, until, args.limit
+            ),
+            "user": lambda archive: queries.user_activity(
+                archive, args.user, args.by, args.type, since, until
+            ),
+            "replies": lambda archive: queries.replies(archive, args.item_id),
+            "sql": lambda archive: queries.sql(archive, args.statement),
+        }[args.query_command],
+    )
 
 
 ##############################################################################
 def run() -> None:
     """Run the application."""
-    OSHit().run()
+    started = perf_counter()
+    args = get_args()
+    if args.command == "snapshot":
+        from .cli.snapshot import create_snapshot
+
+        exit(run_async(create_snapshot(args.output, args.threads)))
+    if args.command == "dump":
+        exit(dump(args))
+    if args.command == "crawl":
+        exit(crawl(args))
+    if args.command == "query":
+        exit(query(args))
+    if args.command == "serve":
+        exit(serve(args))
+    composes: ComposeTimer | None = None
+    if args.startup_profile:
+        (imports := ImportTimer()).install()
+        composes = ComposeTimer()
+    bundle = None
+    if args.offline is not None:
+        from .hn import Bundle
+
+        try:
+            bundle = Bundle(args.offline)
+        except Bundle.Error as error:
+            exit(f"oshit: {error}")
+    startup = run_async(launch(started, bundle, composes))
+    if composes is not None:
+        imports.uninstall()
+        composes.uninstall()
+        print(startup_report(imports, composes, startup.phases, startup.first_story))
 
 
 ##############################################################################
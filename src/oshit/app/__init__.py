@@ -1,11 +1,28 @@
 """Orange Site Hit.
 
 Get your HackerNews hit in the terminal.
+
+Note:
+    The application class is only imported when it's first asked for, so
+    that the application's data can be used without loading Textual.
 """
 
 ##############################################################################
-# Local imports.
-from .oshit import OSHit
+# Python imports.
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .oshit import OSHit
+
+
+##############################################################################
+def __getattr__(name: str) -> Any:
+    if name == "OSHit":
+        from .oshit import OSHit
+
+        return OSHit
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 ##############################################################################
 # Exports.
@@ -2,7 +2,7 @@
 
 ##############################################################################
 # Python imports.
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 ##############################################################################
 # Textual imports.
@@ -10,7 +10,7 @@ from textual.message import Message
 
 ##############################################################################
 # Local imports.
-from ..hn.item import Article
+from ..hn.item import Article, Comment
 
 
 ##############################################################################
@@ -30,5 +30,8 @@ class ShowComments(Message):
     article: Article
     """The article to show the comments for."""
 
+    path: list[Comment] = field(default_factory=list)
+    """The comments leading down to a comment to open the thread up to."""
+
 
 ### commands.py ends here
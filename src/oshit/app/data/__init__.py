@@ -3,12 +3,25 @@
 ##############################################################################
 # Local imports.
 from .config import load_configuration, save_configuration
+from .history import RankHistory, load_history, save_history
+from .seen import load_seen, save_seen
+from .snapshots import load_snapshot, save_snapshot
+from .watchlist import load_watchlist, save_watchlist
 
 ##############################################################################
 # Exports.
 __all__ = [
+    "RankHistory",
     "load_configuration",
+    "load_history",
+    "load_seen",
+    "load_snapshot",
+    "load_watchlist",
     "save_configuration",
+    "save_history",
+    "save_seen",
+    "save_snapshot",
+    "save_watchlist",
 ]
 
 ### __init__.py ends here
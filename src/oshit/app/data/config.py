@@ -2,7 +2,7 @@
 
 ##############################################################################
 # Python imports.
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from functools import lru_cache
 from json import dumps, loads
 from pathlib import Path
@@ -35,6 +35,22 @@ class Configuration:
     connection_timeout: int | None = 20
     """The timeout (in seconds) to use when connecting to the HackerNews API."""
 
+    api_base_urls: list[str] = field(
+        default_factory=lambda: ["https://hacker-news.firebaseio.com/v0/"]
+    )
+    """The bases of the URLs for the HackerNews API, in order of preference.
+
+    These can point at anything that serves the same API, such as `oshit
+    serve`. Calls go to the fastest of them that's working, failing over to
+    the others as need be.
+    """
+
+    item_cache_ttl: int = 60
+    """The time (in seconds) for which a downloaded item is reused."""
+
+    user_cache_ttl: int = 600
+    """The time (in seconds) for which the downloaded details of a user are reused."""
+
     maximum_top: int = 500
     """The maximum number of top stories to show."""
 
@@ -53,9 +69,52 @@ class Configuration:
     maximum_jobs: int = 200
     """The maximum number of jobs to show."""
 
+    firehose_size: int = 1_000
+    """The number of the most recent items to keep in the firehose."""
+
+    firehose_interval: int = 10
+    """The time (in seconds) between checks for new items in the firehose."""
+
+    watchlist_interval: int = 60
+    """The time (in seconds) between checks of the watchlist."""
+
     background_load_tabs: bool = True
     """Should the content of the tabs try and load in the background?"""
 
+    auto_refresh: dict[str, int] = field(default_factory=dict)
+    """The time (in seconds) between automatic refreshes of each tab.
+
+    This is keyed on the name of the tab (`top`, `new`, `best`, `ask`,
+    `show` or `jobs`); tabs that aren't listed aren't refreshed
+    automatically.
+    """
+
+    auto_refresh_jitter: float = 0.1
+    """How much (as a fraction of the time) to vary the time between refreshes."""
+
+    rank_history: bool = True
+    """Should the ranking and scores of the stories in each tab be recorded?"""
+
+    idle_prefetch_after: int = 30
+    """The time (in seconds) without input after which comments are prefetched.
+
+    While the application is idle, the first couple of levels of comments
+    of the top stories in the current tab are loaded into the cache, ready
+    for when they're wanted; `0` turns this off.
+    """
+
+    idle_prefetch_stories: int = 30
+    """The number of stories to prefetch the comments of when idle."""
+
+    idle_prefetch_budget: int = 300
+    """The most calls a minute to make to the API when prefetching."""
+
+    comments_page_size: int = 50
+    """The number of top-level comments to load at a time."""
+
+    prefetch_commenters: bool = True
+    """Should the details of the authors of comments be loaded in the background?"""
+
 
 ##############################################################################
 def configuration_file() -> Path:
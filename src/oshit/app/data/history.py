@@ -0,0 +1,441 @@
+"""Code relating to the history of the ranking and scores of stories."""
+
+##############################################################################
+# Python imports.
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from struct import Struct
+from struct import error as StructError
+from typing import Iterator
+from zlib import compress, decompress
+from zlib import error as ZlibError
+
+##############################################################################
+# Local imports.
+from .locations import data_dir
+
+
+##############################################################################
+def _zigzag(value: int) -> int:
+    """Fold a signed integer into an unsigned one, keeping small values small."""
+    return (value << 1) if value >= 0 else ((-value << 1) - 1)
+
+
+##############################################################################
+def _unzigzag(value: int) -> int:
+    """Unfold an unsigned integer made by `_zigzag` back into a signed one."""
+    return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+
+##############################################################################
+def _put(out: bytearray, value: int) -> None:
+    """Add an unsigned integer to some data, as a variable-length integer."""
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+##############################################################################
+def _values(data: bytes) -> Iterator[int]:
+    """Read the variable-length integers from some data."""
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            yield value
+            value = shift = 0
+
+
+##############################################################################
+class RankHistory:
+    """The history of the ranking of a list of stories, and of their scores.
+
+    Each snapshot of the list is appended to the history as the difference
+    from the snapshot before it: a story that holds its position costs a
+    single byte, and a story that's new to the list costs little more than
+    the distance of its ID from the last new one. The scores of the
+    stories that were on display are kept as the change since each was
+    last recorded. Every so often a snapshot is saved in full, so that
+    loading the history only means reading back from the last of those.
+
+    In memory, only the recent history of each story is kept, so that the
+    movement and the velocity of any story can be looked up straight
+    away.
+    """
+
+    MAGIC = b"OSHITRH1"
+    """The marker at the start of a saved history."""
+
+    KEYFRAME_EVERY = 48
+    """The number of snapshots between snapshots that are saved in full."""
+
+    MINIMUM_GAP = 60
+    """The minimum time (in seconds) between snapshots."""
+
+    WINDOW = 3600
+    """The time (in seconds) over which movement and velocity are measured."""
+
+    MINIMUM_SPAN = 300
+    """The minimum time (in seconds) of scores needed to work out a velocity."""
+
+    _RECORD = Struct("<IIB")
+    """The layout of the header of each snapshot: time, size and flags."""
+
+    _KEYFRAME = 1
+    """The flag that marks a snapshot that's saved in full."""
+
+    def __init__(self) -> None:
+        """Initialise the history."""
+        self._ids: list[int] = []
+        """The IDs of the stories in the last snapshot, in order."""
+        self._ranks_of: dict[int, int] = {}
+        """The ranks of the stories in the last snapshot, keyed on ID."""
+        self._scores_of: dict[int, int] = {}
+        """The last score recorded for each story since the last keyframe."""
+        self._since_keyframe = 0
+        """The number of snapshots since the last keyframe."""
+        self._last_time = 0
+        """The time of the last snapshot."""
+        self._ranks: dict[int, deque[tuple[int, int]]] = {}
+        """The recent ranks of each story, as times and ranks, oldest first."""
+        self._scores: dict[int, deque[tuple[int, int]]] = {}
+        """The recent scores of each story, as times and scores, oldest first."""
+        self._unsaved: list[bytes] = []
+        """Snapshots that have been recorded but not yet saved."""
+        self._saved_length = 0
+        """The length of the saved history that's known to be good."""
+
+    def _reset(self) -> None:
+        """Forget the last snapshot, ready for a keyframe."""
+        self._ids = []
+        self._ranks_of = {}
+        self._scores_of = {}
+        self._since_keyframe = 0
+
+    def _encode(self, item_ids: list[int], scores: list[tuple[int, int]]) -> bytes:
+        """Encode a snapshot as the difference from the last snapshot.
+
+        Args:
+            item_ids: The IDs of the stories, in order.
+            scores: The ranks and scores of the stories to record the scores
+                of, in order of rank.
+
+        Returns:
+            The encoded snapshot.
+        """
+        out = bytearray()
+        _put(out, len(item_ids))
+        expected = 0
+        base = max(self._ids, default=0)
+        for item_id in item_ids:
+            if (rank := self._ranks_of.get(item_id)) is not None:
+                _put(out, _zigzag(rank - expected) << 1)
+                expected = rank + 1
+            else:
+                _put(out, (_zigzag(item_id - base) << 1) | 1)
+                base = item_id
+        _put(out, len(scores))
+        last_rank = -1
+        for rank, score in scores:
+            _put(out, rank - last_rank - 1)
+            _put(out, _zigzag(score - self._scores_of.get(item_ids[rank], 0)))
+            last_rank = rank
+        return bytes(out)
+
+    def _decode(self, data: bytes) -> tuple[list[int], list[tuple[int, int]]]:
+        """Decode a snapshot encoded as the difference from the last snapshot.
+
+        Args:
+            data: The encoded snapshot.
+
+        Returns:
+            The IDs of the stories in order, and the ranks and scores of the
+            stories whose scores were recorded.
+
+        Raises:
+            ValueError: If the snapshot is damaged.
+        """
+        values = _values(data)
+        try:
+            item_ids: list[int] = []
+            expected = 0
+            base = max(self._ids, default=0)
+            for _ in range(next(values)):
+                code = next(values)
+                if code & 1:
+                    item_ids.append(base := base + _unzigzag(code >> 1))
+                else:
+                    rank = expected + _unzigzag(code >> 1)
+                    item_ids.append(self._ids[rank])
+                    expected = rank + 1
+            scores: list[tuple[int, int]] = []
+            last_rank = -1
+            for _ in range(next(values)):
+                last_rank = rank = last_rank + next(values) + 1
+                scores.append(
+                    (
+                        rank,
+                        self._scores_of.get(item_ids[rank], 0)
+                        + _unzigzag(next(values)),
+                    )
+                )
+        except (StopIteration, IndexError):
+            raise ValueError("Damaged snapshot") from None
+        return item_ids, scores
+
+    def _apply(
+        self, when: int, item_ids: list[int], scores: list[tuple[int, int]]
+    ) -> None:
+        """Make a snapshot the latest snapshot.
+
+        Args:
+            when: The time of the snapshot.
+            item_ids: The IDs of the stories, in order.
+            scores: The ranks and scores of the stories whose scores were
+                recorded, in order of rank.
+        """
+        self._ids = item_ids
+        self._ranks_of = {item_id: rank for rank, item_id in enumerate(item_ids)}
+        self._since_keyframe += 1
+        self._last_time = when
+        for rank, score in scores:
+            self._scores_of[item_ids[rank]] = score
+            self._note(self._scores, item_ids[rank], when, score)
+        for rank, item_id in enumerate(item_ids):
+            self._note(self._ranks, item_id, when, rank)
+        # Forget anything we haven't heard about within the window.
+        for series in (self._ranks, self._scores):
+            for item_id in [
+                item_id
+                for item_id, samples in series.items()
+                if samples[-1][0] < when - self.WINDOW
+            ]:
+                del series[item_id]
+
+    def _note(
+        self,
+        series: dict[int, deque[tuple[int, int]]],
+        item_id: int,
+        when: int,
+        value: int,
+    ) -> None:
+        """Note the value of something about a story at a time.
+
+        Args:
+            series: The series to note the value in.
+            item_id: The ID of the story.
+            when: The time of the value.
+            value: The value.
+        """
+        if (samples := series.get(item_id)) is None:
+            samples = series[item_id] = deque()
+        samples.append((when, value))
+        while samples[0][0] < when - self.WINDOW:
+            samples.popleft()
+
+    def record(
+        self, when: datetime, item_ids: list[int], scores: dict[int, int]
+    ) -> bool:
+        """Record a snapshot of the list.
+
+        Args:
+            when: The time of the snapshot.
+            item_ids: The IDs of the stories in the list, in order.
+            scores: The scores of the stories to record the scores of,
+                keyed on ID.
+
+        Returns:
+            `True` if the snapshot was recorded, `False` if it came too soon
+            after the last one.
+        """
+        if (now := int(when.timestamp())) - self._last_time < self.MINIMUM_GAP:
+            return False
+        ranked = sorted(
+            (rank, scores[item_id])
+            for rank, item_id in enumerate(item_ids)
+            if item_id in scores
+        )
+        if keyframe := (not self._ids or self._since_keyframe >= self.KEYFRAME_EVERY):
+            self._reset()
+        payload = compress(self._encode(item_ids, ranked))
+        self._unsaved.append(
+            self._RECORD.pack(now, len(payload), self._KEYFRAME if keyframe else 0)
+            + payload
+        )
+        self._apply(now, item_ids, ranked)
+        return True
+
+    @property
+    def dirty(self) -> bool:
+        """Have snapshots been recorded since the history was loaded or saved?"""
+        return bool(self._unsaved)
+
+    def unsaved(self) -> tuple[int, bytes]:
+        """Get what needs to be saved.
+
+        Returns:
+            The length of the saved history that's known to be good, and the
+            snapshots to add after that.
+        """
+        return self._saved_length, b"".join(self._unsaved)
+
+    def saved(self, length: int) -> None:
+        """Note that everything has been saved.
+
+        Args:
+            length: The length of the saved history.
+        """
+        self._unsaved = []
+        self._saved_length = length
+
+    def movement(self, item_id: int) -> int | None:
+        """Get how far a story has moved up the list, recently.
+
+        Args:
+            item_id: The ID of the story.
+
+        Returns:
+            The number of places the story has moved up the list (negative
+            if it's moved down), or `None` if it's not known.
+        """
+        if (samples := self._ranks.get(item_id)) is None or len(samples) < 2:
+            return None
+        return samples[0][1] - samples[-1][1]
+
+    def velocity(self, item_id: int) -> float | None:
+        """Get how fast a story has been gaining points, recently.
+
+        Args:
+            item_id: The ID of the story.
+
+        Returns:
+            The number of points an hour the story has been gaining, or
+            `None` if it's not known.
+        """
+        if (samples := self._scores.get(item_id)) is None or (
+            span := samples[-1][0] - samples[0][0]
+        ) < self.MINIMUM_SPAN:
+            return None
+        return (samples[-1][1] - samples[0][1]) * 3600 / span
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RankHistory":
+        """Create a history from its saved form.
+
+        Args:
+            data: The saved form of the history.
+
+        Returns:
+            The history.
+
+        Raises:
+            ValueError: If the data isn't a saved history.
+
+        Note:
+            Only the snapshots needed to know the recent history are
+            decoded. If the end of the history is damaged, everything up
+            to the damage is used, and the damage is dropped the next time
+            the history is saved.
+        """
+        if not data.startswith(cls.MAGIC):
+            raise ValueError("Not a rank history")
+        history = cls()
+        records: list[tuple[int, int, int, int]] = []
+        offset = len(cls.MAGIC)
+        try:
+            while offset < len(data):
+                when, length, flags = cls._RECORD.unpack_from(data, offset)
+                if offset + cls._RECORD.size + length > len(data):
+                    break
+                records.append((offset + cls._RECORD.size, length, when, flags))
+                offset += cls._RECORD.size + length
+        except StructError:
+            pass
+        keyframes = [
+            index for index, record in enumerate(records) if record[3] & cls._KEYFRAME
+        ]
+        if not keyframes:
+            history._saved_length = len(cls.MAGIC)
+            return history
+        latest = records[-1][2]
+        start = max(
+            (index for index in keyframes if records[index][2] <= latest - cls.WINDOW),
+            default=keyframes[0],
+        )
+        history._saved_length = records[start][0] - cls._RECORD.size
+        for payload, length, when, flags in records[start:]:
+            if flags & cls._KEYFRAME:
+                history._reset()
+            try:
+                history._apply(
+                    when, *history._decode(decompress(data[payload : payload + length]))
+                )
+            except (ValueError, ZlibError):
+                break
+            history._saved_length = payload + length
+        return history
+
+
+##############################################################################
+def history_file(name: str) -> Path:
+    """The path to the file that holds the history of the given list.
+
+    Args:
+        name: The name of the list.
+
+    Returns:
+        The path to the history file.
+    """
+    (history := data_dir() / "history").mkdir(parents=True, exist_ok=True)
+    return history / f"{name}.bin"
+
+
+##############################################################################
+def save_history(name: str, history: RankHistory) -> None:
+    """Save any snapshots recorded in the history of a list.
+
+    Args:
+        name: The name of the list.
+        history: The history to save.
+
+    Note:
+        The history is only ever added to; anything already saved is left
+        alone, unless it was found to be damaged.
+    """
+    if not history.dirty:
+        return
+    good, snapshots = history.unsaved()
+    with history_file(name).open("ab") as target:
+        target.truncate(good)
+        if not good:
+            target.write(RankHistory.MAGIC)
+        target.write(snapshots)
+        history.saved(target.tell())
+
+
+##############################################################################
+@lru_cache(maxsize=None)
+def load_history(name: str) -> RankHistory:
+    """Load the history of a list.
+
+    Args:
+        name: The name of the list.
+
+    Returns:
+        The history of the list.
+
+    Note:
+        The history is only loaded from storage once; after that the same
+        history is always returned.
+    """
+    try:
+        return RankHistory.from_bytes(history_file(name).read_bytes())
+    except (OSError, ValueError):
+        return RankHistory()
+
+
+### history.py ends here
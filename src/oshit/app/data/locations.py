@@ -6,7 +6,7 @@ from pathlib import Path
 
 ##############################################################################
 # XDG imports.
-from xdg_base_dirs import xdg_config_home
+from xdg_base_dirs import xdg_config_home, xdg_data_home
 
 
 ##############################################################################
@@ -30,4 +30,18 @@ def config_dir() -> Path:
     return _oshit_dir(xdg_config_home())
 
 
+##############################################################################
+def data_dir() -> Path:
+    """The path to the data directory for the application.
+
+    Returns:
+        The path to the data directory for the application.
+
+    Note:
+        If the directory doesn't exist, it will be created as a side-effect
+        of calling this function.
+    """
+    return _oshit_dir(xdg_data_home())
+
+
 ### locations.py ends here
@@ -0,0 +1,251 @@
+"""Code relating to keeping track of what has been read."""
+
+##############################################################################
+# Python imports.
+from functools import lru_cache
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+from struct import Struct
+from struct import error as StructError
+from zlib import compress, decompress
+from zlib import error as ZlibError
+
+##############################################################################
+# Local imports.
+from ...hn.item import Article
+from .locations import data_dir
+
+
+##############################################################################
+class SeenItems:
+    """A compact set of the IDs of items that have been seen.
+
+    The set is held as a bitmap, one bit per item ID, broken into chunks;
+    only chunks that hold a seen ID exist at all. Item IDs are handed out
+    in order, so the things someone reads cluster together; a handful of
+    chunks can cover a lot of reading, and on disk each chunk compresses
+    down to very little.
+    """
+
+    CHUNK_SIZE = 1 << 16
+    """The number of item IDs covered by each chunk."""
+
+    MAGIC = b"OSHITSN1"
+    """The marker at the start of a saved set."""
+
+    _HEADER = Struct("<8sI")
+    """The layout of the header of a saved set."""
+
+    _CHUNK = Struct("<II")
+    """The layout of the header of each chunk in a saved set."""
+
+    def __init__(self) -> None:
+        """Initialise the set."""
+        self._chunks: dict[int, bytearray] = {}
+        """The chunks of the bitmap, keyed on chunk number."""
+        self.dirty = False
+        """Has the set changed since it was loaded or saved?"""
+
+    def add(self, item_id: int) -> None:
+        """Add an item ID to the set.
+
+        Args:
+            item_id: The ID to add.
+        """
+        chunk, bit = divmod(item_id, self.CHUNK_SIZE)
+        if (bits := self._chunks.get(chunk)) is None:
+            bits = self._chunks[chunk] = bytearray(self.CHUNK_SIZE // 8)
+        if not bits[bit >> 3] & (mask := 1 << (bit & 7)):
+            bits[bit >> 3] |= mask
+            self.dirty = True
+
+    def __contains__(self, item_id: object) -> bool:
+        if not isinstance(item_id, int):
+            return False
+        chunk, bit = divmod(item_id, self.CHUNK_SIZE)
+        if (bits := self._chunks.get(chunk)) is None:
+            return False
+        return bool(bits[bit >> 3] & (1 << (bit & 7)))
+
+    def __bytes__(self) -> bytes:
+        return b"".join(
+            [
+                self._HEADER.pack(self.MAGIC, len(self._chunks)),
+                *(
+                    self._CHUNK.pack(chunk, len(packed := compress(bits))) + packed
+                    for chunk, bits in sorted(self._chunks.items())
+                ),
+            ]
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SeenItems":
+        """Create a set from its saved form.
+
+        Args:
+            data: The saved form of the set.
+
+        Returns:
+            The set.
+
+        Raises:
+            ValueError: If the data isn't a saved set.
+        """
+        seen = cls()
+        try:
+            magic, chunks = cls._HEADER.unpack_from(data)
+            if magic != cls.MAGIC:
+                raise ValueError("Not a set of seen items")
+            offset = cls._HEADER.size
+            for _ in range(chunks):
+                chunk, length = cls._CHUNK.unpack_from(data, offset)
+                offset += cls._CHUNK.size
+                bits = bytearray(decompress(data[offset : offset + length]))
+                if len(bits) != cls.CHUNK_SIZE // 8:
+                    raise ValueError("Damaged set of seen items")
+                seen._chunks[chunk] = bits
+                offset += length
+        except (StructError, ZlibError) as error:
+            raise ValueError(f"Damaged set of seen items: {error}") from None
+        return seen
+
+
+##############################################################################
+class Seen:
+    """What has been read: the comments seen, and when articles were visited."""
+
+    VISITS_KEPT = 10_000
+    """The number of the most recent visits to articles to remember."""
+
+    def __init__(
+        self, items: SeenItems | None = None, visits: dict[int, int] | None = None
+    ) -> None:
+        """Initialise the record of what has been read.
+
+        Args:
+            items: The IDs of the items that have been seen.
+            visits: The count of comments on each article when last visited.
+        """
+        self.items = items or SeenItems()
+        """The IDs of the items that have been seen."""
+        self.visits = visits or {}
+        """The count of comments on each article when last visited, oldest first."""
+        self._visits_changed = False
+        """Have the visits changed since they were loaded or saved?"""
+
+    def mark(self, item_id: int) -> None:
+        """Mark an item as seen.
+
+        Args:
+            item_id: The ID of the item.
+        """
+        self.items.add(item_id)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self.items
+
+    def visited(self, article: Article) -> None:
+        """Record a visit to an article's comments.
+
+        Args:
+            article: The article that was visited.
+        """
+        # Move the visit to the end, so it's the last to be forgotten.
+        self.visits.pop(article.item_id, None)
+        self.visits[article.item_id] = article.descendants
+        while len(self.visits) > self.VISITS_KEPT:
+            del self.visits[next(iter(self.visits))]
+        self._visits_changed = True
+
+    def unread(self, article: Article) -> int | None:
+        """Get the number of comments on an article since it was last visited.
+
+        Args:
+            article: The article to check.
+
+        Returns:
+            The number of new comments, or `None` if the article's comments
+            haven't been visited.
+        """
+        if (seen := self.visits.get(article.item_id)) is None:
+            return None
+        return max(0, article.descendants - seen)
+
+    @property
+    def dirty(self) -> bool:
+        """Has anything changed since it was loaded or saved?"""
+        return self.items.dirty or self._visits_changed
+
+    def saved(self) -> None:
+        """Note that everything has been saved."""
+        self.items.dirty = self._visits_changed = False
+
+
+##############################################################################
+def seen_items_file() -> Path:
+    """The path to the file that holds the IDs of the items that have been seen.
+
+    Returns:
+        The path to the file.
+    """
+    return data_dir() / "seen.bin"
+
+
+##############################################################################
+def visits_file() -> Path:
+    """The path to the file that holds the visits to articles.
+
+    Returns:
+        The path to the file.
+    """
+    return data_dir() / "visits.json"
+
+
+##############################################################################
+def save_seen(seen: Seen) -> None:
+    """Save the record of what has been read.
+
+    Args:
+        seen: The record to save.
+
+    Note:
+        Nothing is written if nothing has changed.
+    """
+    if seen.dirty:
+        seen_items_file().write_bytes(bytes(seen.items))
+        visits_file().write_text(
+            dumps({str(article): count for article, count in seen.visits.items()}),
+            encoding="utf-8",
+        )
+        seen.saved()
+
+
+##############################################################################
+@lru_cache(maxsize=None)
+def load_seen() -> Seen:
+    """Load the record of what has been read.
+
+    Returns:
+        The record of what has been read.
+
+    Note:
+        The record is only loaded from storage once; after that the same
+        record is always returned.
+    """
+    try:
+        items = SeenItems.from_bytes(seen_items_file().read_bytes())
+    except (OSError, ValueError):
+        items = SeenItems()
+    try:
+        visits = {
+            int(article): int(count)
+            for article, count in loads(
+                visits_file().read_text(encoding="utf-8")
+            ).items()
+        }
+    except (OSError, JSONDecodeError, AttributeError, TypeError, ValueError):
+        visits = {}
+    return Seen(items, visits)
+
+
+### seen.py ends here
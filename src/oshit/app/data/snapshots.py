@@ -0,0 +1,88 @@
+"""Code relating to snapshots of the lists of items shown in the tabs."""
+
+##############################################################################
+# Python imports.
+from dataclasses import dataclass
+from datetime import datetime
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+from typing import Any, Sequence
+
+##############################################################################
+# Local imports.
+from ...hn.item import Item
+from .locations import data_dir
+
+
+##############################################################################
+@dataclass
+class Snapshot:
+    """A snapshot of a list of items."""
+
+    snarfed: datetime
+    """The time at which the items were snarfed."""
+
+    item_ids: list[int]
+    """The IDs of the items in the list, in order."""
+
+    items: list[dict[str, Any]]
+    """The raw data of the items in the list, in order."""
+
+
+##############################################################################
+def snapshot_file(name: str) -> Path:
+    """The path to the file that holds the snapshot of the given list.
+
+    Args:
+        name: The name of the list.
+
+    Returns:
+        The path to the snapshot file.
+    """
+    (snapshots := data_dir() / "snapshots").mkdir(parents=True, exist_ok=True)
+    return snapshots / f"{name}.json"
+
+
+##############################################################################
+def save_snapshot(name: str, snarfed: datetime, items: Sequence[Item]) -> None:
+    """Save a snapshot of a list of items.
+
+    Args:
+        name: The name of the list.
+        snarfed: The time at which the items were snarfed.
+        items: The items to save.
+    """
+    snapshot_file(name).write_text(
+        dumps(
+            {
+                "snarfed": snarfed.isoformat(),
+                "item_ids": [item.item_id for item in items],
+                "items": [item.raw_data for item in items],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+##############################################################################
+def load_snapshot(name: str) -> Snapshot | None:
+    """Load the snapshot of a list of items.
+
+    Args:
+        name: The name of the list.
+
+    Returns:
+        The snapshot, or `None` if there isn't a usable one.
+    """
+    if not (source := snapshot_file(name)).exists():
+        return None
+    try:
+        data = loads(source.read_text(encoding="utf-8"))
+        return Snapshot(
+            datetime.fromisoformat(data["snarfed"]), data["item_ids"], data["items"]
+        )
+    except (JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+
+### snapshots.py ends here
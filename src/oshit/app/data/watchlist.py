@@ -0,0 +1,282 @@
+"""Code relating to the watchlist of threads and users."""
+
+##############################################################################
+# Python imports.
+from asyncio import gather
+from dataclasses import dataclass, field
+from functools import lru_cache
+from json import JSONDecodeError, dumps, loads
+from pathlib import Path
+from typing import Any
+
+##############################################################################
+# Local imports.
+from ...hn import HN, Priority
+from ...hn.item import Article, ParentItem
+from .locations import data_dir
+
+
+##############################################################################
+@dataclass
+class WatchedItem:
+    """What's known about an item that's being watched."""
+
+    title: str
+    """The title to use for the item when reporting on it."""
+
+    latest_reply: int | None = None
+    """The ID of the latest direct reply seen, or `None` if not known yet."""
+
+    descendants: int | None = None
+    """The number of descendants seen, if the item has them and it's known."""
+
+
+##############################################################################
+@dataclass
+class Watchlist:
+    """The threads and users being watched for new replies and submissions.
+
+    For each thing being watched, only the ID of the latest reply or
+    submission that's been seen (and, for stories, the count of
+    descendants) is kept; so the watchlist stays small however busy the
+    things on it get.
+    """
+
+    items: dict[int, WatchedItem] = field(default_factory=dict)
+    """The items being watched, keyed on ID."""
+
+    users: dict[str, int | None] = field(default_factory=dict)
+    """The users being watched, and the ID of their latest submission seen."""
+
+    def watching_item(self, item_id: int) -> bool:
+        """Is an item being watched?
+
+        Args:
+            item_id: The ID of the item.
+
+        Returns:
+            `True` if the item is being watched, `False` if not.
+        """
+        return item_id in self.items
+
+    def watching_user(self, user_id: str) -> bool:
+        """Is a user being watched?
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            `True` if the user is being watched, `False` if not.
+        """
+        return user_id in self.users
+
+    def toggle_item(self, item: ParentItem) -> bool:
+        """Start or stop watching an item.
+
+        Args:
+            item: The item to toggle.
+
+        Returns:
+            `True` if the item is now being watched, `False` if not.
+        """
+        if self.items.pop(item.item_id, None) is not None:
+            return False
+        self.items[item.item_id] = WatchedItem(
+            f"on '{item.title}'"
+            if isinstance(item, Article)
+            else f"to #{item.item_id} by {item.by}",
+            max(item.kids, default=0),
+            item.descendants if isinstance(item, Article) else None,
+        )
+        return True
+
+    def toggle_user(self, user_id: str, submitted: list[int] | None) -> bool:
+        """Start or stop watching a user.
+
+        Args:
+            user_id: The ID of the user to toggle.
+            submitted: The IDs of the user's submissions, if known.
+
+        Returns:
+            `True` if the user is now being watched, `False` if not.
+
+        Note:
+            If the user's submissions aren't known, their latest submission
+            is found the next time the watchlist is checked.
+        """
+        if user_id in self.users:
+            del self.users[user_id]
+            return False
+        self.users[user_id] = None if submitted is None else max(submitted, default=0)
+        return True
+
+    def _item_changed(self, item_id: int, data: dict[str, Any] | None) -> str | None:
+        """Record the latest state of a watched item.
+
+        Args:
+            item_id: The ID of the item.
+            data: The latest data for the item.
+
+        Returns:
+            A description of the change to the item, if there was one worth
+            reporting.
+        """
+        if (watched := self.items.get(item_id)) is None or not data:
+            return None
+        kids: list[int] = data.get("kids", [])
+        new_replies = sum(
+            1
+            for kid in kids
+            if watched.latest_reply is not None and kid > watched.latest_reply
+        )
+        if watched.descendants is not None and "descendants" in data:
+            new_replies = max(new_replies, data["descendants"] - watched.descendants)
+        baseline = watched.latest_reply is None
+        watched.latest_reply = max([*kids, watched.latest_reply or 0])
+        if "descendants" in data:
+            watched.descendants = data["descendants"]
+        if baseline or new_replies <= 0:
+            return None
+        return f"{new_replies} new {'reply' if new_replies == 1 else 'replies'} {watched.title}"
+
+    def _user_changed(self, user_id: str, data: dict[str, Any] | None) -> str | None:
+        """Record the latest state of a watched user.
+
+        Args:
+            user_id: The ID of the user.
+            data: The latest data for the user.
+
+        Returns:
+            A description of the change to the user, if there was one worth
+            reporting.
+        """
+        if user_id not in self.users or not data:
+            return None
+        submitted: list[int] = data.get("submitted", [])
+        latest = self.users[user_id]
+        self.users[user_id] = max([*submitted, latest or 0])
+        if latest is None:
+            return None
+        if new_submissions := sum(1 for item_id in submitted if item_id > latest):
+            return f"{new_submissions} new submission{'' if new_submissions == 1 else 's'} by {user_id}"
+        return None
+
+    async def check(self, client: HN, everything: bool = False) -> list[str]:
+        """Check the watchlist for new replies and submissions.
+
+        Args:
+            client: The HackerNews client to check with.
+            everything: Check everything, not just what's recently changed?
+
+        Returns:
+            Descriptions of the changes that were found.
+
+        Note:
+            Normally HackerNews' list of recently-changed items and users
+            is used to decide what to look at, so that only the things on
+            the watchlist that have actually changed are fetched. Checking
+            everything is for when the application first starts, when
+            things could have changed at any time since it last ran.
+            Anything whose latest state isn't known yet is always looked
+            at.
+        """
+        items = [
+            item_id
+            for item_id, watched in self.items.items()
+            if everything or watched.latest_reply is None
+        ]
+        users = [
+            user_id
+            for user_id, latest in self.users.items()
+            if everything or latest is None
+        ]
+        if not everything and (self.items or self.users):
+            changed_items, changed_users = await client.updates()
+            items.extend(set(changed_items) & self.items.keys() - set(items))
+            users.extend(set(changed_users) & self.users.keys() - set(users))
+        fetched = await gather(
+            *[
+                client.data(f"item/{item_id}.json", 0, priority=Priority.BACKGROUND_TAB)
+                for item_id in items
+            ],
+            *[
+                client.data(f"user/{user_id}.json", 0, priority=Priority.BACKGROUND_TAB)
+                for user_id in users
+            ],
+        )
+        changes = [
+            *[
+                self._item_changed(item_id, data)
+                for item_id, data in zip(items, fetched)
+            ],
+            *[
+                self._user_changed(user_id, data)
+                for user_id, data in zip(users, fetched[len(items) :])
+            ],
+        ]
+        return [change for change in changes if change is not None]
+
+
+##############################################################################
+def watchlist_file() -> Path:
+    """The path to the file that holds the watchlist.
+
+    Returns:
+        The path to the watchlist file.
+    """
+    return data_dir() / "watchlist.json"
+
+
+##############################################################################
+def save_watchlist(watchlist: Watchlist) -> None:
+    """Save the watchlist.
+
+    Args:
+        watchlist: The watchlist to save.
+    """
+    watchlist_file().write_text(
+        dumps(
+            {
+                "items": {
+                    str(item_id): [
+                        watched.title,
+                        watched.latest_reply,
+                        watched.descendants,
+                    ]
+                    for item_id, watched in watchlist.items.items()
+                },
+                "users": watchlist.users,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+##############################################################################
+@lru_cache(maxsize=None)
+def load_watchlist() -> Watchlist:
+    """Load the watchlist.
+
+    Returns:
+        The watchlist.
+
+    Note:
+        The watchlist is only loaded from storage once; after that the same
+        watchlist is always returned.
+    """
+    if not (source := watchlist_file()).exists():
+        return Watchlist()
+    try:
+        data = loads(source.read_text(encoding="utf-8"))
+        return Watchlist(
+            {
+                int(item_id): WatchedItem(*watched)
+                for item_id, watched in data["items"].items()
+            },
+            dict(data["users"]),
+        )
+    except (JSONDecodeError, KeyError, TypeError, ValueError):
+        return Watchlist()
+
+
+### watchlist.py ends here
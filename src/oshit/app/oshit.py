@@ -3,9 +3,12 @@
 ##############################################################################
 # Textual imports.
 from textual.app import App
+from textual.events import Event, InputEvent
+from textual.signal import Signal
 
 ##############################################################################
 # Local imports.
+from ..startup import Startup
 from .data import load_configuration, save_configuration
 from .screens import Main
 
@@ -39,14 +42,29 @@ class OSHit(App[None]):
     }
     """
 
-    def __init__(self) -> None:
-        """Initialise the application."""
+    def __init__(self, startup: Startup | None = None) -> None:
+        """Initialise the application.
+
+        Args:
+            startup: The details of the startup of the application.
+        """
         super().__init__()
+        self.startup = startup or Startup()
+        """The details of the startup of the application."""
         self.dark = load_configuration().dark_mode
+        self.input_signal: Signal[None] = Signal(self, "input")
+        """Signal published whenever there's input from the user."""
 
     def on_mount(self) -> None:
         """Get things going once the app is up and running."""
-        self.push_screen(Main())
+        self.startup.mark("application mounted")
+        self.push_screen(Main(self.startup))
+
+    async def on_event(self, event: Event) -> None:
+        """Note any input from the user, before handling the event."""
+        if isinstance(event, InputEvent) and not event.is_forwarded:
+            self.input_signal.publish(None)
+        await super().on_event(event)
 
     def _watch_dark(self) -> None:
         """Save the light/dark mode configuration choice."""
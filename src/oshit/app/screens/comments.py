@@ -1,5 +1,9 @@
 """Provides a modal screen for showing the comments for an item."""
 
+##############################################################################
+# Python imports.
+from asyncio import gather
+
 ##############################################################################
 # Humanize imports.
 from humanize import intcomma, naturaltime
@@ -8,7 +12,9 @@ from humanize import intcomma, naturaltime
 # Textual imports.
 from textual import on, work
 from textual.app import ComposeResult
+from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
+from textual.css.query import NoMatches
 from textual.screen import ModalScreen
 from textual.widget import Widget
 from textual.widgets import Button, Footer, Label
@@ -16,7 +22,8 @@ from textual.widgets import Button, Footer, Label
 ##############################################################################
 # Local imports.
 from ...hn import HN
-from ...hn.item import Article, Comment, Poll, PollOption
+from ...hn.item import Article, Comment, Loader, Poll, PollOption
+from ..data import load_configuration, load_seen, save_seen
 from ..widgets import ArticleText, CommentCard, CommentCardWithReplies
 
 
@@ -103,20 +110,41 @@ class Comments(ModalScreen[None]):
     }
     """
 
-    BINDINGS = [("escape", "close")]
+    BINDINGS = [
+        ("escape", "close"),
+        Binding("ctrl+r", "refresh", "Refresh"),
+        Binding("n", "unseen(1)", "Next New"),
+        Binding("N", "unseen(-1)", "Prev New", key_display="Sh+N"),
+    ]
 
-    def __init__(self, client: HN, article: Article) -> None:
+    def __init__(
+        self, client: HN, article: Article, path: list[Comment] | None = None
+    ) -> None:
         """Initialise the comments screen.
 
         Args:
             client: The HackerNews client object.
             article: The article to show the comments for.
+            path: The comments leading down to a comment to open the thread
+                up to, top-level comment first.
         """
         super().__init__()
         self._hn = client
         """The HackerNews client object."""
         self._article = article
         """The article to show the comments for."""
+        self._path = path or []
+        """The comments leading down to a comment to open the thread up to."""
+        self._page_size = load_configuration().comments_page_size
+        """The number of top-level comments to load at a time."""
+        self._top_level_loaded: set[int] = set()
+        """The IDs of the top-level comments that have been loaded."""
+        self._paging = False
+        """Are we in the middle of loading a page of top-level comments?"""
+        self._prefetch_commenters = load_configuration().prefetch_commenters
+        """Should the details of the authors of comments be loaded in the background?"""
+        self._commenters: set[str] = set()
+        """The authors whose details have been asked for."""
 
     def compose(self) -> ComposeResult:
         """Compose the comments screen."""
@@ -124,12 +152,7 @@ class Comments(ModalScreen[None]):
             dialog.border_title = f"Comments for article #{self._article.item_id}"
             with Vertical(id="info"):
                 yield Label(self._article.title, markup=False)
-                yield Label(
-                    f"{intcomma(self._article.score)} "
-                    f"point{'' if self._article.score == 1 else 's'} "
-                    f"by {self._article.by} {naturaltime(self._article.time)}, "
-                    f"{intcomma(self._article.descendants)} comment{'' if self._article.descendants == 1 else 's'}",
-                )
+                yield Label(self._article_info, id="article-info")
             with VerticalScroll() as body:
                 body.can_focus = False
                 if self._article.has_text:
@@ -141,7 +164,30 @@ class Comments(ModalScreen[None]):
                 yield Button("Okay [dim]\\[Esc][/]", id="close")
         yield Footer()
 
-    @work
+    @property
+    def _article_info(self) -> str:
+        """The information about the article."""
+        return (
+            f"{intcomma(self._article.score)} "
+            f"point{'' if self._article.score == 1 else 's'} "
+            f"by {self._article.by} {naturaltime(self._article.time)}, "
+            f"{intcomma(self._article.descendants)} comment{'' if self._article.descendants == 1 else 's'}"
+        )
+
+    def _comment_card(self, parent: Article | Comment, comment: Comment) -> CommentCard:
+        """Make the card for a comment.
+
+        Args:
+            parent: The parent of the comment.
+            comment: The comment.
+
+        Returns:
+            The card for the comment.
+        """
+        return (CommentCardWithReplies if comment.kids else CommentCard)(
+            self._hn, parent, comment
+        )
+
     async def _load_comments(self, within: Widget, item: Article | Comment) -> None:
         """Load the given list of comments into the display.
 
@@ -149,16 +195,180 @@ class Comments(ModalScreen[None]):
             within: The container to load the comments into.
             item: The item to load the comments for.
         """
+        try:
+            comments = await self._hn.comments(item)
+        except HN.RequestError as error:
+            self._load_failed(error, "the replies")
+            return
         await within.mount_all(
-            (CommentCardWithReplies if comment.kids else CommentCard)(
-                self._hn, item, comment
+            self._comment_card(item, comment) for comment in comments
+        )
+        self._load_commenters(comments)
+
+    @work(group="commenters")
+    async def _load_commenters(self, comments: list[Comment]) -> None:
+        """Load the details of the authors of some comments, in the background.
+
+        Args:
+            comments: The comments whose authors should be loaded.
+
+        Note:
+            The details are loaded at the lowest priority, and each author
+            is only asked for once, however many comments they've made.
+            Once loaded, the author's karma is shown against their comments,
+            and viewing their details needs no further call to the API.
+        """
+        if not self._prefetch_commenters:
+            return
+        authors = {comment.by for comment in comments if comment.by} - self._commenters
+        if not authors:
+            return
+        self._commenters |= authors
+        try:
+            known = {user.user_id for user in await self._hn.users(authors)}
+        except HN.RequestError:
+            # This was only ever speculative, so don't make a fuss; just
+            # allow another go later on.
+            self._commenters -= authors
+            return
+        for card in self.query(CommentCard):
+            if card.comment.by in known:
+                card.refresh_byline()
+
+    def _load_failed(self, error: HN.RequestError, loading: str) -> None:
+        """Report a failure to load something.
+
+        Args:
+            error: The error that caused the failure.
+            loading: A description of what was being loaded.
+        """
+        if isinstance(error, HN.Disconnected):
+            # The user already knows HackerNews can't be reached, so just
+            # quietly remind them.
+            self.notify(
+                f"HackerNews can't be reached, so {loading} can't be loaded right now.",
+                severity="warning",
+            )
+        else:
+            self.app.bell()
+            self.notify(
+                str(error),
+                title=f"Error loading {loading}",
+                timeout=8,
+                severity="error",
+            )
+
+    def _show_comment_count(self, offline: bool = False) -> None:
+        """Show the count of loaded top-level comments.
+
+        Args:
+            offline: Is HackerNews unreachable?
+        """
+        total = len(self._article.kids)
+        self.query_one(Vertical).border_subtitle = (
+            (
+                f"{intcomma(len(self._top_level_loaded))} of {intcomma(total)} "
+                f"top-level comment{'' if total == 1 else 's'}"
+                f"{' (offline)' if offline else ''}"
             )
-            for comment in await self._hn.comments(item)
+            if total
+            else ""
         )
 
+    @property
+    def _top_level_to_load(self) -> list[int]:
+        """The IDs of the top-level comments still to be loaded, in order."""
+        return [kid for kid in self._article.kids if kid not in self._top_level_loaded]
+
+    @property
+    def _more_to_load(self) -> bool:
+        """Are there more top-level comments to load?"""
+        return bool(self._top_level_to_load)
+
+    async def _load_page(self, count: int | None = None) -> None:
+        """Load the next page of top-level comments.
+
+        Args:
+            count: The number of comments to load; defaults to a page.
+        """
+        try:
+            page = self._top_level_to_load[: count or self._page_size]
+            comments = await self._hn.items(Comment, page)
+            await self.query_one(VerticalScroll).mount_all(
+                self._comment_card(self._article, comment) for comment in comments
+            )
+            self._top_level_loaded.update(page)
+            self._load_commenters(comments)
+            self._show_comment_count()
+        except HN.Disconnected:
+            # Paging is prompted by scrolling, so rather than complain every
+            # time the user scrolls, just show why we've stopped.
+            self._show_comment_count(offline=True)
+            return
+        except HN.RequestError as error:
+            self._load_failed(error, "the comments")
+            return
+        finally:
+            self._paging = False
+        # If the page we just loaded didn't fill the display there'll be no
+        # scrolling to prompt the next load; so check again once the display
+        # has settled.
+        self.call_after_refresh(self._maybe_load_next_page)
+
+    @work
+    async def _load_next_page(self) -> None:
+        """Load the next page of top-level comments in the background."""
+        await self._load_page()
+
+    def _maybe_load_next_page(self) -> None:
+        """Load the next page of top-level comments if the user is near the end."""
+        if self._paging or not self._more_to_load:
+            return
+        body = self.query_one(VerticalScroll)
+        if body.scroll_y >= body.max_scroll_y - body.size.height:
+            self._paging = True
+            self._load_next_page()
+
+    @work
+    async def _open_thread(self) -> None:
+        """Open the thread up, down the path to the comment to show."""
+        if (top_level := self._path[0].item_id) in self._article.kids:
+            # Load the top-level comments down as far as the one we want;
+            # paging carries on from there as normal.
+            self._paging = True
+            await self._load_page(self._article.kids.index(top_level) + 1)
+        else:
+            # The comment can't be found amongst the top-level comments, so
+            # there's nothing to open up; but the comments should still be
+            # shown, as they would be normally.
+            self._maybe_load_next_page()
+        for comment in self._path[:-1]:
+            try:
+                card = self.query_one(
+                    f"#comment-{comment.item_id}", CommentCardWithReplies
+                )
+            except NoMatches:
+                break
+            if not card.replies_loaded:
+                await self._load_comments(card.expand_replies(), card.comment)
+        try:
+            target = self.query_one(f"#comment-{self._path[-1].item_id}", CommentCard)
+        except NoMatches:
+            self.notify(
+                f"Comment #{self._path[-1].item_id} could not be found in the thread",
+                severity="warning",
+            )
+            return
+        target.focus()
+        self.call_after_refresh(target.scroll_visible, top=True)
+
     @work
     async def _load_poll_options(self, poll: Poll) -> None:
-        options = await self._hn.poll_options(poll)
+        try:
+            options = await self._hn.poll_options(poll)
+        except HN.RequestError as error:
+            self._load_failed(error, "the poll options")
+            return
         self.notify(str(len(options)))
         self.query_one("#poll-options").mount_all(
             [PollOptionDisplay(option) for option in options]
@@ -166,25 +376,217 @@ class Comments(ModalScreen[None]):
 
     async def on_mount(self) -> None:
         """Start the comment loading process once the DOM is ready."""
+        load_seen().visited(self._article)
         if isinstance(self._article, Poll):
             self._load_poll_options(self._article)
         if self._article.kids:
             await self.query_one("#no-comments").remove()
-            self._load_comments(self.query_one(VerticalScroll), self._article)
+            self._show_comment_count()
+            if self._path:
+                self._open_thread()
+            else:
+                self._maybe_load_next_page()
+            self.watch(
+                self.query_one(VerticalScroll),
+                "scroll_y",
+                self._maybe_load_next_page,
+                init=False,
+            )
 
     @on(Button.Pressed, "#close")
     def action_close(self) -> None:
         """Close the dialog screen."""
+        # Don't leave any loading of comments running on behalf of a screen
+        # that's going away.
+        self.workers.cancel_node(self)
+        save_seen(load_seen())
         self.dismiss(None)
 
+    def action_unseen(self, direction: int) -> None:
+        """Move to the next comment that hasn't been seen.
+
+        Args:
+            direction: The direction to move in.
+
+        Note:
+            Only the comments that are on display are considered.
+        """
+        cards = [
+            card
+            for card in self.query(CommentCard)
+            if all(node.display for node in card.ancestors_with_self)
+        ]
+        try:
+            current = cards.index(self.focused)  # type: ignore[arg-type]
+        except ValueError:
+            current = -1 if direction > 0 else len(cards)
+        candidates = cards[current + 1 :] if direction > 0 else cards[:current][::-1]
+        for card in candidates:
+            if card.has_class("unseen"):
+                card.focus()
+                card.scroll_visible(top=True)
+                return
+        self.notify("No more new comments", severity="warning")
+
+    async def _merge(
+        self,
+        within: Widget,
+        old: Article | Comment,
+        new: Article | Comment,
+        loaded: set[int] | None = None,
+    ) -> int:
+        """Merge any new replies to an item into the display.
+
+        Args:
+            within: The container that holds the replies to the item.
+            old: The version of the item that's on display.
+            new: The fresh version of the item.
+            loaded: The IDs of the replies that have been loaded, if not all
+                of them have been.
+
+        Returns:
+            The number of new replies that were added to the display.
+
+        Note:
+            Only the replies that weren't there before are fetched. Each is
+            placed just before the loaded reply that follows it. If only
+            some of the replies have been loaded, any new reply that comes
+            after the last of them is left to be loaded with the rest.
+        """
+        known = set(old.kids)
+        loaded = known if loaded is None else loaded
+        placed: list[tuple[int, int | None]] = []
+        following: int | None = None
+        for kid in reversed(new.kids):
+            if kid in loaded:
+                following = kid
+            elif kid not in known and (following is not None or loaded is known):
+                placed.append((kid, following))
+        if not placed:
+            return 0
+        placed.reverse()
+        replies = await self._hn.items(Comment, [kid for kid, _ in placed])
+        for (_, before), reply in zip(placed, replies):
+            await within.mount(
+                self._comment_card(new, reply),
+                before=None
+                if before is None
+                else within.get_child_by_id(f"comment-{before}"),
+            )
+        if loaded is not known:
+            loaded.update(kid for kid, _ in placed)
+        self._load_commenters(replies)
+        return len(placed)
+
+    @staticmethod
+    def _on_display(card: CommentCard) -> bool:
+        """Is the given comment card on display?
+
+        Args:
+            card: The card to check.
+
+        Returns:
+            `True` if the card isn't within replies that are collapsed.
+        """
+        return all(node.display for node in card.ancestors if isinstance(node, Widget))
+
+    async def _grew_replies(self, card: CommentCard, comment: Comment) -> int:
+        """Swap a card with no replies for one with them, if it's gained some.
+
+        Args:
+            card: The card that had no replies.
+            comment: The fresh version of its comment.
+
+        Returns:
+            The number of replies the comment has gained.
+        """
+        if not comment.kids or not isinstance(card.parent, Widget):
+            return 0
+        within = card.parent
+        position = within.children.index(card)
+        had_focus = card.has_focus
+        replacement = CommentCardWithReplies(self._hn, card.parent_item, comment)
+        await card.remove()
+        await within.mount(replacement, before=position)
+        if had_focus:
+            replacement.focus()
+        return len(comment.kids)
+
+    @work(exclusive=True, group="refresh")
+    async def action_refresh(self) -> None:
+        """Refresh the comments, adding any new ones in place.
+
+        Note:
+            The article, each comment whose replies are on display, and each
+            comment on display that has no replies, is fetched again; then
+            only the comments that are new are fetched. A comment that has
+            gained its first replies has its card swapped for one that can
+            show them; otherwise nothing that's already on display is
+            rebuilt, so where the focus is, and which replies are on
+            display, stays the same.
+        """
+        expanded = [
+            card for card in self.query(CommentCardWithReplies) if card.replies_loaded
+        ]
+        leaves = [
+            card
+            for card in self.query(CommentCard)
+            if not isinstance(card, CommentCardWithReplies)
+            and not card.comment.deleted
+            and self._on_display(card)
+        ]
+        self.query_one(Vertical).border_subtitle = "Refreshing..."
+        try:
+            article, *comments = [
+                Loader.load(data) if data else None
+                for data in await gather(
+                    self._hn.data(f"item/{self._article.item_id}.json", 0),
+                    *[
+                        self._hn.data(f"item/{card.comment.item_id}.json", 0)
+                        for card in (*expanded, *leaves)
+                    ],
+                )
+            ]
+            added = 0
+            if isinstance(article, Article):
+                added += await self._merge(
+                    self.query_one(VerticalScroll),
+                    self._article,
+                    article,
+                    self._top_level_loaded,
+                )
+                self._article = article
+                self.query_one("#article-info", Label).update(self._article_info)
+            for card, comment in zip(expanded, comments):
+                if isinstance(comment, Comment):
+                    added += await self._merge(
+                        card.get_child_by_id("replies"), card.comment, comment
+                    )
+                    card.refreshed(comment)
+            for leaf, comment in zip(leaves, comments[len(expanded) :]):
+                if isinstance(comment, Comment):
+                    added += await self._grew_replies(leaf, comment)
+        except HN.RequestError as error:
+            self._load_failed(error, "the latest comments")
+            return
+        finally:
+            self._show_comment_count()
+        self.notify(
+            f"{intcomma(added)} new comment{'' if added == 1 else 's'}"
+            if added
+            else "No new comments"
+        )
+        self._maybe_load_next_page()
+
     @on(CommentCardWithReplies.LoadReplies)
-    def load_replies(self, event: CommentCardWithReplies.LoadReplies) -> None:
+    @work
+    async def load_replies(self, event: CommentCardWithReplies.LoadReplies) -> None:
         """Load the replies for a comment.
 
         Args:
             event: The event to handle.
         """
-        self._load_comments(event.load_into, event.comment)
+        await self._load_comments(event.load_into, event.comment)
 
 
 ### comments.py ends here
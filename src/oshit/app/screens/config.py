@@ -137,6 +137,14 @@ class ConfigurationDialog(ModalScreen[None]):
                         type="integer",
                         validators=[Number(minimum=1, maximum=200)],
                     )
+                with Vertical():
+                    yield Label("Comments Page Size:")
+                    yield Input(
+                        str(config.comments_page_size),
+                        id="comments-page",
+                        type="integer",
+                        validators=[Number(minimum=1, maximum=500)],
+                    )
             yield Checkbox("Load other tabs in background", config.background_load_tabs)
             with Horizontal():
                 yield Button("OK [dim]\\[F2][/]", id="ok")
@@ -163,6 +171,9 @@ class ConfigurationDialog(ModalScreen[None]):
             config.maximum_ask = int(self.query_one("#max-ask", Input).value)
             config.maximum_show = int(self.query_one("#max-show", Input).value)
             config.maximum_jobs = int(self.query_one("#max-jobs", Input).value)
+            config.comments_page_size = int(
+                self.query_one("#comments-page", Input).value
+            )
             config.background_load_tabs = self.query_one(Checkbox).value
             save_configuration(config)
             self.dismiss(None)
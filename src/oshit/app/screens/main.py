@@ -13,25 +13,28 @@ from textual.css.query import NoMatches
 from textual.screen import Screen
 from textual.timer import Timer
 from textual.widgets import Footer, Header
+from textual.worker import Worker
 
 ##############################################################################
 # Local imports.
 from ... import __version__
-from ...hn import HN
-from ...hn.item.article import Article
+from ...hn import HN, CacheWarmer, Priority
+from ...hn.item import Article, Item, Job, Story
+from ...startup import Startup
 from ..commands import ShowComments, ShowUser
+from ..data import load_seen, load_watchlist, save_seen, save_watchlist
 from ..data.config import load_configuration
-from ..widgets import HackerNews, Items
-from .comments import Comments
-from .config import ConfigurationDialog
-from .help import Help
-from .search import Search
-from .user import UserDetails
+from ..widgets import Firehose, HackerNews, Items, StoryList
 
 
 ##############################################################################
 class Main(Screen[None]):
-    """The main screen of the application."""
+    """The main screen of the application.
+
+    Note:
+        The screens that are opened from the main screen are imported only
+        when they're first needed, to keep the startup time down.
+    """
 
     CONTEXT_HELP = """
     ## Application keys
@@ -45,12 +48,14 @@ class Main(Screen[None]):
     | <kbd>F5</kbd> | Toggle showing age of data. |
     | <kbd>F12</kbd> | Quit the application. |
     | <kbd>/</kbd> | Search* and open tab with results. |
+    | <kbd>o</kbd> | Open any item, by its ID or a link to it. |
     | <kbd>t</kbd> | View the top stories. |
     | <kbd>n</kbd> | View the new stories. |
     | <kbd>b</kbd> | View the best stories. |
     | <kbd>a</kbd> | View the AskHN stories. |
     | <kbd>s</kbd> | View the ShowHN stories. |
     | <kbd>j</kbd> | View the jobs. |
+    | <kbd>f</kbd> | View the firehose of every new item. |
 
     \\* Note that the search only looks at already-downloaded items.
     """
@@ -71,45 +76,99 @@ class Main(Screen[None]):
         Binding("a", "go('ask')"),
         Binding("s", "go('show')"),
         Binding("j", "go('jobs')"),
+        Binding("f", "go('firehose')"),
         Binding("r", "go('search')"),
         Binding("/", "local_search"),
+        Binding("o", "open_item"),
     ]
 
-    def __init__(self) -> None:
-        """Initialise the screen."""
+    def __init__(self, startup: Startup) -> None:
+        """Initialise the screen.
+
+        Args:
+            startup: The details of the startup of the application.
+        """
         super().__init__()
+        self._startup = startup
+        """The details of the startup of the application."""
         config = load_configuration()
-        self._hn = HN(
+        self._hn = startup.client or HN(
             max_concurrency=config.maximum_concurrency,
             timeout=config.connection_timeout,
+            cache_ttl=config.item_cache_ttl,
+            user_cache_ttl=config.user_cache_ttl,
+            base_urls=config.api_base_urls,
         )
         """The HackerNews client object."""
         self._title_interval: Timer | None = None
+        self._warmer = CacheWarmer(self._hn, config.idle_prefetch_budget)
+        """Warms the cache with comments while the application is idle."""
+        self._idle: Timer | None = None
+        """The timer that goes off when the application has been idle for a while."""
+        self._warmed = False
+        """Has the cache been warmed since the last input?"""
+        self._prefetching: Worker[None] | None = None
+        """The worker prefetching comments, if there is one."""
 
     def compose(self) -> ComposeResult:
         """Compose the main screen's layout."""
         yield Header()
         with HackerNews():
             config = load_configuration()
-            yield Items("top", "t", partial(self._hn.top_stories, config.maximum_top))
-            yield Items("new", "n", partial(self._hn.new_stories, config.maximum_new))
-            yield Items(
-                "best", "b", partial(self._hn.best_stories, config.maximum_best)
+            yield StoryList(
+                "top",
+                "t",
+                self._hn,
+                Article,
+                partial(self._hn.top_story_ids, config.maximum_top),
+                self._startup.take_top_stories(),
+            )
+            yield StoryList(
+                "new",
+                "n",
+                self._hn,
+                Article,
+                partial(self._hn.new_story_ids, config.maximum_new),
             )
-            yield Items(
-                "ask", "a", partial(self._hn.latest_ask_stories, config.maximum_ask)
+            yield StoryList(
+                "best",
+                "b",
+                self._hn,
+                Article,
+                partial(self._hn.best_story_ids, config.maximum_best),
             )
-            yield Items(
-                "show", "s", partial(self._hn.latest_show_stories, config.maximum_show)
+            yield StoryList(
+                "ask",
+                "a",
+                self._hn,
+                Story,
+                partial(self._hn.latest_ask_story_ids, config.maximum_ask),
             )
-            yield Items(
-                "jobs", "j", partial(self._hn.latest_job_stories, config.maximum_jobs)
+            yield StoryList(
+                "show",
+                "s",
+                self._hn,
+                Story,
+                partial(self._hn.latest_show_story_ids, config.maximum_show),
             )
+            yield StoryList(
+                "jobs",
+                "j",
+                self._hn,
+                Job,
+                partial(self._hn.latest_job_story_ids, config.maximum_jobs),
+            )
+            if not self._hn.offline:
+                # There's nothing new to be found in an offline bundle.
+                yield Firehose(
+                    "f", self._hn, config.firehose_size, config.firehose_interval
+                )
         yield Footer()
 
     @on(HackerNews.TabActivated)
     @on(Items.Loading)
     @on(Items.Loaded)
+    @on(Items.Rearranged)
     def _refresh_subtitle(self) -> None:
         """Refresh the subtitle of the screen."""
         try:
@@ -122,6 +181,17 @@ class Main(Screen[None]):
             # that doesn't exist any more. This guards against that.
             pass
 
+    @on(Items.Loaded)
+    def _note_first_story(self) -> None:
+        """Note when the first story has been shown."""
+        if self._startup.first_story is None:
+            try:
+                loaded = self.query_one(HackerNews).active_items.loaded
+            except NoMatches:
+                return
+            if loaded:
+                self.call_after_refresh(self._startup.story_shown)
+
     def _set_title_refresh(self, refresh: bool) -> None:
         """Set the state of the title refresh interval.
 
@@ -139,10 +209,119 @@ class Main(Screen[None]):
 
     def on_mount(self) -> None:
         """Configure things once the DOM is ready."""
+        self._startup.mark("main screen mounted")
+        if self._hn.offline:
+            self.title = f"{self.TITLE} (offline)"
+        self._hn.watch_connection(self._connection_changed)
+        if not self._hn.offline:
+            self.set_interval(
+                load_configuration().watchlist_interval, self._check_watchlist
+            )
+            self._check_watchlist(everything=True)
+            if (idle_after := load_configuration().idle_prefetch_after) > 0:
+                self._watch_for_idleness(idle_after)
         self._set_title_refresh(load_configuration().show_data_age)
 
+    @work(exclusive=True, group="watchlist")
+    async def _check_watchlist(self, everything: bool = False) -> None:
+        """Check the watchlist, and report on anything new.
+
+        Args:
+            everything: Check everything on the watchlist?
+        """
+        watchlist = load_watchlist()
+        try:
+            changes = await watchlist.check(self._hn, everything)
+        except HN.RequestError:
+            # It'll be checked again soon enough.
+            return
+        if watchlist.items or watchlist.users:
+            save_watchlist(watchlist)
+        for change in changes:
+            self.notify(change, title="Watchlist", timeout=10)
+
+    def _watch_for_idleness(self, idle_after: float) -> None:
+        """Start watching for the application being idle.
+
+        Args:
+            idle_after: The time (in seconds) without input after which the
+                application is idle.
+        """
+        from ..oshit import OSHit
+
+        if isinstance(self.app, OSHit):
+            self._idle = self.set_interval(idle_after, self._prefetch_when_idle)
+            self.app.input_signal.subscribe(self, self._input_seen, immediate=True)
+
+    def _input_seen(self, _: None) -> None:
+        """Stop any prefetching when there's input, and wait to be idle again."""
+        if self._prefetching is not None:
+            self._prefetching.cancel()
+            self._prefetching = None
+        self._warmed = False
+        if self._idle is not None:
+            self._idle.reset()
+
+    def _prefetch_when_idle(self) -> None:
+        """Start prefetching comments, now that the application is idle.
+
+        Note:
+            The cache is only warmed the once for each time the application
+            goes idle; anything warmed would have gone stale by the time it
+            could be warmed again, so an application left alone would
+            otherwise spend its whole budget on the API forever.
+        """
+        if (
+            self._hn.connected
+            and not self._warmed
+            and (self._prefetching is None or self._prefetching.is_finished)
+        ):
+            self._warmed = True
+            self._prefetching = self._prefetch()
+
+    @work(group="prefetch")
+    async def _prefetch(self) -> None:
+        """Prefetch the comments of the top stories in the current tab.
+
+        Note:
+            This is done once each time the application goes idle, and is
+            stopped as soon as there's any input. Anything prefetched by
+            then stays in the cache.
+        """
+        await self._warmer.warm(
+            [
+                item
+                for item in self.query_one(HackerNews).active_items.items
+                if isinstance(item, Article)
+            ][: load_configuration().idle_prefetch_stories]
+        )
+
+    def _connection_changed(self, connected: bool) -> None:
+        """React to HackerNews becoming reachable, or unreachable.
+
+        Args:
+            connected: Can HackerNews be reached?
+        """
+        try:
+            self.query_one(HackerNews).disconnected = not connected
+        except NoMatches:
+            # We're on the way out.
+            return
+        if connected:
+            self.notify("HackerNews can be reached again", title="Back online")
+        else:
+            self.notify(
+                "HackerNews can't be reached; cached data will be shown until it can.",
+                title="Offline",
+                severity="warning",
+                timeout=8,
+            )
+        self._refresh_subtitle()
+
     def action_help(self) -> None:
         """Show the help screen."""
+        from .help import Help
+
         self.app.push_screen(Help(self))
 
     def action_go(self, items: str) -> None:
@@ -175,8 +354,16 @@ class Main(Screen[None]):
         news.show_age = not news.show_age
         self._set_title_refresh(news.show_age)
 
-    async def _search(self, search_text: str) -> list[Article]:
-        hits: dict[int, Article] = {}
+    async def _search(self, search_text: str, _: Priority) -> list[Item]:
+        """Search the loaded items for the given text.
+
+        Args:
+            search_text: The text to search for.
+
+        Returns:
+            The items that match the search text.
+        """
+        hits: dict[int, Item] = {}
         for item_list in self.query(Items).results():
             for item in item_list.items:
                 if search_text in item:
@@ -186,6 +373,8 @@ class Main(Screen[None]):
     @work
     async def action_local_search(self) -> None:
         """Perform a local search."""
+        from .search import Search
+
         if search_text := await self.app.push_screen_wait(Search()):
             await self.query_one(HackerNews).remove_pane("search")
             await self.query_one(HackerNews).add_pane(
@@ -193,19 +382,65 @@ class Main(Screen[None]):
             )
             self.query_one(HackerNews).active = "search"
 
+    @work
+    async def action_open_item(self) -> None:
+        """Open any item, by its ID, in the thread it belongs to."""
+        from .open_item import OpenItem
+
+        if (item_id := await self.app.push_screen_wait(OpenItem())) is None:
+            return
+        self.notify(f"Finding the thread for #{item_id}...")
+        try:
+            article, path = await self._hn.thread(item_id)
+        except (HN.NoSuchItem, ValueError) as error:
+            self.app.bell()
+            self.notify(str(error), title=f"Can't open #{item_id}", severity="error")
+        except HN.RequestError as error:
+            self.app.bell()
+            self.notify(
+                str(error),
+                title=f"Error loading #{item_id}",
+                timeout=8,
+                severity="error",
+            )
+        else:
+            self.post_message(ShowComments(article, path))
+
     def action_config(self) -> None:
         """Show the configuration dialog."""
+        from .config import ConfigurationDialog
+
         self.app.push_screen(ConfigurationDialog())
 
     @on(ShowUser)
     def show_user(self, event: ShowUser) -> None:
         """Handle a request to show the details of a user."""
+        from .user import UserDetails
+
         self.app.push_screen(UserDetails(self._hn, event.user))
 
     @on(ShowComments)
     def show_comments(self, event: ShowComments) -> None:
         """Handle a request to show the comments for an article."""
-        self.app.push_screen(Comments(self._hn, event.article))
+        from .comments import Comments
+
+        self.app.push_screen(
+            Comments(self._hn, event.article, event.path),
+            lambda _: self._comments_closed(event.article),
+        )
+
+    def _comments_closed(self, article: Article) -> None:
+        """Refresh an article in the lists once its comments have been read.
+
+        Args:
+            article: The article whose comments were being read.
+        """
+        for items in self.query(Items).results():
+            items.refresh_item(article.item_id)
+
+    def on_unmount(self) -> None:
+        """Save what has been read for the next session."""
+        save_seen(load_seen())
 
 
 ### main.py ends here
@@ -0,0 +1,79 @@
+"""Provides a dialog for prompting for an item to open."""
+
+##############################################################################
+# Backward compatibility
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from urllib.parse import parse_qs, urlparse
+
+##############################################################################
+# Textual imports.
+from textual import on
+from textual.app import ComposeResult
+from textual.screen import ModalScreen
+from textual.widgets import Input
+
+
+##############################################################################
+def item_id_from(text: str) -> int | None:
+    """Get an item ID from some text.
+
+    Args:
+        text: The text to get the item ID from.
+
+    Returns:
+        The item ID, or `None` if there isn't one.
+
+    Note:
+        The text can be the ID itself, or a link to the item on
+        HackerNews (`https://news.ycombinator.com/item?id=...`).
+    """
+    if (text := text.strip().lstrip("#")).isdigit():
+        return int(text)
+    if (ids := parse_qs(urlparse(text).query).get("id")) and ids[0].isdigit():
+        return int(ids[0])
+    return None
+
+
+##############################################################################
+class OpenItem(ModalScreen[int | None]):
+    """A modal dialog for getting the ID of an item to open."""
+
+    DEFAULT_CSS = """
+    OpenItem {
+        align: center middle;
+    }
+
+    OpenItem Input, OpenItem Input:focus {
+        border: round $accent;
+        width: 60%;
+        padding: 1;
+        height: auto;
+    }
+    """
+
+    BINDINGS = [("escape", "escape")]
+
+    def compose(self) -> ComposeResult:
+        """Compose the content of the screen."""
+        yield Input(
+            placeholder="Enter the ID of an item, or a link to it on HackerNews"
+        )
+
+    @on(Input.Submitted)
+    def open_item(self) -> None:
+        """Open the item."""
+        if (item_id := item_id_from(self.query_one(Input).value)) is None:
+            self.app.bell()
+            self.notify("That isn't an item ID or a link to an item", severity="error")
+        else:
+            self.dismiss(item_id)
+
+    def action_escape(self) -> None:
+        """Escape out without opening anything."""
+        self.dismiss(None)
+
+
+### open_item.py ends here
@@ -0,0 +1,277 @@
+"""Provides a modal screen for browsing the submissions of a user."""
+
+##############################################################################
+# Python imports.
+from webbrowser import open as open_url
+
+##############################################################################
+# Humanize imports.
+from humanize import intcomma
+
+##############################################################################
+# Textual imports.
+from textual import on, work
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Footer
+
+##############################################################################
+# Local imports.
+from ...hn import HN
+from ...hn.item import Article, Comment, Item
+from ...hn.user import User
+from ..commands import ShowComments, ShowUser
+from ..data import load_configuration
+from ..widgets.items import ArticleList, HackerNewsArticle
+
+
+##############################################################################
+class Submissions(ModalScreen[None]):
+    """Modal dialog for browsing the submissions of a user.
+
+    A prolific user can have tens of thousands of submissions, so they're
+    loaded a page at a time, with further pages being loaded as the list is
+    scrolled through. Every page that's been loaded is kept for as long as
+    the dialog is open, so changing what's shown never loads anything
+    again.
+    """
+
+    DEFAULT_CSS = """
+    Submissions {
+        align: center middle;
+
+        &> Vertical {
+            width: 90%;
+            height: 90%;
+            background: $panel;
+            border: panel $primary;
+            border-title-color: $accent;
+        }
+
+        ArticleList {
+            height: 1fr;
+            border: none;
+            padding: 0;
+
+            & > .option-list--option {
+                padding: 0 1 0 0;
+            }
+
+            &:focus {
+                border: none;
+            }
+        }
+    }
+    """
+
+    BINDINGS = [
+        ("escape", "close"),
+        Binding("f", "filter", "Filter"),
+        Binding("m", "more", "Load More"),
+    ]
+
+    PAGE_SIZE = 30
+    """The number of submissions to load at a time."""
+
+    FOLLOW_ON_PAGES = 3
+    """The most pages to load in a row to try and fill the display."""
+
+    FILTERS: tuple[tuple[str, type[Item]], ...] = (
+        ("everything", Item),
+        ("stories", Article),
+        ("comments", Comment),
+    )
+    """The ways the submissions can be filtered, and the type of item shown by each."""
+
+    def __init__(self, client: HN, user: User) -> None:
+        """Initialise the submissions dialog.
+
+        Args:
+            client: The HackerNews client object.
+            user: The user whose submissions should be shown.
+        """
+        super().__init__()
+        self._hn = client
+        """The HackerNews client object."""
+        self._user = user
+        """The user whose submissions are being shown."""
+        self._compact = load_configuration().compact_mode
+        """Should the submissions be shown in compact form?"""
+        self._items: list[Item] = []
+        """The submissions that have been loaded, newest first."""
+        self._fetched = 0
+        """The number of the user's submissions that have been looked at."""
+        self._filter = 0
+        """The index of the filter in use."""
+        self._paging = False
+        """Are we in the middle of loading a page of submissions?"""
+        self._follow_ons = 0
+        """The number of pages loaded in a row to try and fill the display."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the submissions dialog."""
+        with Vertical() as dialog:
+            dialog.border_title = f"Submissions by {self._user.user_id}"
+            yield ArticleList()
+        yield Footer()
+
+    @property
+    def _shows(self) -> type[Item]:
+        """The type of item being shown."""
+        return self.FILTERS[self._filter][1]
+
+    @property
+    def _held_back(self) -> bool:
+        """Has loading stopped before the display was filled?"""
+        return self._follow_ons >= self.FOLLOW_ON_PAGES and self._fetched < len(
+            self._user.submitted
+        )
+
+    def _show_progress(self) -> None:
+        """Show what's being shown, and how much has been loaded."""
+        self.query_one(Vertical).border_subtitle = (
+            f"Showing {self.FILTERS[self._filter][0]}; "
+            f"{intcomma(self._fetched)} of {intcomma(len(self._user.submitted))} loaded"
+            f"{'; press m to load more' if self._held_back else ''}"
+        )
+
+    def _show(self, items: list[Item]) -> None:
+        """Add some submissions to the display.
+
+        Args:
+            items: The submissions to add.
+
+        Note:
+            Only the submissions that pass the current filter are added.
+        """
+        self.query_one(ArticleList).add_options(
+            HackerNewsArticle(item, self._compact)
+            for item in items
+            if isinstance(item, self._shows)
+        )
+
+    @work
+    async def _load_next_page(self) -> None:
+        """Load the next page of submissions."""
+        page = self._user.submitted[self._fetched : self._fetched + self.PAGE_SIZE]
+        try:
+            items = [
+                item for item in await self._hn.items(Item, page) if item.looks_valid
+            ]
+        except HN.RequestError as error:
+            self.notify(
+                str(error),
+                title="Error loading submissions",
+                timeout=8,
+                severity="error",
+            )
+            return
+        finally:
+            self._paging = False
+        self._fetched += len(page)
+        self._items.extend(items)
+        self._show(items)
+        self._show_progress()
+        # If the page we just loaded didn't fill the display there'll be no
+        # scrolling to prompt the next load; so check again once the display
+        # has settled.
+        self.call_after_refresh(self._follow_on)
+
+    def _maybe_load_next_page(self) -> bool:
+        """Load the next page of submissions if the user is near the end.
+
+        Returns:
+            `True` if the next page is being loaded, `False` if not.
+        """
+        if self._paging or self._fetched >= len(self._user.submitted):
+            return False
+        display = self.query_one(ArticleList)
+        if display.scroll_y >= display.max_scroll_y - display.size.height:
+            self._paging = True
+            self._load_next_page()
+            return True
+        return False
+
+    def _scrolled(self) -> None:
+        """Load the next page of submissions if the user has scrolled near the end."""
+        if self._maybe_load_next_page():
+            self._follow_ons = 0
+
+    def _follow_on(self) -> None:
+        """Load the next page of submissions if the last didn't fill the display.
+
+        Note:
+            Only so many pages are loaded in a row like this; if what's being
+            shown is rare amongst the user's submissions (their stories, say,
+            amongst thousands of comments) there's no sense in going through
+            everything they've ever posted in the hope of filling the
+            display. The user can ask for more.
+        """
+        if self._follow_ons < self.FOLLOW_ON_PAGES and self._maybe_load_next_page():
+            self._follow_ons += 1
+        self._show_progress()
+
+    def on_mount(self) -> None:
+        """Start loading the submissions once the DOM is ready."""
+        self._show_progress()
+        self._maybe_load_next_page()
+        self.watch(
+            self.query_one(ArticleList),
+            "scroll_y",
+            self._scrolled,
+            init=False,
+        )
+
+    def action_filter(self) -> None:
+        """Move on to the next way of filtering the submissions."""
+        self._filter = (self._filter + 1) % len(self.FILTERS)
+        display = self.query_one(ArticleList)
+        display.clear_options()
+        self._show(self._items)
+        display.highlighted = 0 if display.option_count else None
+        self._follow_ons = 0
+        self._show_progress()
+        self.call_after_refresh(self._follow_on)
+
+    def action_more(self) -> None:
+        """Load another page of submissions."""
+        if self._paging or self._fetched >= len(self._user.submitted):
+            self.app.bell()
+            return
+        self._follow_ons = 0
+        self._paging = True
+        self._load_next_page()
+
+    @on(ArticleList.OptionSelected)
+    def visit(self, event: ArticleList.OptionSelected) -> None:
+        """Visit the submission that was selected."""
+        assert isinstance(option := event.option, HackerNewsArticle)
+        open_url(option.article.visitable_url)
+
+    @on(ShowComments)
+    def show_comments(self, event: ShowComments) -> None:
+        """Handle a request to show the comments for an article."""
+        from .comments import Comments
+
+        event.stop()
+        self.app.push_screen(Comments(self._hn, event.article))
+
+    @on(ShowUser)
+    def show_user(self, event: ShowUser) -> None:
+        """Handle a request to show the details of a user."""
+        from .user import UserDetails
+
+        event.stop()
+        self.app.push_screen(UserDetails(self._hn, event.user))
+
+    def action_close(self) -> None:
+        """Close the dialog screen."""
+        # Don't leave any loading of submissions running on behalf of a
+        # screen that's going away.
+        self.workers.cancel_node(self)
+        self.dismiss(None)
+
+
+### submissions.py ends here
@@ -20,6 +20,7 @@ from textual.widgets import Button, Label
 # Local imports.
 from ...hn import HN
 from ...hn.user import User
+from ..data import load_watchlist, save_watchlist
 
 
 ##############################################################################
@@ -91,7 +92,12 @@ class UserDetails(ModalScreen[None]):
     }
     """
 
-    BINDINGS = [("space", "visit"), ("escape", "close")]
+    BINDINGS = [
+        ("space", "visit"),
+        ("s", "submissions"),
+        ("w", "watch"),
+        ("escape", "close"),
+    ]
 
     AUTO_FOCUS = "#close"
 
@@ -106,6 +112,8 @@ class UserDetails(ModalScreen[None]):
         self._hn = client
         self._user = User(user_id)
         self._user_id = user_id
+        self._loaded = False
+        """Have the details of the user been loaded?"""
 
     def compose(self) -> ComposeResult:
         """Compose the dialog."""
@@ -123,9 +131,19 @@ class UserDetails(ModalScreen[None]):
             yield Title("Submission count:")
             yield Data(id="submissions")
             with Horizontal():
+                yield Button("Submissions [dim]\\[s][/]", id="submissions")
+                yield Button(self._watch_label, id="watch")
                 yield Button("Visit [dim]\\[Space][/]", id="visit")
                 yield Button("Okay [dim]\\[Esc][/]", id="close")
 
+    @property
+    def _watch_label(self) -> str:
+        """The label for the watch button."""
+        return (
+            f"{'Unwatch' if load_watchlist().watching_user(self._user_id) else 'Watch'}"
+            " [dim]\\[w][/]"
+        )
+
     def _set(self, field: str, value: str) -> None:
         """Set the value of a field on the form.
 
@@ -141,6 +159,8 @@ class UserDetails(ModalScreen[None]):
         self.query_one(Vertical).border_subtitle = "Loading..."
         try:
             self._user = await self._hn.user(self._user_id)
+        except HN.Disconnected:
+            self._set("user-id", f"{self._user_id} [yellow italic](Offline)[/]")
         except HN.RequestError as error:
             self.app.bell()
             self.notify(
@@ -166,19 +186,46 @@ class UserDetails(ModalScreen[None]):
                 f"{naturaltime(self._user.created)} [dim]({self._user.created})[/]",
             )
             self._set("submissions", f"{intcomma(len(self._user.submitted))}")
+            self._loaded = True
             self.query(".about").set_class(not self._user.has_about, "hidden")
         finally:
             self.query_one(Vertical).border_subtitle = ""
 
     def on_mount(self) -> None:
         """Configure the dialog once the DOM is ready."""
-        self._load_user()
+        # The user's details may well be cached, and so be ready at once;
+        # so wait until the whole dialog is in place before loading them.
+        self.call_after_refresh(self._load_user)
 
     @on(Button.Pressed, "#close")
     def action_close(self) -> None:
         """Close the dialog screen."""
         self.dismiss(None)
 
+    @on(Button.Pressed, "#watch")
+    def action_watch(self) -> None:
+        """Toggle watching the user for new submissions."""
+        watchlist = load_watchlist()
+        watching = watchlist.toggle_user(
+            self._user_id, self._user.submitted if self._loaded else None
+        )
+        save_watchlist(watchlist)
+        self.query_one("#watch", Button).label = self._watch_label
+        self.notify(
+            f"{'Now' if watching else 'No longer'} watching {self._user_id} for new submissions",
+            title="Watchlist",
+        )
+
+    @on(Button.Pressed, "#submissions")
+    def action_submissions(self) -> None:
+        """Browse the user's submissions."""
+        from .submissions import Submissions
+
+        if self._loaded and self._user.submitted:
+            self.app.push_screen(Submissions(self._hn, self._user))
+        else:
+            self.app.bell()
+
     @on(Button.Pressed, "#visit")
     def action_visit(self) -> None:
         """Visit the page for the user."""
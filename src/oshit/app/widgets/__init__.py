@@ -4,8 +4,10 @@
 # Local imports.
 from .article_text import ArticleText
 from .comment_card import CommentCard, CommentCardWithReplies
+from .firehose import Firehose
 from .hacker_news import HackerNews
 from .items import Items
+from .story_list import StoryList
 
 ##############################################################################
 # Exports.
@@ -13,8 +15,10 @@ __all__ = [
     "ArticleText",
     "CommentCard",
     "CommentCardWithReplies",
+    "Firehose",
     "HackerNews",
     "Items",
+    "StoryList",
 ]
 
 ### __init__.py ends here
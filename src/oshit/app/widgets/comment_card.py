@@ -7,7 +7,7 @@ from webbrowser import open as open_url
 
 ##############################################################################
 # Humanize imports.
-from humanize import naturaltime
+from humanize import intcomma, naturaltime
 
 ##############################################################################
 # Textual imports.
@@ -25,8 +25,7 @@ from textual.widgets import Label
 # Local imports.
 from ...hn import HN
 from ...hn.item import Article, Comment
-from ..screens.links import Links
-from ..screens.user import UserDetails
+from ..data import load_seen, load_watchlist, save_watchlist
 
 
 ##############################################################################
@@ -50,6 +49,10 @@ class CommentCard(Vertical, can_focus=True):
             margin: 0 0 1 0;
         }
 
+        &.unseen {
+            border-left: $card-border $success;
+        }
+
         &:focus-within {
             border-left: $card-border $accent 50%;
             border-bottom: $card-border $accent 50%;
@@ -108,6 +111,7 @@ class CommentCard(Vertical, can_focus=True):
         Binding("r", "goto_root", "Go Root"),
         Binding("u", "view_user", "View User"),
         Binding("v", "view_online", "View on HN"),
+        Binding("w", "watch", "Watch"),
     ]
 
     def __init__(
@@ -131,6 +135,10 @@ class CommentCard(Vertical, can_focus=True):
         self.set_class(self.comment.deleted, "deleted")
         self.set_class(self.comment.flagged, "flagged")
         self.set_class(self.comment.dead, "dead")
+        self.set_class(
+            not self.comment.deleted and self.comment.item_id not in load_seen(),
+            "unseen",
+        )
 
     def compose(self) -> ComposeResult:
         """Compose the content of the comment card."""
@@ -139,12 +147,27 @@ class CommentCard(Vertical, can_focus=True):
             yield Label("Deleted")
             return
         yield Label(self.comment.text, markup=False)
-        yield Label(
-            f"{self.comment.by}, {naturaltime(self.comment.time)}", classes="byline"
+        yield Label(self._byline, id="byline", classes="byline")
+
+    @property
+    def _byline(self) -> str:
+        """The byline for the comment."""
+        if (author := self._hn.cached_user(self.comment.by)) is None:
+            return f"{self.comment.by}, {naturaltime(self.comment.time)}"
+        return (
+            f"{self.comment.by} ({intcomma(author.karma)} karma), "
+            f"{naturaltime(self.comment.time)}"
         )
 
+    def refresh_byline(self) -> None:
+        """Refresh the byline, to show anything new that's known about the author."""
+        if not self.comment.deleted:
+            self.get_child_by_id("byline", Label).update(self._byline)
+
     def action_links(self) -> None:
         """Show the links in the comment to the user."""
+        from ..screens.links import Links
+
         links = self.comment.urls
         if not links:
             self.notify("No links found in the comment")
@@ -157,8 +180,20 @@ class CommentCard(Vertical, can_focus=True):
         """View the comment on HackerNews."""
         open_url(self.comment.orange_site_url)
 
+    def action_watch(self) -> None:
+        """Toggle watching the comment for new replies."""
+        watchlist = load_watchlist()
+        watching = watchlist.toggle_item(self.comment)
+        save_watchlist(watchlist)
+        self.notify(
+            f"{'Now' if watching else 'No longer'} watching #{self.comment.item_id} for new replies",
+            title="Watchlist",
+        )
+
     def action_view_user(self) -> None:
         """View the details of the user who wrote the comment."""
+        from ..screens.user import UserDetails
+
         self.app.push_screen(UserDetails(self._hn, self.comment.by))
 
     def action_goto_parent(self) -> None:
@@ -211,6 +246,11 @@ class CommentCard(Vertical, can_focus=True):
         that does have replies.
         """
 
+    def on_focus(self) -> None:
+        """Mark the comment as seen once it has had focus."""
+        load_seen().mark(self.comment.item_id)
+        self.remove_class("unseen")
+
     def on_click(self, event: Click) -> None:
         """Ensure we get focus when we're clicked within anywhere."""
         self.focus()
@@ -286,16 +326,32 @@ class CommentCardWithReplies(CommentCard):
         self._replies_loaded = False
         """Have replies been loaded?"""
 
+    @property
+    def _replies_prompt(self) -> str:
+        """The prompt for loading the replies."""
+        count = len(self.comment.kids)
+        return f"[@click=load_replies]{count} {'reply' if count == 1 else 'replies'}[/]"
+
     def compose(self) -> ComposeResult:
         """Compose the content of the comment card."""
         yield from super().compose()
-        count = len(self.comment.kids)
-        yield RepliesLabel(
-            f"[@click=load_replies]{count} {'reply' if count == 1 else 'replies'}[/]",
-            classes="byline replies",
-        )
+        yield RepliesLabel(self._replies_prompt, classes="byline replies")
         yield Vertical(id="replies")
 
+    @property
+    def replies_loaded(self) -> bool:
+        """Have the replies to the comment been loaded?"""
+        return self._replies_loaded
+
+    def refreshed(self, comment: Comment) -> None:
+        """Update the card with a fresh copy of its comment.
+
+        Args:
+            comment: The fresh copy of the comment.
+        """
+        self.comment = comment
+        self.query_one(RepliesLabel).update(self._replies_prompt)
+
     @on(RepliesLabel.LoadRequested)
     def action_load_replies(
         self, event: RepliesLabel.LoadRequested | None = None
@@ -306,11 +362,18 @@ class CommentCardWithReplies(CommentCard):
         if self._replies_loaded:
             self.get_child_by_id("replies").toggle_class("loaded")
         else:
-            self.post_message(
-                self.LoadReplies(self.query_one("#replies"), self.comment)
-            )
-            self._replies_loaded = True
-            self.query_one("#replies").set_class(True, "loaded")
+            self.post_message(self.LoadReplies(self.expand_replies(), self.comment))
+
+    def expand_replies(self) -> Widget:
+        """Show the replies, taking it that they're loaded or being loaded.
+
+        Returns:
+            The container that holds the replies.
+        """
+        replies = self.get_child_by_id("replies")
+        replies.set_class(True, "loaded")
+        self._replies_loaded = True
+        return replies
 
 
 ### comment_card.py ends here
@@ -0,0 +1,205 @@
+"""Provides a tab pane that shows every new item as it's posted."""
+
+##############################################################################
+# Python imports.
+from collections import deque
+from datetime import datetime
+
+##############################################################################
+# Textual imports.
+from textual import work
+from textual.timer import Timer
+from textual.widgets import OptionList
+
+##############################################################################
+# Local imports.
+from ...hn import HN, Priority
+from ...hn.item import Item
+from .items import HackerNewsArticle, Items
+
+
+##############################################################################
+class Firehose(Items[Item]):
+    """A pane that shows every new item posted to HackerNews, as it's posted.
+
+    The maximum item ID is polled, and every item created since the last
+    poll is fetched; stories, comments, jobs, polls, the lot. The newest
+    items are added to the bottom of the list, and only a fixed number of
+    the most recent items are kept, so the pane can be left running for
+    as long as you like.
+    """
+
+    BACKFILL = 50
+    """The number of recent items to show when the firehose is first turned on."""
+
+    def __init__(self, key: str, client: HN, capacity: int, interval: float) -> None:
+        """Initialise the pane.
+
+        Args:
+            key: The key used to switch to this pane.
+            client: The HackerNews client object.
+            capacity: The maximum number of items to keep.
+            interval: The time (in seconds) between checks for new items.
+        """
+        super().__init__("firehose", key, self._fetch_new)
+        self._hn = client
+        """The HackerNews client object."""
+        self._capacity = max(1, capacity)
+        """The maximum number of items to keep."""
+        self._interval = interval
+        """The time (in seconds) between checks for new items."""
+        self._latest: deque[Item] = deque(maxlen=self._capacity)
+        """The most recent items, oldest first."""
+        self._last_id: int | None = None
+        """The ID of the last item that was looked for."""
+        self._retry: list[int] = []
+        """The IDs of items that weren't available yet when last looked for."""
+        self._poller: Timer | None = None
+        """The timer that checks for new items."""
+
+    async def _fetch_new(self, priority: Priority) -> list[Item]:
+        """Fetch the items that have been posted since the last check.
+
+        Args:
+            priority: The priority to use for calls to the API.
+
+        Returns:
+            The new items, oldest first.
+
+        Note:
+            A brand new ID sometimes has no item behind it for a moment, so
+            any that come back empty are looked for again next time; but
+            only the once.
+        """
+        latest = await self._hn.max_item_id()
+        first = (
+            latest - self.BACKFILL + 1 if self._last_id is None else self._last_id + 1
+        )
+        # There's no point in fetching more than we'd keep.
+        item_ids = [
+            *self._retry,
+            *range(max(first, latest - self._capacity + 1, 1), latest + 1),
+        ]
+        items = await self._hn.items(Item, item_ids, priority)
+        self._last_id = max(latest, self._last_id or 0)
+        self._retry = [
+            item_id
+            for item_id, item in zip(item_ids, items)
+            if not item.looks_valid and item_id not in self._retry
+        ]
+        return sorted(
+            (item for item in items if item.looks_valid), key=lambda item: item.item_id
+        )
+
+    @property
+    def items(self) -> list[Item]:
+        """The items."""
+        return list(self._latest)
+
+    @property
+    def loaded(self) -> bool:
+        """Has this tab loaded its items?"""
+        return self._last_id is not None
+
+    def _option(self, item: Item) -> HackerNewsArticle:
+        """Make the option that shows an item.
+
+        Args:
+            item: The item to show.
+
+        Returns:
+            The option for the item.
+        """
+        return HackerNewsArticle(item, self.compact)
+
+    def _redisplay(self) -> None:
+        """Redisplay the items.
+
+        Note:
+            If the pane isn't being shown, the redisplay is put off until it
+            is; there's no sense in building a display nobody can see.
+        """
+        if not self.display:
+            self._redisplay_needed = True
+            return
+        self._redisplay_needed = False
+        self._present([self._option(item) for item in self._latest])
+
+    def _show(self, items: list[Item]) -> None:
+        """Show the given items.
+
+        Args:
+            items: The new items to show.
+
+        Note:
+            The new items are added to the end of what's on display. The
+            display is allowed to grow a little beyond the capacity before
+            being rebuilt without the oldest items; that way each new item
+            costs the same to show, however many items are kept. If the
+            items are being shown in some other order, the display is
+            rearranged instead.
+        """
+        self._latest.extend(items)
+        self._compute_sort_keys(self._latest)
+        if not self.display or self._redisplay_needed:
+            self._redisplay_needed = True
+            return
+        display = self.query_one(OptionList)
+        if self.arrangement:
+            self._rearrange()
+            return
+        if display.option_count + len(items) > self._capacity + self._capacity // 4:
+            self._redisplay()
+            return
+        following = display.highlighted == display.option_count - 1
+        display.add_options(self._option(item) for item in items)
+        if following:
+            display.highlighted = display.option_count - 1
+
+    @work(exclusive=True)
+    async def _check_for_new(self) -> None:
+        """Check for, and show, any items posted since the last check."""
+        self._loading = True
+        try:
+            items = await self._fetch_new(Priority.ACTIVE_TAB)
+        except HN.RequestError:
+            # Try again next time; if HackerNews can't be reached the user
+            # will already have been told.
+            pass
+        else:
+            self._snarfed = datetime.now()
+            self._show(items)
+        finally:
+            self._loading = False
+        self.post_message(self.Loaded())
+
+    def _poll(self) -> None:
+        """Check for new items, if the time is right."""
+        if self.loaded and not self._loading and not self.disconnected:
+            self._check_for_new()
+
+    def on_show(self) -> None:
+        """Handle being shown."""
+        super().on_show()
+        if self._poller is None:
+            self._poller = self.set_interval(self._interval, self._poll)
+        else:
+            self._poller.resume()
+            self._poll()
+
+    def on_hide(self) -> None:
+        """Stop checking for new items while nobody is looking."""
+        if self._poller is not None:
+            self._poller.pause()
+
+    def action_reload(self) -> None:
+        """Start the firehose again from the latest items."""
+        self._latest.clear()
+        self._last_id = None
+        self._retry = []
+        self._sort_keys = {}
+        self.query_one(OptionList).clear_options()
+        self._load()
+
+
+### firehose.py ends here
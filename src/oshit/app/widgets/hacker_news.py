@@ -9,7 +9,7 @@ from textual.widgets import TabbedContent, TabPane, Tabs
 
 ##############################################################################
 # Local imports.
-from ...hn.item import Article
+from ...hn.item import Item
 from ..data import load_configuration, save_configuration
 from .items import Items
 
@@ -34,14 +34,18 @@ class HackerNews(TabbedContent):
     show_age: var[bool] = var(True)
     """Should we show the age of the data in the lists?"""
 
+    disconnected: var[bool] = var(False, init=False)
+    """Is HackerNews currently unreachable?"""
+
     background_load: var[bool] = var(True)
     """Should the tabs try and load in the background.
 
-    If set to `True`, once a tab has finished loading, the next unloaded tab
-    will be asked to load, and so on, until all tabs have loaded their
-    stories. This means that by the time the user has finished with their
-    first tab, it's likely all the others will have loaded; thus making the
-    rest of the reading experience way faster.
+    If set to `True`, as soon as a tab starts loading, all the other
+    unloaded tabs will be asked to load too. The tab being viewed loads with
+    a higher priority than the others, and any item that appears in more
+    than one tab is only downloaded once. This means that by the time the
+    user has finished with their first tab, it's likely all the others will
+    have loaded; thus making the rest of the reading experience way faster.
     """
 
     def on_mount(self) -> None:
@@ -66,9 +70,10 @@ class HackerNews(TabbedContent):
                 pane.compact = self.compact
                 pane.numbered = self.numbered
                 pane.show_age = False
+                pane.disconnected = self.disconnected
 
     @property
-    def active_items(self) -> Items[Article]:
+    def active_items(self) -> Items[Item]:
         """The active items."""
         assert isinstance(items := self.get_pane(self.active), Items)
         return items
@@ -108,13 +113,12 @@ class HackerNews(TabbedContent):
         else:
             self.query_one(Tabs).focus()
 
-    @on(Items.Loaded)
-    def _load_next_unloaded_tab(self) -> None:
-        """When a tab has finished loading, start a background load of another tab."""
+    @on(Items.Loading)
+    def _load_unloaded_tabs(self) -> None:
+        """When a tab starts loading, start a background load of all the others."""
         if self.background_load:
             for tab in self.query(Items).results():
-                if tab.maybe_load():
-                    return
+                tab.maybe_load()
 
     @property
     def description(self) -> str:
@@ -145,5 +149,10 @@ class HackerNews(TabbedContent):
         configuration.show_data_age = self.show_age
         save_configuration(configuration)
 
+    def _watch_disconnected(self) -> None:
+        """React to HackerNews becoming reachable, or unreachable."""
+        for pane in self.query(Items).results():
+            pane.disconnected = self.disconnected
+
 
 ### hacker_news.py ends here
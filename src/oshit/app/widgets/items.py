@@ -3,7 +3,8 @@
 ##############################################################################
 # Python imports.
 from datetime import datetime
-from typing import Awaitable, Callable, Generic, TypeVar, cast
+from itertools import groupby
+from typing import Awaitable, Callable, Generic, Iterable, NamedTuple, TypeVar, cast
 from webbrowser import open as open_url
 
 ##############################################################################
@@ -13,6 +14,7 @@ from humanize import intcomma, naturaltime
 ##############################################################################
 # Rich imports.
 from rich.console import Group
+from rich.markup import escape
 from rich.table import Table
 
 ##############################################################################
@@ -23,31 +25,97 @@ from textual.binding import Binding
 from textual.message import Message
 from textual.reactive import var
 from textual.widgets import OptionList, TabPane
-from textual.widgets.option_list import Option
+from textual.widgets.option_list import Option, OptionDoesNotExist
 
 ##############################################################################
 # Local imports.
-from ...hn import HN
-from ...hn.item import Article, Job, Link
+from ...hn import HN, Priority
+from ...hn.item import Article, Comment, Item, ItemType, Job, Link, ParentItem
 from ..commands import ShowComments, ShowUser
+from ..data import RankHistory, load_seen, load_watchlist, save_watchlist
 
 ##############################################################################
 ArticleType = TypeVar("ArticleType", bound=Article)
-"""Generic type for the items pane."""
+"""Generic type for panes that show articles."""
+
+
+##############################################################################
+class SortKeys(NamedTuple):
+    """The keys used to put an item in order.
+
+    Each key is arranged so that the item that should come first has the
+    smallest value; so every way of ordering the items is a plain,
+    ascending, sort.
+    """
+
+    rank: int
+    """The position of the item in the list as it was loaded."""
+
+    score: int
+    """The score of the item, negated."""
+
+    comments: int
+    """The number of comments on the item, negated."""
+
+    age: float
+    """The time of the item, as a timestamp, negated."""
+
+    velocity: float
+    """The points per hour the item has gained, negated."""
+
+    domain: str
+    """The domain the item links to, or an empty string if it doesn't."""
+
+    @classmethod
+    def of(cls, item: Item, rank: int, now: datetime) -> "SortKeys":
+        """Work out the keys for an item.
+
+        Args:
+            item: The item to work out the keys for.
+            rank: The position of the item in the list as it was loaded.
+            now: The time to work out the velocity of the item at.
+
+        Returns:
+            The keys for the item.
+
+        Note:
+            Anything less than an hour old is treated as being an hour old
+            when working out its velocity, so that a brand new item with a
+            couple of points doesn't look like it's taking off.
+        """
+        score = item.score if isinstance(item, Article) else 0
+        hours = max((now - item.time).total_seconds() / 3600, 1.0)
+        return cls(
+            rank,
+            -score,
+            -item.descendants if isinstance(item, Article) else 0,
+            -item.time.timestamp(),
+            -score / hours,
+            item.domain if isinstance(item, Link) else "",
+        )
 
 
 ##############################################################################
 class HackerNewsArticle(Option):
-    """An article from HackerNews."""
+    """An article, or any other item, from HackerNews."""
+
+    SNIPPET_LENGTH = 100
+    """The maximum length of the text shown for an item with no title."""
 
     def __init__(
-        self, article: Article, compact: bool, number: int | None = None
+        self,
+        article: Item,
+        compact: bool,
+        number: int | None = None,
+        history: RankHistory | None = None,
     ) -> None:
         """Initialise the hacker news article.
 
         Args:
             article: The article to show.
             compact: Should we use a compact or relaxed display?
+            number: The number to show for the article, if any.
+            history: The history of the list the article is in, if any.
         """
         self.article = article
         """The article being shown."""
@@ -55,36 +123,101 @@ class HackerNewsArticle(Option):
         """Should we show a compact form?"""
         self._number = number
         """The number to show for this article, if at all."""
+        self._history = history
+        """The history of the list the article is in, if there is one."""
         super().__init__(self.prompt, id=str(article.item_id))
 
     @property
-    def prompt(self) -> Group:
-        """The prompt for the article."""
+    def _content(self) -> tuple[str, ...]:
+        """The marked-up lines of text that make up the prompt."""
         prefix = (
             f"[dim italic{' green' if isinstance(self.article, Job) else ''}]"
             f"{self.article.__class__.__name__[0]}"
             "[/]"
         )
+        if not isinstance(self.article, Article):
+            return self._item_content(prefix)
         domain = ""
         if isinstance(self.article, Link):
             if domain := self.article.domain:
                 domain = f" [dim italic]({domain})[/]"
-        info = Table.grid(expand=True)
-        info.add_column(no_wrap=True, ratio=1)
-        info.add_column(no_wrap=True, justify="right", width=6)
-        info.add_row(
+        unread = ""
+        if new_comments := load_seen().unread(self.article):
+            unread = f" [bold]({intcomma(new_comments)} new)[/]"
+        return (
+            f"{prefix if self._compact else ' '} {self.article.title}{domain}",
             f"{' ' if self._compact else prefix} [dim italic]{intcomma(self.article.score)} "
             f"point{'' if self.article.score == 1 else 's'} "
             f"by {self.article.by} {naturaltime(self.article.time)}, "
-            f"{intcomma(self.article.descendants)} comment{'' if self.article.descendants == 1 else 's'}[/]",
+            f"{intcomma(self.article.descendants)} comment{'' if self.article.descendants == 1 else 's'}[/]{unread}"
+            f"{self._trend}",
             "" if self._number is None else f" [dim italic]#{self._number}[/]",
         )
-        return Group(
-            f"{prefix if self._compact else ' '} {self.article.title}{domain}",
-            info,
-            *([] if self._compact else [""]),
+
+    @property
+    def _trend(self) -> str:
+        """The marked-up movement and velocity of the article, if known."""
+        if self._history is None:
+            return ""
+        trend = ""
+        if movement := self._history.movement(self.article.item_id):
+            trend = (
+                f" [green]▲{movement}[/]" if movement > 0 else f" [red]▼{-movement}[/]"
+            )
+        if velocity := round(self._history.velocity(self.article.item_id) or 0):
+            trend = f"{trend} [dim italic]{velocity:+}/hr[/]"
+        return trend
+
+    def _item_content(self, prefix: str) -> tuple[str, ...]:
+        """Get the lines of the prompt for an item that isn't an article.
+
+        Args:
+            prefix: The prefix that marks the type of the item.
+
+        Returns:
+            The marked-up lines of text that make up the prompt.
+        """
+        snippet = " ".join(self.article.text.split())
+        if len(snippet) > self.SNIPPET_LENGTH:
+            snippet = f"{snippet[: self.SNIPPET_LENGTH - 1]}…"
+        reply = (
+            f", in reply to #{self.article.parent}"
+            if isinstance(self.article, Comment)
+            else ""
+        )
+        return (
+            f"{prefix if self._compact else ' '} {escape(snippet)}",
+            f"{' ' if self._compact else prefix} [dim italic]by {self.article.by} "
+            f"{naturaltime(self.article.time)}{reply}[/]",
         )
 
+    @property
+    def prompt(self) -> Group:
+        """The prompt for the article."""
+        if isinstance(self.article, Article):
+            title, details, number = self._content
+            info = Table.grid(expand=True)
+            info.add_column(no_wrap=True, ratio=1)
+            info.add_column(no_wrap=True, justify="right", width=6)
+            info.add_row(details, number)
+            return Group(title, info, *([] if self._compact else [""]))
+        return Group(*self._content, *([] if self._compact else [""]))
+
+    def update(self, article: Item, number: int | None = None) -> bool:
+        """Update the article being shown.
+
+        Args:
+            article: The new version of the article.
+            number: The number to show for the article, if any.
+
+        Returns:
+            `True` if the prompt for the article has changed, `False` if not.
+        """
+        before = self._content
+        self.article = article
+        self._number = number
+        return self._content != before
+
 
 ##############################################################################
 class ArticleList(OptionList):
@@ -103,29 +236,33 @@ class ArticleList(OptionList):
     | - | - |
     | <kbd>Enter</kbd> | Open the URL for the item in your browser. |
     | <kbd>c</kbd> | View the comments for the item. |
+    | <kbd>w</kbd> | Watch, or stop watching, the item for new replies. |
     """
 
     BINDINGS = [
         Binding("c", "comments", "Comments"),
         Binding("v", "view_online", "View on HN"),
         Binding("u", "user", "View User"),
+        Binding("w", "watch", "Watch"),
     ]
 
     def on_focus(self) -> None:
         """Ensure the first item is highlighted if nothing is until now."""
         if self.highlighted is None and self.option_count:
-            self.highlighted = 0
+            self.action_first()
 
     def action_comments(self) -> None:
         """Visit the comments for the given"""
         if self.highlighted is not None:
-            self.post_message(
-                ShowComments(
-                    cast(
-                        HackerNewsArticle, self.get_option_at_index(self.highlighted)
-                    ).article
-                )
-            )
+            if isinstance(
+                article := cast(
+                    HackerNewsArticle, self.get_option_at_index(self.highlighted)
+                ).article,
+                Article,
+            ):
+                self.post_message(ShowComments(article))
+            else:
+                self.app.bell()
 
     def action_view_online(self) -> None:
         """View an article online."""
@@ -136,6 +273,23 @@ class ArticleList(OptionList):
                 ).article.orange_site_url
             )
 
+    def action_watch(self) -> None:
+        """Toggle watching the item for new replies."""
+        if self.highlighted is not None:
+            article = cast(
+                HackerNewsArticle, self.get_option_at_index(self.highlighted)
+            ).article
+            if not isinstance(article, ParentItem):
+                self.app.bell()
+                return
+            watchlist = load_watchlist()
+            watching = watchlist.toggle_item(article)
+            save_watchlist(watchlist)
+            self.notify(
+                f"{'Now' if watching else 'No longer'} watching #{article.item_id} for new replies",
+                title="Watchlist",
+            )
+
     def action_user(self) -> None:
         """Show the details of the user."""
         if self.highlighted is not None:
@@ -149,7 +303,7 @@ class ArticleList(OptionList):
 
 
 ##############################################################################
-class Items(Generic[ArticleType], TabPane):
+class Items(Generic[ItemType], TabPane):
     """The pane that displays the top stories."""
 
     CONTEXT_HELP = """
@@ -158,6 +312,8 @@ class Items(Generic[ArticleType], TabPane):
     | Key | Description |
     | - | - |
     | <kbd>Ctrl</kbd>+<knd>r</kbd> | Reload. |
+    | <kbd>Ctrl</kbd>+<kbd>s</kbd> | Change the order of the items. |
+    | <kbd>Ctrl</kbd>+<kbd>g</kbd> | Group, or stop grouping, the items by domain. |
     """
 
     DEFAULT_CSS = """
@@ -173,13 +329,29 @@ class Items(Generic[ArticleType], TabPane):
         &:focus {
             border: none;
         }
+
+        & > .option-list--option-disabled {
+            color: $accent;
+            text-style: bold;
+        }
     }
     """
 
     BINDINGS = [
         ("ctrl+r", "reload"),
+        ("ctrl+s", "sort"),
+        ("ctrl+g", "group"),
     ]
 
+    SORTS: tuple[tuple[str, Callable[[SortKeys], float]], ...] = (
+        ("rank", lambda keys: keys.rank),
+        ("score", lambda keys: keys.score),
+        ("comments", lambda keys: keys.comments),
+        ("age", lambda keys: keys.age),
+        ("points per hour", lambda keys: keys.velocity),
+    )
+    """The ways the items can be sorted, and the sort key used for each."""
+
     compact: var[bool] = var(True)
     """Should we use a compact display?"""
 
@@ -189,8 +361,15 @@ class Items(Generic[ArticleType], TabPane):
     show_age: var[bool] = var(True)
     """Should we show the age of the data?"""
 
+    disconnected: var[bool] = var(False, init=False)
+    """Is HackerNews currently unreachable?"""
+
     def __init__(
-        self, title: str, key: str, source: Callable[[], Awaitable[list[ArticleType]]]
+        self,
+        title: str,
+        key: str,
+        source: Callable[[Priority], Awaitable[list[ItemType]]],
+        preloaded: Awaitable[list[ItemType]] | None = None,
     ) -> None:
         """Initialise the pane.
 
@@ -198,6 +377,11 @@ class Items(Generic[ArticleType], TabPane):
             title: The title for the pane.
             key: The key used to switch to this pane.
             source: The source of items for the pane.
+            preloaded: Optional items that are already on their way.
+
+        Note:
+            The source will be called with the priority that should be used
+            for any calls it makes to the API.
         """
         super().__init__(f"{title.capitalize()} [dim]\\[{key}][/]", id=title)
         self._description = title
@@ -206,8 +390,24 @@ class Items(Generic[ArticleType], TabPane):
         """The time when the data was snarfed."""
         self._source = source
         """The source of items to show."""
-        self._items: list[ArticleType] = []
+        self._preloaded = preloaded
+        """Items that are already on their way, to use for the first load."""
+        self._items: list[ItemType] = []
         """The items to show."""
+        self._redisplay_needed = False
+        """Does the display need refreshing when the pane is next shown?"""
+        self._stale = False
+        """Are the items being shown known to be stale?"""
+        self._loading = False
+        """Are the items currently being loaded?"""
+        self._sort_keys: dict[int, SortKeys] = {}
+        """The keys for putting the items in order, keyed on item ID."""
+        self._sort = 0
+        """The index of the way the items are sorted."""
+        self._grouped = False
+        """Are the items grouped by domain?"""
+        self._history: RankHistory | None = None
+        """The history of the ranking of the items, if it's being kept."""
 
     def compose(self) -> ComposeResult:
         """Compose the content of the pane."""
@@ -217,26 +417,228 @@ class Items(Generic[ArticleType], TabPane):
     def description(self) -> str:
         """The description for this pane."""
         suffix = ""
-        if self._snarfed is None:
+        if self.disconnected:
+            suffix = " - Offline, showing cached items" if self.loaded else " - Offline"
+        elif self._snarfed is None:
             suffix = " - Loading..."
-        elif not self._items:
+        elif self._stale:
+            suffix = f" - Stale, from {naturaltime(self._snarfed)}"
+            if self._loading:
+                suffix = f"{suffix} - Refreshing..."
+        elif not self.loaded:
             suffix = " - Reloading..."
         elif self.show_age:
             suffix = f" - Updated {naturaltime(self._snarfed)}"
-        return f"{self._description.capitalize()}{suffix}"
+        return f"{self._description.capitalize()}{self.arrangement}{suffix}"
 
-    def _redisplay(self) -> None:
-        """Redisplay the items."""
+    @property
+    def arrangement(self) -> str:
+        """A description of how the items are arranged, if not as loaded."""
+        arrangement = [
+            *([f"by {self.SORTS[self._sort][0]}"] if self._sort else []),
+            *(["grouped by domain"] if self._grouped else []),
+        ]
+        return f" - {', '.join(arrangement)}" if arrangement else ""
+
+    def _compute_sort_keys(self, items: Iterable[ItemType]) -> None:
+        """Work out the keys for putting the items in order.
+
+        Args:
+            items: The items, in the order they were loaded.
+        """
+        now = datetime.now()
+        self._sort_keys = {
+            item.item_id: SortKeys.of(item, rank, now)
+            for rank, item in enumerate(items)
+        }
+
+    def _in_order(self, options: list[HackerNewsArticle]) -> list[Option]:
+        """Put the options for the items in the order they should be shown.
+
+        Args:
+            options: The options for the items, in the order they were loaded.
+
+        Returns:
+            The options, in the order they should be shown; with a heading
+            before each domain if the items are grouped by domain.
+        """
+        if not (self._sort or self._grouped):
+            return [*options]
+        keys = self._sort_keys
+        key = self.SORTS[self._sort][1]
+
+        def sort_key(option: HackerNewsArticle) -> tuple[bool, str, float, int]:
+            item_keys = keys[option.article.item_id]
+            return (
+                self._grouped and not item_keys.domain,
+                item_keys.domain if self._grouped else "",
+                key(item_keys),
+                item_keys.rank,
+            )
+
+        ordered = sorted(options, key=sort_key)
+        if not self._grouped:
+            return [*ordered]
+        arranged: list[Option] = []
+        for domain, grouped in groupby(
+            ordered, key=lambda option: keys[option.article.item_id].domain
+        ):
+            arranged.extend(
+                [Option(escape(domain or "No domain"), disabled=True), *grouped]
+            )
+        return arranged
+
+    def _present(self, options: list[HackerNewsArticle]) -> None:
+        """Put the options for the items on display.
+
+        Args:
+            options: The options for the items, in the order they were loaded.
+
+        Note:
+            The same item is kept highlighted, if it's still on display, and
+            the display stays scrolled to where it was; unless that would
+            leave the highlighted item out of sight.
+        """
         display = self.query_one(OptionList)
-        remember = display.highlighted
-        display.clear_options().add_options(
+        highlighted = display.highlighted
+        remember = (
+            None if highlighted is None else display.get_option_at_index(highlighted).id
+        )
+        scrolled_to = display.scroll_y
+        display.clear_options().add_options(self._in_order(options))
+        if remember is not None:
+            try:
+                highlighted = display.get_option_index(remember)
+            except OptionDoesNotExist:
+                pass
+        if highlighted is not None and display.option_count:
+            highlighted = min(highlighted, display.option_count - 1)
+            if display.get_option_at_index(highlighted).disabled:
+                # Never leave a domain's heading highlighted; move on to the
+                # first item under it.
+                highlighted += 1
+            display.highlighted = highlighted
+        display.scroll_to(y=scrolled_to, animate=False, immediate=True)
+        display.scroll_to_highlight()
+
+    def _redisplay(self) -> None:
+        """Redisplay the items.
+
+        Note:
+            If the pane isn't being shown, the redisplay is put off until it
+            is; there's no sense in building a display nobody can see.
+        """
+        if not self.display:
+            self._redisplay_needed = True
+            return
+        self._redisplay_needed = False
+        self._present(
             [
-                HackerNewsArticle(item, self.compact, number if self.numbered else None)
+                HackerNewsArticle(
+                    item,
+                    self.compact,
+                    number if self.numbered else None,
+                    self._history,
+                )
                 for number, item in enumerate(self._items)
                 if item.looks_valid
             ]
         )
-        display.highlighted = remember
+
+    def _rearrange(self) -> None:
+        """Rearrange the items on display, after the way they're ordered changes.
+
+        Note:
+            The options already on display are reused; nothing is fetched,
+            and nothing about the items is worked out again.
+        """
+        self.post_message(self.Rearranged())
+        if not self.display or self._redisplay_needed:
+            self._redisplay_needed = True
+            return
+        self._present(
+            sorted(
+                (
+                    option
+                    for option in self.query_one(OptionList).options
+                    if isinstance(option, HackerNewsArticle)
+                ),
+                key=lambda option: self._sort_keys[option.article.item_id].rank,
+            )
+        )
+
+    def _update(self, items: list[ItemType]) -> None:
+        """Update the items being shown, repainting as little as possible.
+
+        Args:
+            items: The latest version of the items to show.
+
+        Note:
+            If the items end up in the same order as the items on display,
+            only the rows whose text has changed are repainted; otherwise
+            the display is rearranged, reusing the options for the items
+            that were already on display and haven't changed.
+        """
+        self._items = items
+        self._compute_sort_keys(items)
+        if not self.display or self._redisplay_needed:
+            self._redisplay_needed = True
+            return
+        display = self.query_one(OptionList)
+        shown = {
+            option.id: option
+            for option in display.options
+            if isinstance(option, HackerNewsArticle)
+        }
+        options: list[HackerNewsArticle] = []
+        changed: dict[str, HackerNewsArticle] = {}
+        for number, item in enumerate(items):
+            if not item.looks_valid:
+                continue
+            number_shown = number if self.numbered else None
+            if (option := shown.get(str(item.item_id))) is None:
+                option = HackerNewsArticle(
+                    item, self.compact, number_shown, self._history
+                )
+            elif option.update(item, number_shown):
+                changed[str(item.item_id)] = HackerNewsArticle(
+                    item, self.compact, number_shown, self._history
+                )
+            options.append(option)
+        arranged = self._in_order(options)
+        if [option.id for option in arranged] != [
+            option.id for option in display.options
+        ]:
+            # The options whose text has changed are shown afresh, as the
+            # old options hold on to how they were last rendered.
+            self._present([changed.get(option.id or "", option) for option in options])
+            return
+        for index, entry in enumerate(arranged):
+            if entry.id in changed:
+                display.replace_option_prompt_at_index(index, entry.prompt)
+
+    def _show(self, items: list[ItemType]) -> None:
+        """Show the given items.
+
+        Args:
+            items: The items to show.
+        """
+        self._items = items
+        self._compute_sort_keys(items)
+        self._redisplay()
+
+    async def _receive_preloaded(
+        self, preloaded: Awaitable[list[ItemType]]
+    ) -> list[ItemType]:
+        """Receive the items that were already on their way.
+
+        Args:
+            preloaded: The items that are on their way.
+
+        Returns:
+            The items.
+        """
+        return await preloaded
 
     class Loading(Message):
         """Message sent when items start loading."""
@@ -244,41 +646,74 @@ class Items(Generic[ArticleType], TabPane):
     class Loaded(Message):
         """Message sent when items are loaded."""
 
-    @work
+    class Rearranged(Message):
+        """Message sent when the way the items are arranged changes."""
+
+    @work(exclusive=True)
     async def _load(self) -> None:
-        """Load up the items and display them."""
+        """Load up the items and display them.
+
+        Note:
+            Starting a load cancels any load that is already in progress.
+
+            If there are stale items on display they're left on display
+            while the load happens.
+
+            If HackerNews can't be reached, the items that are on display
+            are left alone; items loaded at that time will have come from
+            the cache, so they're treated as stale.
+        """
         display = self.query_one(OptionList)
-        display.loading = True
+        display.loading = not self.loaded
+        self._loading = True
         self.post_message(self.Loading())
         try:
-            self._items = await self._source()
+            if self._preloaded is None:
+                items = await self._source(
+                    Priority.ACTIVE_TAB if self.display else Priority.BACKGROUND_TAB
+                )
+            else:
+                preloaded, self._preloaded = self._preloaded, None
+                items = await self._receive_preloaded(preloaded)
         except HN.RequestError as error:
-            self.app.bell()
-            self.notify(
-                str(error),
-                title=f"Error loading items for '{self._description.capitalize()}'",
-                timeout=8,
-                severity="error",
-            )
+            # If HackerNews can't be reached the user will already have been
+            # told, so there's no need to make a fuss about it here.
+            if not self.disconnected:
+                self.app.bell()
+                self.notify(
+                    str(error),
+                    title=f"Error loading items for '{self._description.capitalize()}'",
+                    timeout=8,
+                    severity="error",
+                )
         else:
-            self._snarfed = datetime.now()
-            self._redisplay()
+            if self.disconnected:
+                self._snarfed = self._snarfed or datetime.now()
+                self._stale = True
+            else:
+                self._snarfed = datetime.now()
+                self._stale = False
+            self._show(items)
         display.loading = False
+        self._loading = False
         self.post_message(self.Loaded())
 
     def maybe_load(self) -> bool:
-        """Start loading the items if they're not loaded and aren't currently loading.
+        """Start loading the items if they need loading and aren't currently loading.
 
         Returns:
             `True` if it was decided to load the items, `False` if not.
         """
-        if not self.loaded and not self.query_one(OptionList).loading:
+        if (self._stale or not self.loaded) and not self._loading:
+            # Mark ourselves as loading right away, so that we don't get
+            # asked to load again before the load gets going.
+            self._loading = True
             self._load()
             return True
         return False
 
     @property
-    def items(self) -> list[ArticleType]:
+    def items(self) -> list[ItemType]:
         """The items."""
         return self._items
 
@@ -289,8 +724,9 @@ class Items(Generic[ArticleType], TabPane):
 
     def on_show(self) -> None:
         """Handle being shown."""
-        if not self.loaded:
-            self._load()
+        if self._redisplay_needed:
+            self._redisplay()
+        self.maybe_load()
 
     def steal_focus(self) -> None:
         """Steal focus for the item list within."""
@@ -306,6 +742,25 @@ class Items(Generic[ArticleType], TabPane):
         if self.loaded:
             self._redisplay()
 
+    def _watch_disconnected(self) -> None:
+        """React to HackerNews becoming reachable, or unreachable."""
+        if not self.disconnected and self._stale:
+            self.maybe_load()
+
+    def refresh_item(self, item_id: int) -> None:
+        """Refresh the display of an item, if it's on display.
+
+        Args:
+            item_id: The ID of the item to refresh.
+        """
+        display = self.query_one(OptionList)
+        try:
+            option = display.get_option(str(item_id))
+        except OptionDoesNotExist:
+            return
+        assert isinstance(option, HackerNewsArticle)
+        display.replace_option_prompt(str(item_id), option.prompt)
+
     @on(OptionList.OptionSelected)
     def visit(self, event: OptionList.OptionSelected) -> None:
         """Handle an option list item being selected."""
@@ -317,5 +772,15 @@ class Items(Generic[ArticleType], TabPane):
         self._items = []
         self._load()
 
+    def action_sort(self) -> None:
+        """Move on to the next way of sorting the items."""
+        self._sort = (self._sort + 1) % len(self.SORTS)
+        self._rearrange()
+
+    def action_group(self) -> None:
+        """Toggle the grouping of the items by domain."""
+        self._grouped = not self._grouped
+        self._rearrange()
+
 
 ### items.py ends here
@@ -0,0 +1,290 @@
+"""Provides a tab pane for showing one of the story lists from HackerNews."""
+
+##############################################################################
+# Python imports.
+from datetime import datetime
+from math import ceil
+from random import uniform
+from typing import Awaitable, Callable, Iterable
+
+##############################################################################
+# Textual imports.
+from textual import work
+from textual.widgets import OptionList
+
+##############################################################################
+# Local imports.
+from ...hn import HN, Priority
+from ...hn.item import Loader
+from ..data import (
+    load_configuration,
+    load_history,
+    load_snapshot,
+    save_history,
+    save_snapshot,
+)
+from .items import ArticleType, Items
+
+
+##############################################################################
+class StoryList(Items[ArticleType]):
+    """A pane that shows one of the story lists from HackerNews.
+
+    The content of the list is saved when the application exits, and is
+    shown straight away the next time the application starts up, marked as
+    stale, until it has been refreshed.
+
+    The list can also be refreshed automatically, every so often. Only the
+    list of IDs, any stories that are new to the list, and the stories that
+    are on display (or nearly so) are fetched; so the cost of leaving the
+    list to refresh all day depends on the size of the display, not on the
+    size of the list.
+
+    Each time the list is loaded or refreshed the ranking of the stories,
+    and the scores of those on display, are recorded; so the list can show
+    how each story is moving, and how quickly it's gaining points.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        key: str,
+        client: HN,
+        item_type: type[ArticleType],
+        item_ids: Callable[[Priority], Awaitable[list[int]]],
+        preloaded: Awaitable[list[ArticleType]] | None = None,
+    ) -> None:
+        """Initialise the pane.
+
+        Args:
+            title: The title for the pane.
+            key: The key used to switch to this pane.
+            client: The HackerNews client object.
+            item_type: The type of the items in the list.
+            item_ids: The source of the IDs of the items in the list.
+            preloaded: Optional items that are already on their way.
+        """
+        super().__init__(title, key, self._fetch_stories, preloaded)
+        self._hn = client
+        """The HackerNews client object."""
+        self._item_type = item_type
+        """The type of the items in the list."""
+        self._item_ids = item_ids
+        """The source of the IDs of the items in the list."""
+        self._refresh_every = 0
+        """The time (in seconds) between automatic refreshes; `0` for never."""
+        self._refresh_due = False
+        """Is an automatic refresh due for when the pane is next shown?"""
+
+    async def _fetch_stories(self, priority: Priority) -> list[ArticleType]:
+        """Fetch the stories for the list.
+
+        Args:
+            priority: The priority to use for calls to the API.
+
+        Returns:
+            The stories.
+
+        Note:
+            If stale stories are on display, any stories that are new to the
+            list are fetched and shown first, with the stale stories being
+            refreshed after that.
+        """
+        item_ids = await self._item_ids(priority)
+        if self._stale and self._items:
+            known = {item.item_id: item for item in self._items}
+            new_ids = [item_id for item_id in item_ids if item_id not in known]
+            fresh = dict(
+                zip(new_ids, await self._hn.items(self._item_type, new_ids, priority))
+            )
+            self._show(
+                [
+                    fresh[item_id] if item_id in fresh else known[item_id]
+                    for item_id in item_ids
+                ]
+            )
+            # The rest are on display already, so they're less urgent.
+            priority = max(priority, Priority.BACKGROUND_TAB)
+        items = await self._hn.items(self._item_type, item_ids, priority)
+        self._record(item_ids, items)
+        return items
+
+    async def _receive_preloaded(
+        self, preloaded: Awaitable[list[ArticleType]]
+    ) -> list[ArticleType]:
+        """Receive the stories that were already on their way.
+
+        Args:
+            preloaded: The stories that are on their way.
+
+        Returns:
+            The stories.
+
+        Note:
+            The stories come in the order of the list, one for each ID, so
+            the ranking is recorded from them as for any other load.
+        """
+        items = await super()._receive_preloaded(preloaded)
+        self._record([item.item_id for item in items], items)
+        return items
+
+    def _record(self, item_ids: list[int], items: Iterable[ArticleType]) -> None:
+        """Record the ranking of the list, and the scores of what's on display.
+
+        Args:
+            item_ids: The IDs of the stories in the list, in order.
+            items: Freshly-loaded stories; the scores of those on display,
+                or nearly so, are recorded.
+        """
+        if self._history is None:
+            return
+        near = self._near_visible() or set(
+            item_ids[: self.query_one(OptionList).size.height]
+        )
+        if self._history.record(
+            datetime.now(),
+            item_ids,
+            {
+                item.item_id: item.score
+                for item in items
+                if item.item_id in near and item.looks_valid
+            },
+        ):
+            save_history(self._description, self._history)
+
+    def on_mount(self) -> None:
+        """Configure the pane once the DOM is ready."""
+        if self._hn.offline:
+            # When reading from an offline bundle, the bundle is all we show.
+            return
+        if load_configuration().rank_history:
+            self._history = load_history(self._description)
+        # Wait until the display has settled before restoring the list from
+        # the last session, so that the list is only built the once.
+        self.call_after_refresh(self._restore)
+        if (
+            refresh_every := load_configuration().auto_refresh.get(self._description, 0)
+        ) > 0:
+            self._refresh_every = refresh_every
+            self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Schedule the next automatic refresh.
+
+        Note:
+            The time until the refresh is varied a little, so that the
+            refreshes of different lists drift apart rather than all
+            happening at once.
+        """
+        jitter = self._refresh_every * load_configuration().auto_refresh_jitter
+        self.set_timer(
+            self._refresh_every + uniform(-jitter, jitter), self._refresh_when_due
+        )
+
+    def _refresh_when_due(self) -> None:
+        """Refresh the list, now it's due; or once it's next shown."""
+        if self.display:
+            self._refresh_list()
+        else:
+            self._refresh_due = True
+
+    def on_show(self) -> None:
+        """Handle being shown."""
+        super().on_show()
+        if self._refresh_due:
+            self._refresh_due = False
+            self._refresh_list()
+
+    def _near_visible(self) -> set[int]:
+        """The IDs of the items that are on display, or nearly so.
+
+        Returns:
+            The IDs of the items on display, and a display's worth either
+            side of them.
+        """
+        display = self.query_one(OptionList)
+        if not (count := display.option_count) or not (
+            lines := display.virtual_size.height
+        ):
+            return set()
+        first = int(display.scroll_y * count / lines)
+        shown = ceil(display.size.height * count / lines) + 1
+        return {
+            int(display.get_option_at_index(index).id or 0)
+            for index in range(max(0, first - shown), min(count, first + 2 * shown))
+        }
+
+    @work(exclusive=True, group="auto-refresh")
+    async def _refresh_list(self) -> None:
+        """Refresh the list, fetching as little as possible."""
+        try:
+            if not self.loaded or self._loading or self._stale or self.disconnected:
+                # Either a full load is on the way, or there's no point.
+                return
+            item_ids = await self._item_ids(Priority.ACTIVE_TAB)
+            known = {item.item_id: item for item in self._items}
+            near = self._near_visible()
+            wanted = [
+                item_id
+                for item_id in item_ids
+                if item_id in near or item_id not in known
+            ]
+            fresh = dict(
+                zip(
+                    wanted,
+                    await self._hn.items(
+                        self._item_type, wanted, Priority.ACTIVE_TAB, max_age=0
+                    ),
+                )
+            )
+        except HN.RequestError:
+            # Try again next time; if HackerNews can't be reached the user
+            # will already have been told.
+            pass
+        else:
+            if not self._loading:
+                self._snarfed = datetime.now()
+                self._record(item_ids, fresh.values())
+                self._update(
+                    [fresh.get(item_id) or known[item_id] for item_id in item_ids]
+                )
+                self.post_message(self.Loaded())
+        finally:
+            self._schedule_refresh()
+
+    def _restore(self) -> None:
+        """Show the list from the last session, if there is one."""
+        if self._snarfed is not None:
+            # We've already got fresh items, so there's no point.
+            return
+        if (snapshot := load_snapshot(self._description)) is None:
+            return
+        try:
+            items = [
+                item
+                for data in snapshot.items
+                if data and isinstance(item := Loader.load(data), self._item_type)
+            ]
+        except (KeyError, TypeError, ValueError):
+            return
+        if items:
+            self._snarfed = snapshot.snarfed
+            self._stale = True
+            self._show(items)
+            # A load may have started before the list was restored; the
+            # restored list stands in for the loading indicator.
+            self.query_one(OptionList).loading = False
+            self.post_message(self.Loaded())
+
+    def on_unmount(self) -> None:
+        """Save the list for the next session."""
+        if self._hn.offline:
+            # Don't let a bundle's content stand in for the last session.
+            return
+        if self._snarfed is not None and (
+            items := [item for item in self._items if item.looks_valid]
+        ):
+            save_snapshot(self._description, self._snarfed, items)
+
+
+### story_list.py ends here
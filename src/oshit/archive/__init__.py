@@ -0,0 +1,11 @@
+"""Provides a local archive of items pulled from HackerNews."""
+
+##############################################################################
+# Local imports.
+from .store import Archive, ArchivedItem, archive_file, archived_item
+
+##############################################################################
+# Exports.
+__all__ = ["Archive", "ArchivedItem", "archive_file", "archived_item"]
+
+### __init__.py ends here
@@ -0,0 +1,171 @@
+"""Queries that can be run against the local archive."""
+
+##############################################################################
+# Python imports.
+from datetime import datetime
+from sqlite3 import Cursor
+from typing import Any, Final
+
+##############################################################################
+# Local imports.
+from .store import Archive
+
+##############################################################################
+PERIODS: Final[dict[str, str]] = {
+    "day": "%Y-%m-%d",
+    "week": "%Y-W%W",
+    "month": "%Y-%m",
+    "year": "%Y",
+}
+"""The periods that activity can be grouped by, and how to format them."""
+
+
+##############################################################################
+def _between(since: datetime | None, until: datetime | None) -> tuple[str, list[Any]]:
+    """Build the condition for a time range.
+
+    Args:
+        since: The start of the range, if there is one.
+        until: The end of the range, if there is one.
+
+    Returns:
+        The SQL condition, and its parameters.
+
+    Note:
+        The start of the range is inclusive, the end is exclusive.
+
+        If there's no range at all the condition is always true, rather than
+        being a range that covers all time, so that it doesn't steer the
+        query towards the time index when there's a better one.
+    """
+    conditions: list[str] = []
+    parameters: list[Any] = []
+    if since is not None:
+        conditions.append("time >= ?")
+        parameters.append(int(since.timestamp()))
+    if until is not None:
+        conditions.append("time < ?")
+        parameters.append(int(until.timestamp()))
+    return " AND ".join(conditions) or "1", parameters
+
+
+##############################################################################
+def top_stories(
+    archive: Archive,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    limit: int = 25,
+) -> Cursor:
+    """Find the highest scoring stories.
+
+    Args:
+        archive: The archive to query.
+        since: Only look at stories from this time on.
+        until: Only look at stories from before this time.
+        limit: The maximum number of stories to find.
+
+    Returns:
+        A cursor over the stories.
+    """
+    condition, parameters = _between(since, until)
+    return archive.execute(
+        "SELECT id, datetime(time, 'unixepoch') AS posted, score, descendants, by, title, url "
+        f"FROM items WHERE type = 'story' AND {condition} AND NOT dead AND NOT deleted "
+        "ORDER BY score DESC LIMIT ?",
+        [*parameters, limit],
+    )
+
+
+##############################################################################
+def top_domains(
+    archive: Archive,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    limit: int = 25,
+) -> Cursor:
+    """Find the most-submitted domains.
+
+    Args:
+        archive: The archive to query.
+        since: Only look at submissions from this time on.
+        until: Only look at submissions from before this time.
+        limit: The maximum number of domains to find.
+
+    Returns:
+        A cursor over the domains.
+    """
+    condition, parameters = _between(since, until)
+    return archive.execute(
+        "SELECT domain, COUNT(*) AS submissions, SUM(score) AS score "
+        f"FROM items WHERE domain IS NOT NULL AND domain != '' AND {condition} "
+        "GROUP BY domain ORDER BY submissions DESC, score DESC LIMIT ?",
+        [*parameters, limit],
+    )
+
+
+##############################################################################
+def user_activity(
+    archive: Archive,
+    user: str,
+    period: str = "month",
+    item_type: str = "comment",
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> Cursor:
+    """Find how much a user has posted over time.
+
+    Args:
+        archive: The archive to query.
+        user: The user to look at.
+        period: The period to group the activity by.
+        item_type: The type of item to count.
+        since: Only look at items from this time on.
+        until: Only look at items from before this time.
+
+    Returns:
+        A cursor over the count of items in each period.
+    """
+    condition, parameters = _between(since, until)
+    return archive.execute(
+        f"SELECT strftime('{PERIODS[period]}', time, 'unixepoch') AS {period}, "
+        "COUNT(*) AS items "
+        f"FROM items WHERE by = ? AND type = ? AND {condition} "
+        f"GROUP BY {period} ORDER BY {period}",
+        [user, item_type, *parameters],
+    )
+
+
+##############################################################################
+def replies(archive: Archive, item_id: int) -> Cursor:
+    """Find the direct replies to an item.
+
+    Args:
+        archive: The archive to query.
+        item_id: The ID of the item to find the replies to.
+
+    Returns:
+        A cursor over the replies.
+    """
+    return archive.execute(
+        "SELECT id, datetime(time, 'unixepoch') AS posted, by, text "
+        "FROM items WHERE parent = ? ORDER BY time",
+        [item_id],
+    )
+
+
+##############################################################################
+def sql(archive: Archive, statement: str) -> Cursor:
+    """Run some arbitrary, read-only, SQL against the archive.
+
+    Args:
+        archive: The archive to query.
+        statement: The SQL statement to run.
+
+    Returns:
+        A cursor over the results.
+    """
+    archive.execute("PRAGMA query_only = ON")
+    return archive.execute(statement)
+
+
+### query.py ends here
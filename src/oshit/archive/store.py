@@ -0,0 +1,282 @@
+"""Code for storing items pulled from HackerNews in a local archive."""
+
+##############################################################################
+# Python imports.
+from json import dumps
+from pathlib import Path
+from sqlite3 import Connection, Cursor, connect
+from types import TracebackType
+from typing import Any, Final, Iterable, Iterator, NamedTuple, Sequence
+
+##############################################################################
+# Local imports.
+from ..app.data.locations import data_dir
+from ..hn.item import Article, Comment, Item, Link
+
+
+##############################################################################
+class ArchivedItem(NamedTuple):
+    """An item as it's held in the archive."""
+
+    id: int
+    """The ID of the item."""
+
+    type: str
+    """The API's name for the type of the item."""
+
+    by: str
+    """The author of the item."""
+
+    time: int
+    """The time of the item, as a Unix timestamp."""
+
+    parent: int | None
+    """The ID of the parent of the item, if it has one."""
+
+    score: int | None
+    """The score of the item, if it has one."""
+
+    descendants: int | None
+    """The number of descendants of the item, if it has them."""
+
+    title: str | None
+    """The title of the item, if it has one."""
+
+    url: str | None
+    """The URL of the item, if it has one."""
+
+    domain: str | None
+    """The domain of the URL of the item, if it has one."""
+
+    text: str
+    """The text of the item, tidied up."""
+
+    dead: bool
+    """Is the item dead?"""
+
+    deleted: bool
+    """Has the item been deleted?"""
+
+    data: str
+    """The raw JSON data of the item."""
+
+
+##############################################################################
+def archived_item(item: Item) -> ArchivedItem:
+    """Turn an item into a form that can be archived.
+
+    Args:
+        item: The item to archive.
+
+    Returns:
+        The item in a form that can be archived.
+    """
+    data = item.raw_data
+    return ArchivedItem(
+        id=item.item_id,
+        type=item.item_type,
+        by=item.by,
+        time=int(data["time"]),
+        parent=item.parent if isinstance(item, Comment) else data.get("parent"),
+        score=item.score if isinstance(item, Article) else data.get("score"),
+        descendants=item.descendants if isinstance(item, Article) else None,
+        title=item.title if isinstance(item, Article) else None,
+        url=item.url if isinstance(item, Link) else None,
+        domain=item.domain if isinstance(item, Link) else None,
+        text=item.text,
+        dead=bool(data.get("dead", False)),
+        deleted=bool(data.get("deleted", False)),
+        data=dumps(data),
+    )
+
+
+##############################################################################
+def archive_file() -> Path:
+    """The path to the default archive.
+
+    Returns:
+        The path to the default archive.
+    """
+    return data_dir() / "archive.sqlite"
+
+
+##############################################################################
+class Archive:
+    """A local archive of items pulled from HackerNews.
+
+    As well as the items, the archive keeps track of which ranges of item
+    IDs have been crawled; each range is recorded in the same transaction
+    as the items within it, so the record of what has been crawled always
+    matches what has been stored.
+    """
+
+    SCHEMA: Final[str] = """
+    CREATE TABLE IF NOT EXISTS items (
+        id INTEGER PRIMARY KEY,
+        type TEXT NOT NULL,
+        by TEXT NOT NULL,
+        time INTEGER NOT NULL,
+        parent INTEGER,
+        score INTEGER,
+        descendants INTEGER,
+        title TEXT,
+        url TEXT,
+        domain TEXT,
+        text TEXT NOT NULL,
+        dead INTEGER NOT NULL,
+        deleted INTEGER NOT NULL,
+        data TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS crawled (
+        first INTEGER PRIMARY KEY,
+        last INTEGER NOT NULL
+    );
+    """
+    """The schema of the archive."""
+
+    INDEXES: Final[dict[str, str]] = {
+        "items_time": "items (time)",
+        "items_score": "items (type, score)",
+        "items_by": "items (by, time)",
+        "items_domain": "items (domain, time)",
+        "items_parent": "items (parent)",
+    }
+    """The indexes used when querying the archive."""
+
+    def __init__(self, archive: Path | None = None) -> None:
+        """Initialise the archive.
+
+        Args:
+            archive: The path to the archive; defaults to the standard location.
+        """
+        self.path = archive or archive_file()
+        """The path to the archive."""
+        self._db: Connection = connect(self.path)
+        """The connection to the archive's database."""
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(self.SCHEMA)
+
+    def crawled(self, first: int, last: int) -> list[tuple[int, int]]:
+        """Get the ranges of IDs that have been crawled.
+
+        Args:
+            first: The first ID of interest.
+            last: The last ID of interest.
+
+        Returns:
+            The crawled ranges, merged and in order, as `(first, last)`.
+        """
+        merged: list[tuple[int, int]] = []
+        for start, end in self._db.execute(
+            "SELECT first, last FROM crawled WHERE last >= ? AND first <= ? ORDER BY first",
+            (first, last),
+        ):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def uncrawled(
+        self, first: int, last: int, chunk_size: int
+    ) -> Iterator[tuple[int, int]]:
+        """Get the chunks of a range of IDs that are still to be crawled.
+
+        Args:
+            first: The first ID of the range.
+            last: The last ID of the range.
+            chunk_size: The size of the chunks to break the range into.
+
+        Yields:
+            The first and last ID of each chunk still to be crawled.
+
+        Note:
+            Chunks are aligned to multiples of the chunk size, so the same
+            range always breaks into the same chunks; any part of a chunk
+            that has already been crawled is left out of it.
+        """
+        position = first
+        for start, end in [*self.crawled(first, last), (last + 1, last + 1)]:
+            # Break up the gap before this crawled range.
+            while position < start:
+                chunk_last = min(
+                    start - 1, (position // chunk_size + 1) * chunk_size - 1
+                )
+                yield position, chunk_last
+                position = chunk_last + 1
+            position = max(position, end + 1)
+
+    def store(self, first: int, last: int, items: Iterable[ArchivedItem]) -> None:
+        """Store the items found in a range of IDs.
+
+        Args:
+            first: The first ID of the range.
+            last: The last ID of the range.
+            items: The items found in the range.
+
+        Note:
+            The items are stored, and the range recorded as crawled, in a
+            single transaction.
+        """
+        with self._db:
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO items VALUES ({', '.join('?' * len(ArchivedItem._fields))})",
+                items,
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO crawled VALUES (?, ?)", (first, last)
+            )
+
+    def index(self) -> None:
+        """Make sure the archive is indexed for querying.
+
+        Note:
+            The indexes aren't made until the archive is first queried, so
+            that crawling isn't slowed down by having to keep them up to
+            date until they're actually wanted. Once made they're kept up to
+            date.
+        """
+        existing = {
+            name
+            for (name,) in self._db.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+        if missing := [name for name in self.INDEXES if name not in existing]:
+            with self._db:
+                for name in missing:
+                    self._db.execute(
+                        f"CREATE INDEX IF NOT EXISTS {name} ON {self.INDEXES[name]}"
+                    )
+            self._db.execute("ANALYZE")
+
+    def execute(self, sql: str, parameters: Sequence[Any] = ()) -> Cursor:
+        """Execute some SQL against the archive.
+
+        Args:
+            sql: The SQL to execute.
+            parameters: The parameters for the SQL.
+
+        Returns:
+            The cursor for the results.
+        """
+        return self._db.execute(sql, parameters)
+
+    def close(self) -> None:
+        """Close the archive."""
+        self._db.close()
+
+    def __enter__(self) -> "Archive":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+### store.py ends here
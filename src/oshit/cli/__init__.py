@@ -0,0 +1,8 @@
+"""Commands that can be run from the command line, without the application.
+
+Note:
+    The commands are imported as they're needed, so that running one
+    doesn't pay the cost of loading any of the others.
+"""
+
+### __init__.py ends here
@@ -0,0 +1,254 @@
+"""Command for crawling ranges of HackerNews items into the local archive."""
+
+##############################################################################
+# Python imports.
+from asyncio import FIRST_COMPLETED, Future, ensure_future, get_running_loop, wait
+from asyncio import run as run_async
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from sys import stderr
+from time import monotonic
+from typing import Awaitable, Callable, Iterator
+
+##############################################################################
+# Local imports.
+from ..app.data import load_configuration
+from ..archive import Archive, ArchivedItem, archived_item
+from ..hn import HN
+from ..hn.item import Item
+
+
+##############################################################################
+async def _fetch_chunk(client: HN, first: int, last: int) -> list[ArchivedItem]:
+    """Fetch all the items within a chunk of IDs.
+
+    Args:
+        client: The HackerNews client to fetch with.
+        first: The first ID of the chunk.
+        last: The last ID of the chunk.
+
+    Returns:
+        The items in the chunk, ready for archiving.
+    """
+    return [
+        archived_item(item)
+        for item in await client.items(Item, list(range(first, last + 1)))
+        if item.looks_valid
+    ]
+
+
+##############################################################################
+def _fetch_chunk_in_process(
+    first: int,
+    last: int,
+    max_concurrency: int,
+    timeout: int | None,
+    base_urls: list[str],
+) -> list[ArchivedItem]:
+    """Fetch all the items within a chunk of IDs, from a worker process.
+
+    Args:
+        first: The first ID of the chunk.
+        last: The last ID of the chunk.
+        max_concurrency: The maximum number of concurrent connections to use.
+        timeout: The timeout for an attempted connection.
+        base_urls: The bases of the URLs for the API.
+
+    Returns:
+        The items in the chunk, ready for archiving.
+    """
+    return run_async(
+        _fetch_chunk(
+            HN(max_concurrency=max_concurrency, timeout=timeout, base_urls=base_urls),
+            first,
+            last,
+        )
+    )
+
+
+##############################################################################
+class _Progress:
+    """Reports on the progress of a crawl."""
+
+    INTERVAL = 0.5
+    """The minimum time (in seconds) between reports."""
+
+    def __init__(self, to_crawl: int, already_crawled: int) -> None:
+        """Initialise the progress reporter.
+
+        Args:
+            to_crawl: The number of IDs to crawl.
+            already_crawled: The number of IDs crawled by earlier crawls.
+        """
+        self._to_crawl = to_crawl
+        """The number of IDs to crawl."""
+        self._already_crawled = already_crawled
+        """The number of IDs crawled by earlier crawls."""
+        self._crawled = already_crawled
+        """The number of IDs crawled so far."""
+        self._archived = 0
+        """The number of items archived so far."""
+        self._started = monotonic()
+        """The time at which the crawl started."""
+        self._reported = 0.0
+        """The time at which progress was last reported."""
+
+    def crawled(self, ids: int, items: int) -> None:
+        """Record that some IDs have been crawled.
+
+        Args:
+            ids: The number of IDs crawled.
+            items: The number of items that were archived.
+        """
+        self._crawled += ids
+        self._archived += items
+        if (now := monotonic()) - self._reported >= self.INTERVAL:
+            self._reported = now
+            self.report()
+
+    def report(self, end: str = "") -> None:
+        """Report on the progress.
+
+        Args:
+            end: The string to end the report with.
+        """
+        elapsed = monotonic() - self._started
+        rate = (self._crawled - self._already_crawled) / elapsed if elapsed else 0
+        print(
+            f"\r{self._crawled:,} of {self._to_crawl:,} IDs crawled "
+            f"({self._crawled / (self._to_crawl or 1):.1%}), "
+            f"{self._archived:,} items archived, "
+            f"{rate:,.0f} IDs/s",
+            end=end,
+            file=stderr,
+            flush=True,
+        )
+
+
+##############################################################################
+async def _crawl(
+    chunks: Iterator[tuple[int, int]],
+    fetch: Callable[[int, int], Awaitable[list[ArchivedItem]]],
+    in_flight: int,
+    archive: Archive,
+    progress: _Progress,
+) -> None:
+    """Crawl chunks of IDs, storing each one as soon as it's been fetched.
+
+    Args:
+        chunks: The chunks to crawl.
+        fetch: The function that fetches a chunk.
+        in_flight: The number of chunks to fetch at once.
+        archive: The archive to store the items in.
+        progress: The progress reporter.
+    """
+    fetching: dict[Future[list[ArchivedItem]], tuple[int, int]] = {}
+
+    def fetch_more() -> None:
+        for first, last in islice(chunks, in_flight - len(fetching)):
+            fetching[ensure_future(fetch(first, last))] = (first, last)
+
+    try:
+        fetch_more()
+        while fetching:
+            done, _ = await wait(fetching, return_when=FIRST_COMPLETED)
+            for fetched in done:
+                first, last = fetching.pop(fetched)
+                archive.store(first, last, items := fetched.result())
+                progress.crawled(last - first + 1, len(items))
+            fetch_more()
+    finally:
+        for fetched in fetching:
+            fetched.cancel()
+
+
+##############################################################################
+async def crawl(
+    first: int,
+    last: int | None,
+    archive: Path | None,
+    processes: int,
+    chunk_size: int,
+) -> int:
+    """Crawl a range of item IDs into the local archive.
+
+    Args:
+        first: The first ID to crawl.
+        last: The last ID to crawl; `None` means the current maximum ID.
+        archive: The path to the archive, or `None` for the default.
+        processes: The number of worker processes to fetch with.
+        chunk_size: The number of IDs to fetch and store at a time.
+
+    Returns:
+        The exit status for the command.
+
+    Note:
+        Each chunk of IDs is stored, and recorded as crawled, in a single
+        transaction; so if the crawl is interrupted, running it again will
+        carry on from where it stopped.
+
+        With more than one process, each worker process fetches whole
+        chunks with its own client, decoding and tidying the items there,
+        and the results are stored by the main process.
+    """
+    config = load_configuration()
+    client = HN(
+        max_concurrency=config.maximum_concurrency,
+        timeout=config.connection_timeout,
+        base_urls=config.api_base_urls,
+    )
+    try:
+        if last is None:
+            last = await client.max_item_id()
+    except HN.RequestError as error:
+        print(f"Unable to get the maximum item ID: {error}", file=stderr)
+        return 1
+    with Archive(archive) as store:
+        progress = _Progress(
+            last - first + 1,
+            sum(
+                min(last, crawled_last) - max(first, crawled_first) + 1
+                for crawled_first, crawled_last in store.crawled(first, last)
+            ),
+        )
+        chunks = store.uncrawled(first, last, chunk_size)
+        try:
+            if processes > 1:
+                with ProcessPoolExecutor(processes) as pool:
+                    per_process = max(1, config.maximum_concurrency // processes)
+                    await _crawl(
+                        chunks,
+                        lambda first, last: get_running_loop().run_in_executor(
+                            pool,
+                            _fetch_chunk_in_process,
+                            first,
+                            last,
+                            per_process,
+                            config.connection_timeout,
+                            config.api_base_urls,
+                        ),
+                        processes * 2,
+                        store,
+                        progress,
+                    )
+            else:
+                await _crawl(
+                    chunks,
+                    lambda first, last: _fetch_chunk(client, first, last),
+                    2,
+                    store,
+                    progress,
+                )
+        except HN.RequestError as error:
+            progress.report("\n")
+            print(
+                f"The crawl stopped: {error}\nRun it again to carry on from here.",
+                file=stderr,
+            )
+            return 1
+        progress.report("\n")
+    return 0
+
+
+### crawl.py ends here
@@ -0,0 +1,195 @@
+"""Commands for dumping HackerNews lists and threads to standard output."""
+
+##############################################################################
+# Python imports.
+from asyncio import Task, create_task
+from itertools import islice
+from sys import stderr
+from typing import Awaitable, Callable, Final, Iterable
+
+##############################################################################
+# Local imports.
+from ..app.data import load_configuration
+from ..hn import HN
+from ..hn.item import Item
+from .output import output
+
+##############################################################################
+LISTS: Final[dict[str, Callable[[HN, int | None], Awaitable[list[int]]]]] = {
+    "top": HN.top_story_ids,
+    "new": HN.new_story_ids,
+    "best": HN.best_story_ids,
+    "ask": HN.latest_ask_story_ids,
+    "show": HN.latest_show_story_ids,
+    "jobs": HN.latest_job_story_ids,
+}
+"""The lists that can be dumped, and the methods that get their IDs."""
+
+CSV_FIELDS: Final[tuple[str, ...]] = (
+    "id",
+    "type",
+    "by",
+    "time",
+    "parent",
+    "score",
+    "descendants",
+    "title",
+    "url",
+    "text",
+    "dead",
+    "deleted",
+)
+"""The fields of an item that are written when dumping as CSV or text."""
+
+
+##############################################################################
+class _Window:
+    """A bounded window of item fetches that are in flight.
+
+    Items are fetched ahead of when they're needed, but never more than
+    the size of the window at once; so the memory needed doesn't depend on
+    how many items are being dumped.
+    """
+
+    def __init__(self, client: HN, size: int) -> None:
+        """Initialise the window.
+
+        Args:
+            client: The HackerNews client to fetch the items with.
+            size: The maximum number of fetches to have in flight.
+        """
+        self._client = client
+        """The HackerNews client to fetch the items with."""
+        self._size = size
+        """The maximum number of fetches to have in flight."""
+        self._fetches: dict[int, Task[Item]] = {}
+        """The fetches that are in flight, keyed on item ID."""
+
+    def ahead(self, item_ids: Iterable[int]) -> None:
+        """Start fetching items that are going to be needed.
+
+        Args:
+            item_ids: The IDs of the items that will be needed, in the
+                order they'll be needed.
+        """
+        for item_id in islice(item_ids, self._size):
+            if len(self._fetches) >= self._size:
+                break
+            if item_id not in self._fetches:
+                self._fetches[item_id] = create_task(self._client.item(Item, item_id))
+
+    async def take(self, item_id: int) -> Item:
+        """Take an item, waiting for it if need be.
+
+        Args:
+            item_id: The ID of the item to take.
+
+        Returns:
+            The item.
+        """
+        if (fetch := self._fetches.pop(item_id, None)) is None:
+            return await self._client.item(Item, item_id)
+        return await fetch
+
+    def cancel(self) -> None:
+        """Cancel all the fetches that are in flight."""
+        for fetch in self._fetches.values():
+            fetch.cancel()
+        self._fetches.clear()
+
+
+##############################################################################
+def _client() -> tuple[HN, int]:
+    """Create a client for dumping with.
+
+    Returns:
+        The client, and the number of items to fetch at once.
+    """
+    config = load_configuration()
+    return (
+        HN(
+            max_concurrency=config.maximum_concurrency,
+            timeout=config.connection_timeout,
+            base_urls=config.api_base_urls,
+        ),
+        config.maximum_concurrency,
+    )
+
+
+##############################################################################
+async def dump_list(list_name: str, limit: int | None, output_format: str) -> int:
+    """Dump one of the lists of stories to standard output.
+
+    Args:
+        list_name: The name of the list to dump.
+        limit: The maximum number of stories to dump.
+        output_format: The format to dump the stories in.
+
+    Returns:
+        The exit status for the command.
+
+    Note:
+        The stories are written in the order they appear in the list, each
+        one as soon as it's arrived.
+    """
+    client, window_size = _client()
+    destination = output(output_format, CSV_FIELDS, flush=True)
+    window = _Window(client, window_size)
+    try:
+        item_ids = await LISTS[list_name](client, limit)
+        for position, item_id in enumerate(item_ids):
+            window.ahead(item_ids[position : position + window_size])
+            if (item := await window.take(item_id)).raw_data:
+                destination.write(item.raw_data)
+    except HN.RequestError as error:
+        print(f"Unable to dump the {list_name} stories: {error}", file=stderr)
+        return 1
+    finally:
+        window.cancel()
+    return 0
+
+
+##############################################################################
+async def dump_thread(item_id: int, output_format: str) -> int:
+    """Dump an item, and all the replies to it, to standard output.
+
+    Args:
+        item_id: The ID of the item to dump the thread of.
+        output_format: The format to dump the thread in.
+
+    Returns:
+        The exit status for the command.
+
+    Note:
+        The thread is written depth-first, in the order it would be read,
+        with the depth of each item added to its data. Only the IDs of the
+        items still to be written are held; the items themselves are
+        written as soon as they've arrived.
+    """
+    client, window_size = _client()
+    destination = output(output_format, (*CSV_FIELDS, "depth"), flush=True)
+    window = _Window(client, window_size)
+    # The items still to write, as (depth, ID), with the next at the end.
+    pending = [(0, item_id)]
+    try:
+        while pending:
+            depth, next_id = pending.pop()
+            window.ahead(pending_id for _, pending_id in reversed(pending))
+            if not (item := await window.take(next_id)).raw_data:
+                if not depth:
+                    print(f"There is no item with the ID {item_id}", file=stderr)
+                    return 1
+                continue
+            destination.write({**item.raw_data, "depth": depth})
+            pending.extend(
+                (depth + 1, kid) for kid in reversed(item.raw_data.get("kids", []))
+            )
+    except HN.RequestError as error:
+        print(f"Unable to dump the thread of {item_id}: {error}", file=stderr)
+        return 1
+    finally:
+        window.cancel()
+    return 0
+
+
+### dump.py ends here
@@ -0,0 +1,114 @@
+"""Code for writing records to standard output, in a choice of formats."""
+
+##############################################################################
+# Python imports.
+from csv import DictWriter
+from json import dumps
+from sys import stdout
+from typing import Any, Final, Protocol, Sequence
+
+##############################################################################
+FORMATS: Final[tuple[str, ...]] = ("jsonl", "csv", "text")
+"""The formats that records can be written in."""
+
+
+##############################################################################
+class Output(Protocol):
+    """The protocol for a destination for records."""
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Write a record.
+
+        Args:
+            record: The record to write.
+        """
+
+
+##############################################################################
+class JSONLines:
+    """Writes records as JSON, one per line."""
+
+    def __init__(self, flush: bool) -> None:
+        """Initialise the JSON lines output.
+
+        Args:
+            flush: Should the output be flushed after each record?
+        """
+        self._flush = flush
+        """Should the output be flushed after each record?"""
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Write a record.
+
+        Args:
+            record: The record to write.
+        """
+        stdout.write(f"{dumps(record)}\n")
+        if self._flush:
+            stdout.flush()
+
+
+##############################################################################
+class CSV:
+    """Writes records as CSV, with a header line."""
+
+    DIALECT = "excel"
+    """The CSV dialect to write with."""
+
+    def __init__(self, fields: Sequence[str], flush: bool) -> None:
+        """Initialise the CSV output.
+
+        Args:
+            fields: The fields of the records to write.
+            flush: Should the output be flushed after each record?
+        """
+        self._writer = DictWriter(
+            stdout, fields, extrasaction="ignore", dialect=self.DIALECT
+        )
+        """The CSV writer."""
+        self._flush = flush
+        """Should the output be flushed after each record?"""
+        self._writer.writeheader()
+
+    def write(self, record: dict[str, Any]) -> None:
+        """Write a record.
+
+        Args:
+            record: The record to write.
+        """
+        self._writer.writerow(record)
+        if self._flush:
+            stdout.flush()
+
+
+##############################################################################
+class Text(CSV):
+    """Writes records as tab-separated text, with a header line."""
+
+    DIALECT = "excel-tab"
+
+
+##############################################################################
+def output(output_format: str, fields: Sequence[str], flush: bool = False) -> Output:
+    """Create an output for the given format.
+
+    Args:
+        output_format: The format to write in.
+        fields: The fields of the records to write.
+        flush: Should the output be flushed after each record?
+
+    Returns:
+        The output.
+
+    Note:
+        JSON lines output writes every field of a record, the other formats
+        only write the given fields.
+    """
+    if output_format == "csv":
+        return CSV(fields, flush)
+    if output_format == "text":
+        return Text(fields, flush)
+    return JSONLines(flush)
+
+
+### output.py ends here
@@ -0,0 +1,55 @@
+"""Command for querying the local archive."""
+
+##############################################################################
+# Python imports.
+from pathlib import Path
+from sqlite3 import Cursor
+from sqlite3 import Error as SQLiteError
+from sys import stderr
+from typing import Callable
+
+##############################################################################
+# Local imports.
+from ..archive import Archive, archive_file
+from .output import output
+
+
+##############################################################################
+def query(
+    archive: Path | None, output_format: str, run: Callable[[Archive], Cursor]
+) -> int:
+    """Query the local archive, writing the results to standard output.
+
+    Args:
+        archive: The path to the archive, or `None` for the default.
+        output_format: The format to write the results in.
+        run: The function that runs the query.
+
+    Returns:
+        The exit status for the command.
+
+    Note:
+        The results are written as they're read, so they don't all need to
+        be held in memory at once.
+    """
+    if not (archive := archive or archive_file()).exists():
+        print(
+            f"There is no archive at {archive}; use `oshit crawl` to create one",
+            file=stderr,
+        )
+        return 1
+    with Archive(archive) as store:
+        try:
+            store.index()
+            results = run(store)
+            columns = [column[0] for column in results.description or ()]
+            destination = output(output_format, columns)
+            for row in results:
+                destination.write(dict(zip(columns, row)))
+        except SQLiteError as error:
+            print(f"Unable to query the archive: {error}", file=stderr)
+            return 1
+    return 0
+
+
+### query.py ends here
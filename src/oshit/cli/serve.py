@@ -0,0 +1,174 @@
+"""Command for serving the HackerNews API locally, from a shared cache."""
+
+##############################################################################
+# Python imports.
+from asyncio import (
+    IncompleteReadError,
+    LimitOverrunError,
+    StreamReader,
+    StreamWriter,
+    start_server,
+)
+from json import dumps
+from sys import stderr
+from typing import Final
+
+##############################################################################
+# Local imports.
+from ..app.data import load_configuration
+from ..hn import HN
+
+##############################################################################
+PREFIX: Final[str] = "/v0/"
+"""The prefix of the paths that are served."""
+
+REASONS: Final[dict[int, str]] = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    502: "Bad Gateway",
+}
+"""The reasons given for the status codes that are used."""
+
+
+##############################################################################
+class _Server:
+    """A server of the HackerNews API, answering from a shared cache.
+
+    Every request is answered from the cache of a single client, so
+    identical requests from any number of callers that arrive at the same
+    time are coalesced into one upstream request. Data that's too old is
+    still served at once, while it's refreshed from upstream in the
+    background.
+    """
+
+    def __init__(self, client: HN, ttl: float, list_ttl: float) -> None:
+        """Initialise the server.
+
+        Args:
+            client: The HackerNews client to answer requests with.
+            ttl: The time (in seconds) to serve items and users before
+                refreshing them.
+            list_ttl: The time (in seconds) to serve lists before
+                refreshing them.
+        """
+        self._client = client
+        """The HackerNews client to answer requests with."""
+        self._ttl = ttl
+        """The time to serve items and users before refreshing them."""
+        self._list_ttl = list_ttl
+        """The time to serve lists before refreshing them."""
+
+    async def _answer(self, method: str, target: str) -> tuple[int, str]:
+        """Answer a request.
+
+        Args:
+            method: The method of the request.
+            target: The target of the request.
+
+        Returns:
+            The status code and the body of the response.
+        """
+        if method != "GET":
+            return 405, dumps({"error": f"{method} is not supported"})
+        path = target.partition("?")[0]
+        if not (path.startswith(PREFIX) and path.endswith(".json")):
+            return 404, dumps({"error": f"{path} is not part of the API"})
+        path = path.removeprefix(PREFIX)
+        try:
+            return 200, dumps(
+                await self._client.data(
+                    path,
+                    self._ttl if "/" in path else self._list_ttl,
+                    refresh_in_background=True,
+                )
+            )
+        except HN.RequestError as error:
+            return 502, dumps({"error": str(error)})
+
+    async def handle(self, reader: StreamReader, writer: StreamWriter) -> None:
+        """Handle a connection to the server.
+
+        Args:
+            reader: The reader for the connection.
+            writer: The writer for the connection.
+        """
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                request_line, *headers = request.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split()
+                except ValueError:
+                    status, body = 400, dumps({"error": "Malformed request"})
+                    version = "HTTP/1.0"
+                else:
+                    status, body = await self._answer(method, target)
+                keep_alive = version == "HTTP/1.1" and not any(
+                    header.lower().replace(" ", "") == "connection:close"
+                    for header in headers
+                )
+                content = body.encode()
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                        "Content-Type: application/json; charset=utf-8\r\n"
+                        f"Content-Length: {len(content)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                        "\r\n"
+                    ).encode()
+                    + content
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (IncompleteReadError, LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+##############################################################################
+async def serve(host: str, port: int, ttl: float | None, list_ttl: float) -> int:
+    """Serve the HackerNews API locally.
+
+    Args:
+        host: The host to serve on.
+        port: The port to serve on.
+        ttl: The time (in seconds) to serve items and users before
+            refreshing them; defaults to the configured item cache TTL.
+        list_ttl: The time (in seconds) to serve lists before refreshing
+            them.
+
+    Returns:
+        The exit status for the command.
+
+    Note:
+        The API is served with the same paths as the real API, so any
+        client (including other instances of OSHit, via `api_base_urls`)
+        can be pointed at it.
+    """
+    config = load_configuration()
+    server = _Server(
+        HN(
+            max_concurrency=config.maximum_concurrency,
+            timeout=config.connection_timeout,
+            cache_ttl=config.item_cache_ttl,
+            base_urls=config.api_base_urls,
+        ),
+        config.item_cache_ttl if ttl is None else ttl,
+        list_ttl,
+    )
+    try:
+        listener = await start_server(server.handle, host, port)
+    except OSError as error:
+        print(f"Unable to serve on {host}:{port}: {error}", file=stderr)
+        return 1
+    print(f"Serving the HackerNews API at http://{host}:{port}{PREFIX}", file=stderr)
+    async with listener:
+        await listener.serve_forever()
+    return 0
+
+
+### serve.py ends here
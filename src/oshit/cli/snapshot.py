@@ -0,0 +1,144 @@
+"""Command for creating an offline bundle of HackerNews data."""
+
+##############################################################################
+# Python imports.
+from asyncio import gather
+from json import dumps
+from pathlib import Path
+from sys import stderr
+from typing import Awaitable, Callable, Final, Sequence
+
+##############################################################################
+# Local imports.
+from ..app.data import load_configuration
+from ..hn import HN, BundleWriter
+from ..hn.item import Article, Item, Job, ParentItem, Poll, Story
+
+##############################################################################
+IdList = Callable[[HN, int], Awaitable[list[int]]]
+"""The type of a method that gets a list of IDs."""
+
+TABS: Final[tuple[tuple[str, IdList, type[Item], str], ...]] = (
+    ("topstories.json", HN.top_story_ids, Article, "maximum_top"),
+    ("newstories.json", HN.new_story_ids, Article, "maximum_new"),
+    ("beststories.json", HN.best_story_ids, Article, "maximum_best"),
+    ("askstories.json", HN.latest_ask_story_ids, Story, "maximum_ask"),
+    ("showstories.json", HN.latest_show_story_ids, Story, "maximum_show"),
+    ("jobstories.json", HN.latest_job_story_ids, Job, "maximum_jobs"),
+)
+"""The API path, ID list method, item type and maximum setting of each tab."""
+
+
+##############################################################################
+class _Snapshot:
+    """Gathers HackerNews data into a bundle."""
+
+    def __init__(self, client: HN, bundle: BundleWriter) -> None:
+        """Initialise the snapshot.
+
+        Args:
+            client: The HackerNews client to gather the data with.
+            bundle: The bundle to write the data to.
+        """
+        self._client = client
+        """The HackerNews client to gather the data with."""
+        self._bundle = bundle
+        """The bundle to write the data to."""
+        self.failed_threads = 0
+        """The number of threads that couldn't be gathered."""
+
+    def _record(self, items: Sequence[Item]) -> None:
+        """Record some items in the bundle.
+
+        Args:
+            items: The items to record.
+        """
+        for item in items:
+            if (path := f"item/{item.item_id}.json") not in self._bundle:
+                self._bundle.add(path, dumps(item.raw_data))
+
+    async def tab(
+        self, path: str, id_list: IdList, item_type: type[Item], max_count: int
+    ) -> list[Item]:
+        """Gather the content of a tab.
+
+        Args:
+            path: The API path of the list of IDs for the tab.
+            id_list: The method that gets the list of IDs for the tab.
+            item_type: The type of the items in the tab.
+            max_count: The maximum number of items in the tab.
+
+        Returns:
+            The items in the tab.
+        """
+        item_ids = await id_list(self._client, max_count)
+        self._bundle.add(path, dumps(item_ids))
+        self._record(items := await self._client.items(item_type, item_ids))
+        return items
+
+    async def _replies(self, parent: ParentItem) -> None:
+        """Gather all the replies to an item, and all their replies, etc.
+
+        Args:
+            parent: The item to gather the replies to.
+        """
+        self._record(comments := await self._client.comments(parent))
+        if isinstance(parent, Poll):
+            self._record(await self._client.poll_options(parent))
+        await gather(*[self._replies(comment) for comment in comments if comment.kids])
+
+    async def thread(self, article: Item) -> None:
+        """Gather the full thread for an article.
+
+        Args:
+            article: The article to gather the thread of.
+        """
+        if not isinstance(article, ParentItem):
+            return
+        try:
+            await self._replies(article)
+        except HN.RequestError:
+            self.failed_threads += 1
+
+
+##############################################################################
+async def create_snapshot(bundle: Path, threads: int) -> int:
+    """Create an offline bundle of the tabs, and the threads of the top stories.
+
+    Args:
+        bundle: The path of the bundle to create.
+        threads: The number of top stories to gather the full threads of.
+
+    Returns:
+        The exit status for the command.
+    """
+    config = load_configuration()
+    client = HN(
+        max_concurrency=config.maximum_concurrency,
+        timeout=config.connection_timeout,
+        base_urls=config.api_base_urls,
+    )
+    try:
+        with BundleWriter(bundle) as writer:
+            snapshot = _Snapshot(client, writer)
+            top, *_ = await gather(
+                *[
+                    snapshot.tab(path, id_list, item_type, getattr(config, maximum))
+                    for path, id_list, item_type, maximum in TABS
+                ]
+            )
+            await gather(*[snapshot.thread(article) for article in top[:threads]])
+    except HN.RequestError as error:
+        bundle.unlink(missing_ok=True)
+        print(f"Unable to create the bundle: {error}", file=stderr)
+        return 1
+    print(f"Wrote {len(writer)} responses to {bundle}", file=stderr)
+    if snapshot.failed_threads:
+        print(
+            f"{snapshot.failed_threads} of the threads couldn't be gathered",
+            file=stderr,
+        )
+    return 0
+
+
+### snapshot.py ends here
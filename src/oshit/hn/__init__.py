@@ -2,10 +2,21 @@
 
 ##############################################################################
 # Local imports.
+from .bundle import Bundle, BundleWriter
 from .client import HN
+from .scheduler import ClassStatistics, Priority, Scheduler
+from .warmer import CacheWarmer
 
 ##############################################################################
 # Exports.
-__all__ = ["HN"]
+__all__ = [
+    "Bundle",
+    "BundleWriter",
+    "CacheWarmer",
+    "ClassStatistics",
+    "HN",
+    "Priority",
+    "Scheduler",
+]
 
 ### __init__.py ends here
@@ -0,0 +1,188 @@
+"""Code for reading and writing offline bundles of HackerNews data.
+
+A bundle is a single file that holds the responses to a set of calls to
+the HackerNews API, keyed on the path of the call. Each response is
+compressed on its own, and an index of where each response lives is
+written at the end of the file, so that looking up one response only
+needs the index and that one response to be read.
+
+The layout of a bundle is:
+
+- The magic bytes.
+- The compressed responses, one after the other.
+- The compressed index, a JSON object that maps each path to the offset
+  and length of its response.
+- A footer that holds the offset and length of the index, followed by
+  the magic bytes again.
+"""
+
+##############################################################################
+# Python imports.
+from json import dumps, loads
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from struct import Struct
+from types import TracebackType
+from typing import BinaryIO, Final
+from zlib import compress, decompress
+from zlib import error as ZlibError
+
+##############################################################################
+MAGIC: Final[bytes] = b"OSHITBN1"
+"""The magic bytes that start and end a bundle."""
+
+_FOOTER: Final[Struct] = Struct(f"<QQ{len(MAGIC)}s")
+"""The layout of the footer of a bundle."""
+
+
+##############################################################################
+class BundleWriter:
+    """Writes API responses to a bundle.
+
+    Responses are written to the file as they're added, so only the index
+    is held in memory.
+    """
+
+    def __init__(self, bundle: Path) -> None:
+        """Initialise the bundle writer.
+
+        Args:
+            bundle: The path to the bundle to write.
+        """
+        self._file: BinaryIO = bundle.open("wb")
+        """The file the bundle is being written to."""
+        self._file.write(MAGIC)
+        self._index: dict[str, tuple[int, int]] = {}
+        """The offset and length of each response, keyed on path."""
+
+    def add(self, path: str, response: str) -> None:
+        """Add an API response to the bundle.
+
+        Args:
+            path: The path of the API call.
+            response: The text of the response.
+
+        Note:
+            If a response for the path has already been added, the new
+            response replaces it.
+        """
+        data = compress(response.encode("utf-8"))
+        self._index[path] = (self._file.tell(), len(data))
+        self._file.write(data)
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def close(self) -> None:
+        """Finish writing the bundle."""
+        if self._file.closed:
+            return
+        index = compress(dumps(self._index).encode("utf-8"))
+        offset = self._file.tell()
+        self._file.write(index)
+        self._file.write(_FOOTER.pack(offset, len(index), MAGIC))
+        self._file.close()
+
+    def __enter__(self) -> "BundleWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+##############################################################################
+class Bundle:
+    """Provides read access to a bundle of API responses.
+
+    The bundle is memory-mapped, and only the index is loaded when the
+    bundle is opened; each response is only read and decompressed when
+    it's asked for.
+    """
+
+    class Error(Exception):
+        """Exception raised if a bundle can't be read."""
+
+    def __init__(self, bundle: Path) -> None:
+        """Initialise the bundle.
+
+        Args:
+            bundle: The path to the bundle to read.
+
+        Raises:
+            Bundle.Error: If the file isn't a usable bundle.
+        """
+        self.path = bundle
+        """The path to the bundle."""
+        try:
+            with bundle.open("rb") as source:
+                self._data = mmap(source.fileno(), 0, access=ACCESS_READ)
+        except (OSError, ValueError) as error:
+            raise self.Error(f"Unable to open {bundle}: {error}") from None
+        self._index = self._load_index()
+        """The offset and length of each response, keyed on path."""
+
+    def _load_index(self) -> dict[str, tuple[int, int]]:
+        """Load the index of the bundle.
+
+        Returns:
+            The offset and length of each response, keyed on path.
+
+        Raises:
+            Bundle.Error: If the file isn't a usable bundle.
+        """
+        if (
+            len(self._data) < len(MAGIC) + _FOOTER.size
+            or self._data[: len(MAGIC)] != MAGIC
+        ):
+            raise self.Error(f"{self.path} is not an OSHit bundle")
+        offset, length, magic = _FOOTER.unpack_from(
+            self._data, len(self._data) - _FOOTER.size
+        )
+        if magic != MAGIC:
+            raise self.Error(f"{self.path} is incomplete")
+        try:
+            return {
+                path: (start, size)
+                for path, (start, size) in loads(
+                    decompress(self._data[offset : offset + length])
+                ).items()
+            }
+        except (ZlibError, ValueError) as error:
+            raise self.Error(f"The index of {self.path} is damaged: {error}")
+
+    def get(self, path: str) -> str | None:
+        """Get the response to an API call.
+
+        Args:
+            path: The path of the API call.
+
+        Returns:
+            The text of the response, or `None` if it isn't in the bundle.
+
+        Raises:
+            Bundle.Error: If the response is damaged.
+        """
+        if (location := self._index.get(path)) is None:
+            return None
+        offset, length = location
+        try:
+            return decompress(self._data[offset : offset + length]).decode("utf-8")
+        except (ZlibError, UnicodeDecodeError) as error:
+            raise self.Error(f"The response for {path} is damaged: {error}")
+
+    def __contains__(self, path: str) -> bool:
+        return path in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+### bundle.py ends here
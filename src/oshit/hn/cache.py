@@ -0,0 +1,92 @@
+"""A cache for data pulled from the HackerNews API."""
+
+##############################################################################
+# Python imports.
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import time
+from typing import Any
+
+
+##############################################################################
+@dataclass(frozen=True)
+class CacheEntry:
+    """An entry in the cache."""
+
+    data: Any
+    """The data that was returned by the API."""
+
+    fetched: float
+    """The time at which the data was fetched."""
+
+    @property
+    def age(self) -> float:
+        """The age of the entry, in seconds."""
+        return time() - self.fetched
+
+
+##############################################################################
+class Cache:
+    """A size-limited, least-recently-used, cache of API data.
+
+    The cache is keyed on the path of the API call that returned the data.
+    """
+
+    def __init__(self, max_size: int = 20_000) -> None:
+        """Initialise the cache.
+
+        Args:
+            max_size: The maximum number of entries to hold in the cache.
+        """
+        self._max_size = max_size
+        """The maximum number of entries to hold in the cache."""
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        """The entries in the cache."""
+
+    def get(self, key: str, max_age: float | None = None) -> CacheEntry | None:
+        """Get an entry from the cache.
+
+        Args:
+            key: The key of the entry to get.
+            max_age: The maximum age (in seconds) of entry to accept.
+
+        Returns:
+            The entry, or `None` if there isn't one or it's too old.
+
+        Note:
+            If `max_age` is `None` an entry of any age will be returned.
+        """
+        if (entry := self._entries.get(key)) is None:
+            return None
+        if max_age is not None and entry.age > max_age:
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, data: Any, fetched: float | None = None) -> CacheEntry:
+        """Put some data into the cache.
+
+        Args:
+            key: The key to store the data under.
+            data: The data to store.
+            fetched: The time the data was fetched; defaults to now.
+
+        Returns:
+            The new cache entry.
+        """
+        entry = self._entries[key] = CacheEntry(
+            data, time() if fetched is None else fetched
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+        return entry
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+### cache.py ends here
@@ -2,17 +2,24 @@
 
 ##############################################################################
 # Python imports.
-from asyncio import Semaphore, gather
+from asyncio import Task, create_task, gather, sleep
+from contextlib import suppress
+from functools import partial
 from json import loads
 from ssl import SSLCertVerificationError
-from typing import Any, Final, cast
+from time import monotonic
+from typing import Any, Callable, Final, Iterable, Sequence, cast
 
 ##############################################################################
 # HTTPX imports.
-from httpx import AsyncClient, HTTPStatusError, RequestError
+from httpx import AsyncClient, HTTPStatusError, RequestError, Response
 
 ##############################################################################
 # Local imports.
+from .bundle import Bundle
+from .cache import Cache
+from .coalesce import Coalescer
+from .endpoints import Endpoints
 from .item import (
     Article,
     Comment,
@@ -24,6 +31,7 @@ from .item import (
     PollOption,
     Story,
 )
+from .scheduler import Priority, Scheduler
 from .user import User
 
 
@@ -35,7 +43,7 @@ class HN:
     """The agent string to use when talking to the API."""
 
     _BASE: Final[str] = "https://hacker-news.firebaseio.com/v0/"
-    """The base of the URL for the API."""
+    """The default base of the URL for the API."""
 
     class Error(Exception):
         """Base class for HackerNews errors."""
@@ -43,22 +51,78 @@ class HN:
     class RequestError(Error):
         """Exception raised if there was a problem making an API request."""
 
+    class Disconnected(RequestError):
+        """Exception raised if a call is made while the API can't be reached."""
+
     class NoSuchUser(Error):
         """Exception raised if no such user exists."""
 
-    def __init__(self, max_concurrency: int = 50, timeout: int | None = 5) -> None:
+    class NoSuchItem(Error):
+        """Exception raised if no such item exists."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 50,
+        timeout: int | None = 5,
+        cache_ttl: float = 60,
+        user_cache_ttl: float = 600,
+        base_urls: Sequence[str] | None = None,
+        bundle: Bundle | None = None,
+        failure_threshold: int = 3,
+        probe_interval: float = 10,
+    ) -> None:
         """Initialise the API client object.
 
         Args:
             max_concurrency: The maximum number of concurrent connections to use.
             timeout: The timeout for an attempted connection.
+            cache_ttl: The time (in seconds) for which a cached item is used.
+            user_cache_ttl: The time (in seconds) for which a cached user is
+                used.
+            base_urls: The bases of the URLs for the API, in order of
+                preference; defaults to HackerNews itself.
+            bundle: An offline bundle to serve all calls from.
+            failure_threshold: The number of failures to connect in a row
+                after which the API is considered unreachable.
+            probe_interval: The time (in seconds) between checks to see if
+                an unreachable API can be reached again; this is also the
+                least time an endpoint that fails is rested for.
+
+        Note:
+            If a bundle is given, the API itself is never called.
         """
         self._client_: AsyncClient | None = None
         """The HTTPX client."""
-        self._max_concurrency = max_concurrency
-        """The maximum number of concurrent connections to use."""
+        self._endpoints = Endpoints(base_urls or [self._BASE], probe_interval)
+        """The endpoints that serve the API."""
+        self._scheduler = Scheduler(max_concurrency)
+        """The scheduler for all the calls made to the API."""
         self._timeout = timeout
         """The timeout to use on connections."""
+        self._cache = Cache()
+        """The cache of data pulled from the API."""
+        self._cache_ttl = cache_ttl
+        """The time (in seconds) for which a cached item is used."""
+        self._user_cache_ttl = user_cache_ttl
+        """The time (in seconds) for which a cached user is used."""
+        self._fetches: Coalescer[Any] = Coalescer()
+        """Coalesces identical fetches of data that are in flight at once."""
+        self._fetch_priorities: dict[str, Priority] = {}
+        """The priority each fetch in flight should have, keyed on path."""
+        self._refreshes: set[Task[None]] = set()
+        """The refreshes of cached data that are running in the background."""
+        self._bundle = bundle
+        """The offline bundle to serve all calls from, if there is one."""
+        self._failure_threshold = failure_threshold
+        """The number of connection failures in a row that mean we're disconnected."""
+        self._probe_interval = probe_interval
+        """The time (in seconds) between checks for the API being reachable again."""
+        self._failures = 0
+        """The number of connection failures in a row."""
+        self._probe: Task[None] | None = None
+        """The task checking for the API being reachable again, if disconnected."""
+        self._connection_watchers: list[Callable[[bool], None]] = []
+        """The functions to call when the state of the connection changes."""
 
     @property
     def _client(self) -> AsyncClient:
@@ -67,36 +131,152 @@ class HN:
             self._client_ = AsyncClient()
         return self._client_
 
-    def _api_url(self, *path: str) -> str:
-        """Construct a URL for calling on the API.
+    @property
+    def scheduler(self) -> Scheduler:
+        """The scheduler used for all calls made to the API."""
+        return self._scheduler
+
+    @property
+    def offline(self) -> bool:
+        """Is the client serving everything from an offline bundle?"""
+        return self._bundle is not None
+
+    @property
+    def connected(self) -> bool:
+        """Can the API be reached?
+
+        Note:
+            After a number of failures to connect in a row, the API is
+            considered unreachable. While it is, every call fails right
+            away, rather than waiting to time out, and cached data of any
+            age is used when there is some. The API is checked every so
+            often, and is considered reachable again as soon as it answers.
+        """
+        return self._probe is None
+
+    def watch_connection(self, watcher: Callable[[bool], None]) -> None:
+        """Add a function to call when the state of the connection changes.
 
         Args:
-            *path: The path to the endpoint.
+            watcher: The function to call.
 
-        Returns:
-            The URL to use.
+        Note:
+            The function is called with the new value of `connected`.
         """
-        return f"{self._BASE}{'/'.join(path)}"
+        self._connection_watchers.append(watcher)
+
+    def _connection_changed(self) -> None:
+        """Tell everyone watching that the state of the connection has changed."""
+        for watcher in self._connection_watchers:
+            watcher(self.connected)
+
+    def _check_connected(self) -> None:
+        """Check that the API can be reached.
+
+        Raises:
+            HN.Disconnected: If the API can't be reached at the moment.
+        """
+        if not self.connected:
+            raise self.Disconnected("HackerNews can't be reached at the moment")
+
+    def _connection_failed(self) -> None:
+        """Record a failure to connect to the API."""
+        self._failures += 1
+        if self._failures >= self._failure_threshold and self.connected:
+            self._probe = create_task(self._wait_for_connection())
+            self._connection_changed()
+
+    async def _wait_for_connection(self) -> None:
+        """Check the API every so often until it can be reached again."""
+        while True:
+            await sleep(self._probe_interval)
+            try:
+                (await self._request("maxitem.json", {})).raise_for_status()
+            except (RequestError, SSLCertVerificationError, HTTPStatusError):
+                continue
+            break
+        self._failures = 0
+        self._probe = None
+        self._connection_changed()
+
+    async def _request(self, path: str, params: dict[str, str]) -> Response:
+        """Make a request of the API, failing over between endpoints.
+
+        Args:
+            path: The path for the API call.
+            params: The parameters for the call.
+
+        Returns:
+            The response.
 
-    async def _call(self, *path: str, **params: str) -> str:
-        """Call on the Pinboard API.
+        Raises:
+            RequestError: If no endpoint could be reached.
+            SSLCertVerificationError: If no endpoint could be reached.
+
+        Note:
+            The endpoints are tried best first. An endpoint that can't be
+            reached, or that answers with a server error, is recorded as
+            having failed and the next one is tried. If every endpoint
+            fails, the last server error is returned if there was one;
+            otherwise the last failure to connect is raised.
+        """
+        failure: RequestError | SSLCertVerificationError | None = None
+        response: Response | None = None
+        for endpoint in self._endpoints:
+            started = monotonic()
+            try:
+                response = await self._client.get(
+                    f"{endpoint.base_url}{path}",
+                    params=params,
+                    headers={"user-agent": self.AGENT},
+                    timeout=self._timeout,
+                )
+            except (RequestError, SSLCertVerificationError) as error:
+                failure = error
+                self._endpoints.failed(endpoint)
+                continue
+            if response.is_server_error:
+                self._endpoints.failed(endpoint)
+                continue
+            self._endpoints.succeeded(endpoint, monotonic() - started)
+            return response
+        if response is not None:
+            return response
+        assert failure is not None
+        raise failure
+
+    async def _call(
+        self,
+        *path: str,
+        priority: Priority = Priority.FOREGROUND,
+        key: str | None = None,
+        **params: str,
+    ) -> str:
+        """Call on the HackerNews API.
 
         Args:
             path: The path for the API call.
+            priority: The priority of the call.
+            key: The key to give the call in the scheduler, so its priority
+                can be raised while it waits.
             params: The parameters for the call.
 
         Returns:
             The text returned from the call.
         """
+        if self._bundle is not None:
+            return self._offline_call("/".join(path))
+
+        self._check_connected()
         try:
-            response = await self._client.get(
-                self._api_url(*path),
-                params=params,
-                headers={"user-agent": self.AGENT},
-                timeout=self._timeout,
-            )
+            async with self._scheduler.slot(priority, key):
+                # The connection may have been lost while we were waiting.
+                self._check_connected()
+                response = await self._request("/".join(path), params)
         except (RequestError, SSLCertVerificationError) as error:
+            self._connection_failed()
             raise self.RequestError(str(error))
+        self._failures = 0
 
         try:
             response.raise_for_status()
@@ -105,6 +285,43 @@ class HN:
 
         return response.text
 
+    def _offline_call(self, path: str) -> str:
+        """Serve a call from the offline bundle.
+
+        Args:
+            path: The path for the API call.
+
+        Returns:
+            The text of the response held in the bundle.
+        """
+        assert self._bundle is not None
+        try:
+            if (response := self._bundle.get(path)) is None:
+                raise self.RequestError(f"{path} isn't in the offline bundle")
+        except Bundle.Error as error:
+            raise self.RequestError(str(error))
+        return response
+
+    async def warm_up(self, connections: int = 4) -> None:
+        """Warm up connections to the API.
+
+        Args:
+            connections: The number of connections to warm up.
+
+        Note:
+            Any problem connecting is ignored; it will be reported when a
+            connection is actually needed.
+        """
+        if self.offline:
+            return
+        await gather(
+            *[
+                self._call("maxitem.json", priority=Priority.ACTIVE_TAB)
+                for _ in range(connections)
+            ],
+            return_exceptions=True,
+        )
+
     async def max_item_id(self) -> int:
         """Get the current maximum item ID.
 
@@ -113,30 +330,213 @@ class HN:
         """
         return int(loads(await self._call("maxitem.json")))
 
-    async def _raw_item(self, item_id: int) -> dict[str, Any]:
+    async def _fetch_into_cache(self, path: str) -> Any:
+        """Fetch some data from the API and place it in the cache.
+
+        Args:
+            path: The path of the data to fetch.
+
+        Returns:
+            The data that was fetched.
+
+        Note:
+            If there's no data at the path it isn't cached; it might be
+            something that doesn't exist *yet*, such as a brand new item.
+
+            The fetch is made at the highest priority asked for by anyone
+            waiting on it; see `_share_fetch`.
+        """
+        try:
+            data = loads(
+                await self._call(
+                    path,
+                    priority=self._fetch_priorities.get(path, Priority.FOREGROUND),
+                    key=path,
+                )
+            )
+        finally:
+            self._fetch_priorities.pop(path, None)
+        if data is not None:
+            self._cache.put(path, data)
+        return data
+
+    async def _share_fetch(self, path: str, priority: Priority) -> Any:
+        """Fetch some data, sharing any fetch of it that's already in flight.
+
+        Args:
+            path: The path of the data to fetch.
+            priority: The priority of the call.
+
+        Returns:
+            The data that was fetched.
+
+        Note:
+            If the fetch being joined was started at a lower priority, and
+            is still waiting to run, it's moved up to the given priority;
+            so something urgent never ends up stuck behind a prefetch.
+        """
+        if path not in self._fetches:
+            # Nothing to share, so start afresh.
+            self._fetch_priorities.pop(path, None)
+        if (wanted := self._fetch_priorities.get(path)) is None or priority < wanted:
+            self._fetch_priorities[path] = priority
+            self._scheduler.escalate(path, priority)
+        return await self._fetches.run(path, partial(self._fetch_into_cache, path))
+
+    async def _refresh(self, path: str, priority: Priority) -> None:
+        """Refresh some cached data.
+
+        Args:
+            path: The path of the data to refresh.
+            priority: The priority of the call.
+
+        Note:
+            Any problem refreshing the data is ignored; the cached data
+            stays as it is.
+        """
+        with suppress(self.RequestError):
+            await self._share_fetch(path, priority)
+
+    def _refresh_in_background(self, path: str, priority: Priority) -> None:
+        """Start refreshing some cached data in the background.
+
+        Args:
+            path: The path of the data to refresh.
+            priority: The priority of the call.
+        """
+        if path not in self._fetches:
+            self._refreshes.add(refresh := create_task(self._refresh(path, priority)))
+            refresh.add_done_callback(self._refreshes.discard)
+
+    async def _get(
+        self,
+        path: str,
+        priority: Priority,
+        max_age: float,
+        refresh_in_background: bool = False,
+    ) -> Any:
+        """Get some data from the API, using the cache where possible.
+
+        Args:
+            path: The path of the data to get.
+            priority: The priority of the call.
+            max_age: The maximum age (in seconds) of cached data to use.
+            refresh_in_background: Use cached data that's too old, while
+                refreshing it in the background?
+
+        Returns:
+            The data.
+
+        Note:
+            The data is cached as soon as it arrives, so even if the caller
+            gives up on it (perhaps because it was cancelled) any data that
+            did arrive won't need to be fetched again. If the data is
+            already being fetched for another caller, that fetch is shared
+            rather than another being made.
+
+            While the API can't be reached, cached data of any age is used.
+        """
+        if refresh_in_background and (cached := self._cache.get(path)) is not None:
+            if cached.age > max_age and self.connected:
+                self._refresh_in_background(path, priority)
+            return cached.data
+        if (
+            cached := self._cache.get(path, max_age if self.connected else None)
+        ) is not None:
+            return cached.data
+        try:
+            return await self._share_fetch(path, priority)
+        except self.RequestError:
+            if not self.connected and (cached := self._cache.get(path)) is not None:
+                return cached.data
+            raise
+
+    async def data(
+        self,
+        path: str,
+        max_age: float | None = None,
+        refresh_in_background: bool = False,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> Any:
+        """Get the data at any path of the API.
+
+        Args:
+            path: The path of the data, relative to the base of the API.
+            max_age: The maximum age (in seconds) of cached data to use;
+                defaults to the cache TTL of the client.
+            refresh_in_background: Use cached data that's too old, while
+                refreshing it in the background?
+            priority: The priority of the call.
+
+        Returns:
+            The decoded data.
+        """
+        return await self._get(
+            path,
+            priority,
+            self._cache_ttl if max_age is None else max_age,
+            refresh_in_background,
+        )
+
+    def has_item(self, item_id: int) -> bool:
+        """Is an item cached, and fresh enough to be used?
+
+        Args:
+            item_id: The ID of the item.
+
+        Returns:
+            `True` if getting the item needs no call to the API, `False` if
+            it does.
+        """
+        return self._cache.get(f"item/{item_id}.json", self._cache_ttl) is not None
+
+    async def _raw_item(
+        self,
+        item_id: int,
+        priority: Priority = Priority.FOREGROUND,
+        max_age: float | None = None,
+    ) -> dict[str, Any]:
         """Get the raw data of an item from the API.
 
         Args:
             item_id: The ID of the item to get.
+            priority: The priority of the call.
+            max_age: The maximum age (in seconds) of cached data to use;
+                defaults to the item cache TTL.
 
         Returns:
             The JSON data of that item as a `dict`.
         """
-        # TODO: Possibly cache this.
-        return cast(dict[str, Any], loads(await self._call("item", f"{item_id}.json")))
+        return cast(
+            dict[str, Any],
+            await self._get(
+                f"item/{item_id}.json",
+                priority,
+                self._cache_ttl if max_age is None else max_age,
+            ),
+        )
 
-    async def item(self, item_type: type[ItemType], item_id: int) -> ItemType:
+    async def item(
+        self,
+        item_type: type[ItemType],
+        item_id: int,
+        priority: Priority = Priority.FOREGROUND,
+        max_age: float | None = None,
+    ) -> ItemType:
         """Get an item by its ID.
 
         Args:
             item_type: The type of the item to get from the API.
             item_id: The ID of the item to get.
+            priority: The priority of the call.
+            max_age: The maximum age (in seconds) of cached data to use;
+                defaults to the item cache TTL.
 
         Returns:
             The item.
         """
         # If we can get the item but it comes back with no data at all...
-        if not (data := await self._raw_item(item_id)):
+        if not (data := await self._raw_item(item_id, priority, max_age)):
             # ...as https://hacker-news.firebaseio.com/v0/item/41050801.json
             # does for some reason, just make an empty version of the item.
             return item_type()
@@ -146,191 +546,386 @@ class HN:
             f"The item of ID '{item_id}' is of type '{item.item_type}', not {item_type.__name__}"
         )
 
+    async def thread(
+        self, item_id: int, priority: Priority = Priority.FOREGROUND
+    ) -> tuple[Article, list[Comment]]:
+        """Find the thread that an item belongs to.
+
+        Args:
+            item_id: The ID of the item.
+            priority: The priority of the calls.
+
+        Returns:
+            The article at the top of the thread, and the comments that lead
+            from it down to the item, top-level comment first; if the item is
+            the article itself there are no comments.
+
+        Raises:
+            HN.NoSuchItem: If the item, or any item above it, doesn't exist.
+            ValueError: If the item isn't part of a thread.
+
+        Note:
+            The thread is found by walking up through the parent of each
+            comment, so any of them that are cached don't need to be
+            fetched; unless a cached item is too old to know about the reply
+            that led up to it. While the walk goes on, the replies that come
+            before each comment on the path are fetched too, as they'll be
+            shown above it.
+        """
+        path: list[Comment] = []
+        siblings: list[Task[list[Comment]]] = []
+        try:
+            while True:
+                if not (data := await self._raw_item(item_id, priority)):
+                    raise self.NoSuchItem(f"Unknown item: {item_id}")
+                item = Loader.load(data)
+                if (
+                    path
+                    and isinstance(item, ParentItem)
+                    and path[0].item_id not in item.kids
+                    and (data := await self._raw_item(item_id, priority, 0))
+                ):
+                    # The cached copy predates the reply we came up from, so
+                    # go and get the latest.
+                    item = Loader.load(data)
+                if (
+                    path
+                    and isinstance(item, ParentItem)
+                    and path[0].item_id in item.kids
+                ):
+                    siblings.append(
+                        create_task(
+                            self._items_from_ids(
+                                Comment,
+                                item.kids[: item.kids.index(path[0].item_id)],
+                                priority,
+                            )
+                        )
+                    )
+                if isinstance(item, Article):
+                    break
+                if not isinstance(item, Comment):
+                    raise ValueError(
+                        f"The item of ID '{item_id}' is of type '{item.item_type}', which isn't part of a thread"
+                    )
+                path.insert(0, item)
+                item_id = item.parent
+            await gather(*siblings)
+        except BaseException:
+            for fetch in siblings:
+                fetch.cancel()
+            raise
+        return item, path
+
     async def _items_from_ids(
-        self, item_type: type[ItemType], item_ids: list[int]
+        self,
+        item_type: type[ItemType],
+        item_ids: list[int],
+        priority: Priority = Priority.FOREGROUND,
+        max_age: float | None = None,
     ) -> list[ItemType]:
         """Turn a list of item IDs into a list of items.
 
         Args:
             item_type: The type of the item we'll be getting.
             item_ids: The IDs of the items to get.
+            priority: The priority of the calls.
+            max_age: The maximum age (in seconds) of cached data to use;
+                defaults to the item cache TTL.
 
         Returns:
             The list of items.
-        """
-        concurrency_limit = Semaphore(self._max_concurrency)
 
-        async def item(item_id: int) -> ItemType:
-            """Get an item, with a limit on concurrent requests.
+        Note:
+            The number of concurrent calls is limited by the client's
+            scheduler, across all calls being made.
 
-            Args:
-                item_id: The ID of the item to get.
-
-            Returns:
-                The item.
-            """
-            async with concurrency_limit:
-                return await self.item(item_type, item_id)
+            If this is cancelled, or if getting any of the items fails, all
+            the outstanding calls are cancelled too. Any items that had
+            arrived by then will still be in the cache.
+        """
+        fetches = [
+            create_task(self.item(item_type, item_id, priority, max_age))
+            for item_id in item_ids
+        ]
+        try:
+            return await gather(*fetches)
+        except BaseException:
+            for fetch in fetches:
+                fetch.cancel()
+            raise
+
+    async def items(
+        self,
+        item_type: type[ItemType],
+        item_ids: list[int],
+        priority: Priority = Priority.FOREGROUND,
+        max_age: float | None = None,
+    ) -> list[ItemType]:
+        """Get the items with the given IDs.
 
-        return await gather(*[item(item_id) for item_id in item_ids])
+        Args:
+            item_type: The type of the items to get.
+            item_ids: The IDs of the items to get.
+            priority: The priority of the calls.
+            max_age: The maximum age (in seconds) of cached data to use;
+                defaults to the item cache TTL.
 
-    async def _id_list(self, list_type: str, max_count: int | None = None) -> list[int]:
+        Returns:
+            The list of items, in the same order as the IDs.
+        """
+        return await self._items_from_ids(item_type, item_ids, priority, max_age)
+
+    async def _id_list(
+        self,
+        list_type: str,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[int]:
         """Get a given ID list.
 
         Args:
             list_type: The type of list to get.
             max_count: Maximum number of IDs to fetch.
+            priority: The priority of the call.
 
         Returns:
             The list of item IDs.
+
+        Note:
+            A list is always fetched fresh, unless the API can't be reached.
         """
         return cast(
-            list[int], loads(await self._call(f"{list_type}.json"))[0:max_count]
+            list[int], (await self._get(f"{list_type}.json", priority, 0))[0:max_count]
         )
 
-    async def top_story_ids(self, max_count: int | None = None) -> list[int]:
+    async def top_story_ids(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[int]:
         """Get the list of top story IDs.
 
         Args:
             max_count: Maximum number of IDs to fetch.
+            priority: The priority of the call.
 
         Returns:
             The list of the top story IDs.
         """
-        return await self._id_list("topstories", max_count)
+        return await self._id_list("topstories", max_count, priority)
 
-    async def top_stories(self, max_count: int | None = None) -> list[Article]:
+    async def top_stories(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[Article]:
         """Get the top stories.
 
         Args:
             max_count: Maximum number of stories to fetch.
+            priority: The priority of the calls.
 
         Returns:
             The list of the top stories.
         """
-        return await self._items_from_ids(Article, await self.top_story_ids(max_count))
+        return await self._items_from_ids(
+            Article, await self.top_story_ids(max_count, priority), priority
+        )
 
-    async def new_story_ids(self, max_count: int | None = None) -> list[int]:
+    async def new_story_ids(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[int]:
         """Get the list of new story IDs.
 
         Args:
             max_count: Maximum number of story IDs to fetch.
+            priority: The priority of the call.
 
         Returns:
             The list of the new story IDs.
         """
-        return await self._id_list("newstories", max_count)
+        return await self._id_list("newstories", max_count, priority)
 
-    async def new_stories(self, max_count: int | None = None) -> list[Article]:
+    async def new_stories(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[Article]:
         """Get the new stories.
 
         Args:
             max_count: Maximum number of stories to fetch.
+            priority: The priority of the calls.
 
         Returns:
             The list of the new stories.
         """
-        return await self._items_from_ids(Article, await self.new_story_ids(max_count))
+        return await self._items_from_ids(
+            Article, await self.new_story_ids(max_count, priority), priority
+        )
 
-    async def best_story_ids(self, max_count: int | None = None) -> list[int]:
+    async def best_story_ids(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[int]:
         """Get the list of best story IDs.
 
         Args:
             max_count: Maximum number of story IDs to fetch.
+            priority: The priority of the call.
 
         Returns:
             The list of the best story IDs.
         """
-        return await self._id_list("beststories", max_count)
+        return await self._id_list("beststories", max_count, priority)
 
-    async def best_stories(self, max_count: int | None = None) -> list[Article]:
+    async def best_stories(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[Article]:
         """Get the best stories.
 
         Args:
             max_count: Maximum number of stories to fetch.
+            priority: The priority of the calls.
 
         Returns:
             The list of the best stories.
         """
-        return await self._items_from_ids(Article, await self.best_story_ids(max_count))
+        return await self._items_from_ids(
+            Article, await self.best_story_ids(max_count, priority), priority
+        )
 
-    async def latest_ask_story_ids(self, max_count: int | None = None) -> list[int]:
+    async def latest_ask_story_ids(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[int]:
         """Get the list of the latest ask story IDs.
 
         Args:
             max_count: Maximum number of story IDs to fetch.
+            priority: The priority of the call.
 
         Returns:
             The list of the latest ask story IDs.
         """
-        return await self._id_list("askstories", max_count)
+        return await self._id_list("askstories", max_count, priority)
 
-    async def latest_ask_stories(self, max_count: int | None = None) -> list[Story]:
+    async def latest_ask_stories(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[Story]:
         """Get the latest AskHN stories.
 
         Args:
             max_count: Maximum number of stories to fetch.
+            priority: The priority of the calls.
 
         Returns:
             The list of the latest AskHN stories.
         """
         return await self._items_from_ids(
-            Story, await self.latest_ask_story_ids(max_count)
+            Story, await self.latest_ask_story_ids(max_count, priority), priority
         )
 
-    async def latest_show_story_ids(self, max_count: int | None = None) -> list[int]:
+    async def latest_show_story_ids(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[int]:
         """Get the list of the latest show story IDs.
 
         Args:
             max_count: Maximum number of story IDs to fetch.
+            priority: The priority of the call.
 
         Returns:
             The list of the latest show story IDs.
         """
-        return await self._id_list("showstories", max_count)
+        return await self._id_list("showstories", max_count, priority)
 
-    async def latest_show_stories(self, max_count: int | None = None) -> list[Story]:
+    async def latest_show_stories(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[Story]:
         """Get the latest ShowHN stories.
 
         Args:
             max_count: Maximum number of stories to fetch.
+            priority: The priority of the calls.
 
         Returns:
             The list of the latest ShowHN stories.
         """
         return await self._items_from_ids(
-            Story, await self.latest_show_story_ids(max_count)
+            Story, await self.latest_show_story_ids(max_count, priority), priority
         )
 
-    async def latest_job_story_ids(self, max_count: int | None = None) -> list[int]:
+    async def latest_job_story_ids(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[int]:
         """Get the list of the latest job story IDs.
 
         Args:
             max_count: Maximum number of job IDs to fetch.
+            priority: The priority of the call.
 
         Returns:
             The list of the latest job story IDs.
         """
-        return await self._id_list("jobstories", max_count)
+        return await self._id_list("jobstories", max_count, priority)
 
-    async def latest_job_stories(self, max_count: int | None = None) -> list[Job]:
+    async def latest_job_stories(
+        self,
+        max_count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[Job]:
         """Get the latest job stories.
 
         Args:
             max_count: Maximum number of jobs to fetch.
+            priority: The priority of the calls.
 
         Returns:
             The list of the latest job stories.
         """
         return await self._items_from_ids(
-            Job, await self.latest_job_story_ids(max_count)
+            Job, await self.latest_job_story_ids(max_count, priority), priority
         )
 
-    async def user(self, user_id: str) -> User:
+    async def updates(
+        self, priority: Priority = Priority.BACKGROUND_TAB
+    ) -> tuple[list[int], list[str]]:
+        """Get the items and users that have changed recently.
+
+        Args:
+            priority: The priority of the call.
+
+        Returns:
+            The IDs of the items, and the IDs of the users, that have
+            recently changed.
+        """
+        updates = await self._get("updates.json", priority, 0) or {}
+        return updates.get("items", []), updates.get("profiles", [])
+
+    async def user(
+        self, user_id: str, priority: Priority = Priority.FOREGROUND
+    ) -> User:
         """Get the details of the given user.
 
         Args:
             user_id: The ID of the user.
+            priority: The priority of the call.
 
         Returns:
             The details of the user.
@@ -338,31 +933,102 @@ class HN:
         Raises:
             HN.NoSuchUser: If the user is not known.
         """
-        if user := loads(await self._call("user", f"{user_id}.json")):
+        if user := await self._get(
+            f"user/{user_id}.json", priority, self._user_cache_ttl
+        ):
             return User().populate_with(user)
         raise self.NoSuchUser(f"Unknown user: {user_id}")
 
-    async def comments(self, item: ParentItem) -> list[Comment]:
+    def cached_user(self, user_id: str) -> User | None:
+        """Get the details of a user, only if they're already to hand.
+
+        Args:
+            user_id: The ID of the user.
+
+        Returns:
+            The details of the user, or `None` if they aren't cached.
+
+        Note:
+            No call is ever made to the API; details of any age will be
+            returned.
+        """
+        if (cached := self._cache.get(f"user/{user_id}.json")) is None or not (
+            cached.data
+        ):
+            return None
+        return User().populate_with(cached.data)
+
+    async def users(
+        self, user_ids: Iterable[str], priority: Priority = Priority.PREFETCH
+    ) -> list[User]:
+        """Get the details of a number of users.
+
+        Args:
+            user_ids: The IDs of the users.
+            priority: The priority of the calls.
+
+        Returns:
+            The details of the users that are known.
+
+        Note:
+            Each user is only fetched once, however many times they appear
+            in `user_ids`; users that aren't known are left out of the
+            result.
+        """
+
+        async def known(user_id: str) -> User | None:
+            try:
+                return await self.user(user_id, priority)
+            except self.NoSuchUser:
+                return None
+
+        return [
+            user
+            for user in await gather(*[known(user_id) for user_id in set(user_ids)])
+            if user is not None
+        ]
+
+    async def comments(
+        self,
+        item: ParentItem,
+        start: int = 0,
+        count: int | None = None,
+        priority: Priority = Priority.FOREGROUND,
+    ) -> list[Comment]:
         """Get the comments for the given item.
 
         Args:
             item: The item to get the comments for.
+            start: The index of the first comment to get.
+            count: The maximum number of comments to get.
+            priority: The priority of the calls.
 
         Returns:
             The list of comments for the item.
+
+        Note:
+            If `count` is `None` all the comments from `start` onwards will
+            be fetched.
         """
-        return await self._items_from_ids(Comment, item.kids)
+        return await self._items_from_ids(
+            Comment,
+            item.kids[start : None if count is None else start + count],
+            priority,
+        )
 
-    async def poll_options(self, poll: Poll) -> list[PollOption]:
+    async def poll_options(
+        self, poll: Poll, priority: Priority = Priority.FOREGROUND
+    ) -> list[PollOption]:
         """Get the options for the given poll.
 
         Args:
-            item: The poll to get the options for.
+            poll: The poll to get the options for.
+            priority: The priority of the calls.
 
         Returns:
             The list of options for the poll.
         """
-        return await self._items_from_ids(PollOption, poll.parts)
+        return await self._items_from_ids(PollOption, poll.parts, priority)
 
 
 ### client.py ends here
@@ -0,0 +1,99 @@
+"""Code for coalescing identical operations that are in flight at once."""
+
+##############################################################################
+# Python imports.
+from asyncio import Task, create_task, shield
+from dataclasses import dataclass
+from typing import Any, Callable, Coroutine, Generic, TypeVar
+
+##############################################################################
+ResultType = TypeVar("ResultType")
+"""The type of the result of a coalesced operation."""
+
+
+##############################################################################
+@dataclass
+class _Shared(Generic[ResultType]):
+    """An operation that is being shared by one or more callers."""
+
+    task: Task[ResultType]
+    """The task that is performing the operation."""
+
+    callers: int = 0
+    """The number of callers waiting on the operation."""
+
+
+##############################################################################
+class Coalescer(Generic[ResultType]):
+    """Coalesces identical operations that are in flight at the same time.
+
+    If an operation is requested while an identical operation is already
+    running, the caller waits on the running operation rather than starting
+    another. If every caller waiting on an operation is cancelled, the
+    operation itself is cancelled.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the coalescer."""
+        self._running: dict[str, _Shared[ResultType]] = {}
+        """The operations that are currently running, keyed by identity."""
+
+    def _finished(self, key: str, shared: _Shared[ResultType]) -> None:
+        """Forget about an operation that is no longer running.
+
+        Args:
+            key: The key of the operation.
+            shared: The operation.
+        """
+        if self._running.get(key) is shared:
+            del self._running[key]
+
+    def _start(
+        self, key: str, operation: Callable[[], Coroutine[Any, Any, ResultType]]
+    ) -> _Shared[ResultType]:
+        """Start running an operation.
+
+        Args:
+            key: The key that identifies the operation.
+            operation: A function that starts the operation.
+
+        Returns:
+            The shared operation.
+        """
+        shared = self._running[key] = _Shared(create_task(operation()))
+        shared.task.add_done_callback(lambda _: self._finished(key, shared))
+        return shared
+
+    async def run(
+        self, key: str, operation: Callable[[], Coroutine[Any, Any, ResultType]]
+    ) -> ResultType:
+        """Run an operation, or join an identical one that is already running.
+
+        Args:
+            key: The key that identifies the operation.
+            operation: A function that starts the operation.
+
+        Returns:
+            The result of the operation.
+        """
+        if (shared := self._running.get(key)) is None:
+            shared = self._start(key, operation)
+        shared.callers += 1
+        try:
+            return await shield(shared.task)
+        finally:
+            shared.callers -= 1
+            if not shared.callers and not shared.task.done():
+                # Nobody is interested in the result any more, so there's
+                # no sense in keeping the operation going.
+                self._finished(key, shared)
+                shared.task.cancel()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._running
+
+    def __len__(self) -> int:
+        return len(self._running)
+
+
+### coalesce.py ends here
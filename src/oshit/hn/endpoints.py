@@ -0,0 +1,155 @@
+"""Code for choosing between the endpoints that serve the API."""
+
+##############################################################################
+# Python imports.
+from time import monotonic
+from typing import Iterator, Sequence
+
+
+##############################################################################
+class Endpoint:
+    """An endpoint that serves the API, and how well it's doing."""
+
+    SMOOTHING = 0.2
+    """How much weight a new latency measurement is given."""
+
+    def __init__(self, base_url: str) -> None:
+        """Initialise the endpoint.
+
+        Args:
+            base_url: The base of the URL for the API at this endpoint.
+        """
+        self.base_url = f"{base_url.rstrip('/')}/"
+        """The base of the URL for the API at this endpoint."""
+        self.latency: float | None = None
+        """The smoothed latency (in seconds) of the endpoint, once measured."""
+        self.failures = 0
+        """The number of failures in a row at this endpoint."""
+        self.resting_until = 0.0
+        """The time until which the endpoint is rested after failing."""
+
+    @property
+    def healthy(self) -> bool:
+        """Should the endpoint be used?"""
+        return monotonic() >= self.resting_until
+
+    def succeeded(self, latency: float) -> None:
+        """Record that a call to the endpoint succeeded.
+
+        Args:
+            latency: The time (in seconds) the call took.
+        """
+        self.failures = 0
+        self.resting_until = 0.0
+        self.latency = (
+            latency
+            if self.latency is None
+            else self.latency + (latency - self.latency) * self.SMOOTHING
+        )
+
+    def failed(self, rest: float) -> None:
+        """Record that a call to the endpoint failed.
+
+        Args:
+            rest: The base time (in seconds) to rest the endpoint for.
+
+        Note:
+            The time the endpoint is rested for doubles with each failure
+            in a row, up to eight times the base time.
+        """
+        self.failures += 1
+        self.resting_until = monotonic() + rest * 2 ** min(self.failures - 1, 3)
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.base_url!r})"
+
+
+##############################################################################
+class Endpoints:
+    """The endpoints that serve the API, in the order they should be tried.
+
+    Calls go to the fastest healthy endpoint. An endpoint that fails is
+    rested for a while, and calls fail over to the next best one; once
+    rested it's tried again. Every so often a call goes to an endpoint
+    other than the fastest, so that the latency of every healthy endpoint
+    stays measured.
+    """
+
+    EXPLORE_EVERY = 100
+    """How often (in calls) a call is used to measure another endpoint."""
+
+    def __init__(self, base_urls: Sequence[str], rest: float = 30) -> None:
+        """Initialise the endpoints.
+
+        Args:
+            base_urls: The bases of the URLs for the API, in order of preference.
+            rest: The base time (in seconds) to rest an endpoint after it fails.
+        """
+        self._endpoints = [Endpoint(base_url) for base_url in base_urls]
+        """The endpoints, in order of preference."""
+        self._rest = rest
+        """The base time (in seconds) to rest an endpoint after it fails."""
+        self._calls = 0
+        """The number of calls for which endpoints have been chosen."""
+
+    def _preference(self, endpoint: Endpoint) -> tuple[bool, float, int]:
+        """Get the sort key that puts the best endpoint first.
+
+        Args:
+            endpoint: The endpoint to get the key for.
+
+        Returns:
+            The sort key.
+
+        Note:
+            An endpoint that hasn't been measured yet sorts as the fastest,
+            so every endpoint gets measured.
+        """
+        return (
+            not endpoint.healthy,
+            endpoint.latency or 0.0,
+            self._endpoints.index(endpoint),
+        )
+
+    def __iter__(self) -> Iterator[Endpoint]:
+        """The endpoints, in the order they should be tried for a call.
+
+        Note:
+            Unhealthy endpoints come last, but are still included, so that
+            a call is only given up on once every endpoint has been tried.
+        """
+        self._calls += 1
+        ordered = sorted(self._endpoints, key=self._preference)
+        if self._calls % self.EXPLORE_EVERY == 0:
+            healthy = [endpoint for endpoint in ordered if endpoint.healthy]
+            if len(healthy) > 1:
+                # Give each of the others a turn, so its latency stays current.
+                explore = healthy[
+                    1 + (self._calls // self.EXPLORE_EVERY) % (len(healthy) - 1)
+                ]
+                ordered.remove(explore)
+                ordered.insert(0, explore)
+        return iter(ordered)
+
+    def succeeded(self, endpoint: Endpoint, latency: float) -> None:
+        """Record that a call to an endpoint succeeded.
+
+        Args:
+            endpoint: The endpoint.
+            latency: The time (in seconds) the call took.
+        """
+        endpoint.succeeded(latency)
+
+    def failed(self, endpoint: Endpoint) -> None:
+        """Record that a call to an endpoint failed.
+
+        Args:
+            endpoint: The endpoint.
+        """
+        endpoint.failed(self._rest)
+
+    def __len__(self) -> int:
+        return len(self._endpoints)
+
+
+### endpoints.py ends here
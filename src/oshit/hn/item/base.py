@@ -35,6 +35,9 @@ class Item:
     raw_text: str = ""
     """The raw text of the of the item, if it has text."""
 
+    raw_data: dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
+    """The raw data the item was populated from."""
+
     def populate_with(self, data: dict[str, Any]) -> Self:
         """Populate the item with the data from the given JSON value.
 
@@ -49,6 +52,7 @@ class Item:
         self.item_type = data["type"]
         self.time = datetime.fromtimestamp(data["time"])
         self.raw_text = data.get("text", "")
+        self.raw_data = data
         return self
 
     @property
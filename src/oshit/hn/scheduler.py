@@ -0,0 +1,267 @@
+"""Prioritised scheduling of calls made to the HackerNews API."""
+
+##############################################################################
+# Python imports.
+from asyncio import Future, get_running_loop
+from collections import deque
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from enum import IntEnum
+from math import ceil
+from time import monotonic
+from typing import AsyncIterator, Final
+
+
+##############################################################################
+class Priority(IntEnum):
+    """The priority classes for calls to the API.
+
+    The lower the value, the higher the priority.
+    """
+
+    FOREGROUND = 0
+    """Calls made for the screen the user is looking at."""
+
+    ACTIVE_TAB = 1
+    """Calls made for the tab the user is looking at."""
+
+    BACKGROUND_TAB = 2
+    """Calls made for tabs the user isn't looking at."""
+
+    PREFETCH = 3
+    """Speculative calls made in case the user might want the data."""
+
+
+##############################################################################
+@dataclass
+class ClassStatistics:
+    """Statistics for a priority class within the scheduler."""
+
+    queued: int = 0
+    """The number of calls currently waiting to run."""
+
+    running: int = 0
+    """The number of calls currently running."""
+
+    served: int = 0
+    """The number of calls that have been allowed to run."""
+
+    total_wait: float = 0.0
+    """The total time (in seconds) calls have spent waiting to run."""
+
+    longest_wait: float = 0.0
+    """The longest time (in seconds) a call has spent waiting to run."""
+
+    @property
+    def average_wait(self) -> float:
+        """The average time (in seconds) a call has spent waiting to run."""
+        return self.total_wait / self.served if self.served else 0.0
+
+
+##############################################################################
+@dataclass
+class _Waiter:
+    """A call that is waiting to run."""
+
+    priority: Priority
+    """The priority the call is waiting at."""
+
+    queued_at: float
+    """The time the call started waiting."""
+
+    ready: Future[None]
+    """The future that is resolved when the call can run."""
+
+    key: str | None = None
+    """The key that identifies the call, if it has one."""
+
+
+##############################################################################
+class Scheduler:
+    """A client-wide, prioritised, concurrency limiter.
+
+    All calls that go via the scheduler share a single concurrency cap.
+    When a slot becomes free it is always given to the highest priority
+    call that is waiting. On top of this the lower priority classes are
+    only allowed to use a share of the cap, which means there is always
+    headroom for higher priority calls to start right away, even when the
+    scheduler is busy with a lot of background work.
+
+    A call that's waiting can be given a key, so that its priority can be
+    raised while it waits; for example when something more urgent turns
+    out to be waiting on the same call.
+    """
+
+    SHARE: Final[dict[Priority, float]] = {
+        Priority.FOREGROUND: 1.0,
+        Priority.ACTIVE_TAB: 1.0,
+        Priority.BACKGROUND_TAB: 0.75,
+        Priority.PREFETCH: 0.25,
+    }
+    """The share of the concurrency cap each priority class can use."""
+
+    def __init__(self, max_concurrency: int) -> None:
+        """Initialise the scheduler.
+
+        Args:
+            max_concurrency: The maximum number of concurrent calls.
+        """
+        self._limits = {
+            priority: max(1, ceil(max_concurrency * share))
+            for priority, share in self.SHARE.items()
+        }
+        """The concurrency limit for each of the priority classes."""
+        self._running = 0
+        """The number of calls currently running."""
+        self._waiting: dict[Priority, deque[_Waiter]] = {
+            priority: deque() for priority in Priority
+        }
+        """The calls waiting to run, by priority class."""
+        self._keyed: dict[str, _Waiter] = {}
+        """The calls waiting to run that have a key, keyed on that key."""
+        self._statistics = {priority: ClassStatistics() for priority in Priority}
+        """The statistics for each of the priority classes."""
+
+    @property
+    def statistics(self) -> dict[Priority, ClassStatistics]:
+        """The current statistics for each of the priority classes."""
+        for priority, waiting in self._waiting.items():
+            self._statistics[priority].queued = len(waiting)
+        return self._statistics
+
+    def _can_run(self, priority: Priority) -> bool:
+        """Can a call of the given priority start right now?
+
+        Args:
+            priority: The priority of the call.
+
+        Returns:
+            `True` if the call can start, `False` if not.
+        """
+        return self._running < self._limits[priority] and not any(
+            self._waiting[higher] for higher in Priority if higher < priority
+        )
+
+    def _start(self, priority: Priority, queued_at: float) -> None:
+        """Record that a call has been allowed to run.
+
+        Args:
+            priority: The priority of the call.
+            queued_at: The time the call started waiting.
+        """
+        self._running += 1
+        statistics = self._statistics[priority]
+        statistics.running += 1
+        statistics.served += 1
+        statistics.total_wait += (waited := monotonic() - queued_at)
+        statistics.longest_wait = max(statistics.longest_wait, waited)
+
+    def _dispatch(self) -> None:
+        """Hand free slots to the highest priority calls that are waiting."""
+        for priority in Priority:
+            waiting = self._waiting[priority]
+            while waiting and self._running < self._limits[priority]:
+                waiter = waiting.popleft()
+                self._forget(waiter)
+                if waiter.ready.cancelled():
+                    # The caller gave up on waiting and will tidy up after
+                    # itself; don't give it a slot it'll never use.
+                    continue
+                self._start(priority, waiter.queued_at)
+                waiter.ready.set_result(None)
+            if waiting:
+                # Calls of this priority are still waiting, so nothing of
+                # a lower priority gets to go ahead of them.
+                return
+
+    def _forget(self, waiter: _Waiter) -> None:
+        """Forget the key of a call that is no longer waiting.
+
+        Args:
+            waiter: The call.
+        """
+        if waiter.key is not None and self._keyed.get(waiter.key) is waiter:
+            del self._keyed[waiter.key]
+
+    async def _acquire(self, priority: Priority, key: str | None = None) -> Priority:
+        """Wait for a slot for a call of the given priority.
+
+        Args:
+            priority: The priority of the call.
+            key: The key that identifies the call, if it has one.
+
+        Returns:
+            The priority the call ended up running at.
+        """
+        queued_at = monotonic()
+        if self._can_run(priority):
+            self._start(priority, queued_at)
+            return priority
+        waiter = _Waiter(priority, queued_at, get_running_loop().create_future(), key)
+        self._waiting[priority].append(waiter)
+        if key is not None:
+            self._keyed[key] = waiter
+        try:
+            await waiter.ready
+        except BaseException:
+            if waiter.ready.done() and not waiter.ready.cancelled():
+                # We were cancelled after being handed a slot, so give the
+                # slot back so that it isn't lost.
+                self._release(waiter.priority)
+            else:
+                # We were cancelled while still waiting, so stop waiting;
+                # unless a dispatch has already dropped us.
+                self._forget(waiter)
+                with suppress(ValueError):
+                    self._waiting[waiter.priority].remove(waiter)
+                self._dispatch()
+            raise
+        return waiter.priority
+
+    def escalate(self, key: str, priority: Priority) -> None:
+        """Raise the priority of a call that is waiting to run.
+
+        Args:
+            key: The key that identifies the call.
+            priority: The priority to raise the call to.
+
+        Note:
+            If there's no call waiting with the key, or it's already waiting
+            at the given priority or higher, nothing happens.
+        """
+        if (waiter := self._keyed.get(key)) is None or waiter.priority <= priority:
+            return
+        self._waiting[waiter.priority].remove(waiter)
+        waiter.priority = priority
+        self._waiting[priority].append(waiter)
+        self._dispatch()
+
+    def _release(self, priority: Priority) -> None:
+        """Release the slot held by a call of the given priority.
+
+        Args:
+            priority: The priority of the call.
+        """
+        self._running -= 1
+        self._statistics[priority].running -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: Priority, key: str | None = None
+    ) -> AsyncIterator[None]:
+        """Run a call within a slot of the given priority.
+
+        Args:
+            priority: The priority of the call.
+            key: The key that identifies the call, so that its priority can
+                be raised while it waits.
+        """
+        priority = await self._acquire(priority, key)
+        try:
+            yield
+        finally:
+            self._release(priority)
+
+
+### scheduler.py ends here
@@ -0,0 +1,98 @@
+"""Code for warming the cache with comments, ahead of them being wanted."""
+
+##############################################################################
+# Python imports.
+from asyncio import Lock, gather, sleep
+from time import monotonic
+from typing import Sequence
+
+##############################################################################
+# Local imports.
+from .client import HN
+from .item import Article, Item, ParentItem
+from .scheduler import Priority
+
+
+##############################################################################
+class CacheWarmer:
+    """Warms the cache with the comments on articles, within a budget.
+
+    Comments are fetched at the lowest priority, so anything else that
+    wants the API goes first; and no more than a set number of calls are
+    made each minute, however long the warming goes on for. Comments that
+    are already cached, and fresh, cost nothing from the budget.
+    """
+
+    def __init__(self, client: HN, budget: int) -> None:
+        """Initialise the cache warmer.
+
+        Args:
+            client: The HackerNews client to warm the cache of.
+            budget: The maximum number of calls to make to the API a minute.
+        """
+        self._client = client
+        """The HackerNews client to warm the cache of."""
+        self._budget = max(1, budget)
+        """The maximum number of calls to make to the API a minute."""
+        self._allowance = float(self._budget)
+        """The number of calls that can be made right now."""
+        self._topped_up = monotonic()
+        """The time the allowance was last topped up."""
+        self._spending = Lock()
+        """Makes sure only one call at a time takes from the allowance."""
+
+    async def _spend(self) -> None:
+        """Wait until a call to the API can be afforded, then spend it."""
+        async with self._spending:
+            while True:
+                now = monotonic()
+                self._allowance = min(
+                    self._budget,
+                    self._allowance + (now - self._topped_up) * self._budget / 60,
+                )
+                self._topped_up = now
+                if self._allowance >= 1:
+                    self._allowance -= 1
+                    return
+                await sleep((1 - self._allowance) * 60 / self._budget)
+
+    async def _item(self, item_id: int) -> Item | None:
+        """Get an item, paying for it from the budget if it isn't cached.
+
+        Args:
+            item_id: The ID of the item.
+
+        Returns:
+            The item, or `None` if it couldn't be got.
+        """
+        if not self._client.has_item(item_id):
+            await self._spend()
+        try:
+            return await self._client.item(Item, item_id, Priority.PREFETCH)
+        except HN.RequestError:
+            return None
+
+    async def warm(self, articles: Sequence[Article], depth: int = 2) -> None:
+        """Warm the cache with the comments on some articles.
+
+        Args:
+            articles: The articles to warm the comments of.
+            depth: The number of levels of comments to warm.
+
+        Note:
+            The comments are warmed a level at a time across all of the
+            articles; so the top-level comments of every article are cached
+            before any of the replies to them.
+        """
+        parents: list[ParentItem] = list(articles)
+        for _ in range(depth):
+            if not (kids := [kid for parent in parents for kid in parent.kids]):
+                return
+            parents = [
+                item
+                for item in await gather(*[self._item(kid) for kid in kids])
+                if isinstance(item, ParentItem)
+            ]
+
+
+### warmer.py ends here
@@ -0,0 +1,230 @@
+"""Code for profiling the startup of the application.
+
+Note:
+    This module is imported before anything else when profiling startup, so
+    it should only ever import from the Python standard library.
+"""
+
+##############################################################################
+# Python imports.
+import sys
+from importlib import import_module
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from time import perf_counter
+from types import ModuleType
+from typing import Any, Callable, Sequence
+
+
+##############################################################################
+class _TimedLoader(Loader):
+    """A loader that times how long the module it loads takes to execute."""
+
+    def __init__(self, loader: Loader, name: str, timer: "ImportTimer") -> None:
+        """Initialise the timed loader.
+
+        Args:
+            loader: The loader that will really load the module.
+            name: The name of the module being loaded.
+            timer: The import timer to report the time to.
+        """
+        self._loader = loader
+        """The loader that will really load the module."""
+        self._name = name
+        """The name of the module being loaded."""
+        self._timer = timer
+        """The import timer to report the time to."""
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._timer.started_module()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.finished_module(self._name)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+##############################################################################
+class ImportTimer(MetaPathFinder):
+    """Times the import of every module imported while it is installed."""
+
+    def __init__(self) -> None:
+        """Initialise the import timer."""
+        self.started = perf_counter()
+        """The time at which the timer was created."""
+        self.times: dict[str, float] = {}
+        """The time (in seconds) each module took to import, excluding its imports."""
+        self._nested: list[tuple[float, float]] = []
+        """The start time, and time taken by imports within, of imports in progress."""
+
+    def install(self) -> None:
+        """Start timing imports."""
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        """Stop timing imports."""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Sequence[str] | None,
+        target: ModuleType | None = None,
+    ) -> ModuleSpec | None:
+        """Find the spec for a module, arranging for its import to be timed.
+
+        Args:
+            fullname: The full name of the module.
+            path: The path to look for the module in.
+            target: The module being reloaded, if it's a reload.
+
+        Returns:
+            The spec for the module, or `None` if it can't be found.
+        """
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            if (spec := finder.find_spec(fullname, path, target)) is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, fullname, self)
+                return spec
+        return None
+
+    def started_module(self) -> None:
+        """Note that the execution of a module has started."""
+        self._nested.append((perf_counter(), 0.0))
+
+    def finished_module(self, name: str) -> None:
+        """Note that the execution of a module has finished.
+
+        Args:
+            name: The name of the module.
+        """
+        started, within = self._nested.pop()
+        taken = perf_counter() - started
+        self.times[name] = taken - within
+        if self._nested:
+            outer_started, outer_within = self._nested[-1]
+            self._nested[-1] = (outer_started, outer_within + taken)
+
+
+##############################################################################
+class ComposeTimer:
+    """Times the composing of every widget composed while it is installed.
+
+    Note:
+        Textual has no hook for this, so the timer wraps the function that
+        Textual uses to compose widgets. Textual is imported when the timer
+        is installed, so install it once the application has been imported
+        if the imports are being timed too.
+    """
+
+    _MODULES = ("textual.app", "textual.widget")
+    """The Textual modules that compose widgets."""
+
+    def __init__(self) -> None:
+        """Initialise the compose timer."""
+        self.times: dict[str, float] = {}
+        """The time (in seconds) taken to compose the widgets of each module."""
+        self.counts: dict[str, int] = {}
+        """The number of times the widgets of each module were composed."""
+        self._compose: Callable[[Any], list[Any]] | None = None
+        """The function Textual uses to compose widgets."""
+
+    def install(self) -> None:
+        """Start timing composing."""
+        if self._compose is not None:
+            return
+        self._compose = import_module(self._MODULES[0]).compose
+        for module in self._MODULES:
+            setattr(import_module(module), "compose", self._timed)
+
+    def uninstall(self) -> None:
+        """Stop timing composing."""
+        if self._compose is not None:
+            for module in self._MODULES:
+                setattr(sys.modules[module], "compose", self._compose)
+            self._compose = None
+
+    def _timed(self, node: Any) -> list[Any]:
+        """Compose a widget, noting the time taken against its module.
+
+        Args:
+            node: The app or widget to compose.
+
+        Returns:
+            The widgets composed.
+        """
+        assert self._compose is not None
+        started = perf_counter()
+        try:
+            return self._compose(node)
+        finally:
+            module = type(node).__module__
+            self.times[module] = self.times.get(module, 0.0) + (
+                perf_counter() - started
+            )
+            self.counts[module] = self.counts.get(module, 0) + 1
+
+
+##############################################################################
+def startup_report(
+    imports: ImportTimer,
+    composes: ComposeTimer,
+    phases: dict[str, float],
+    first_story: float | None,
+    top: int = 25,
+) -> str:
+    """Create a report on the startup of the application.
+
+    Args:
+        imports: The timer that timed the imports.
+        composes: The timer that timed the composing of widgets.
+        phases: The time (in seconds since startup) each phase was reached.
+        first_story: The time (in seconds since startup) until the first
+            story was shown, if one was.
+        top: The number of slowest modules to report on.
+
+    Returns:
+        The text of the report.
+    """
+    slowest = sorted(imports.times.items(), key=lambda module: -module[1])[:top]
+    composing = sorted(composes.times.items(), key=lambda module: -module[1])[:top]
+    width = max(
+        (len(name) for name in [*dict(slowest), *dict(composing), *phases]),
+        default=0,
+    )
+    return "\n".join(
+        [
+            "Startup profile",
+            "",
+            "Time to first story: "
+            + ("not shown" if first_story is None else f"{first_story * 1000:.1f}ms"),
+            "",
+            f"Imports: {len(imports.times)} modules, "
+            f"{sum(imports.times.values()) * 1000:.1f}ms in total; "
+            f"the {len(slowest)} slowest, excluding their own imports:",
+            *(f"  {name:<{width}} {taken * 1000:8.1f}ms" for name, taken in slowest),
+            "",
+            f"Composing: {sum(composes.counts.values())} composes, "
+            f"{sum(composes.times.values()) * 1000:.1f}ms in total; "
+            f"the {len(composing)} slowest modules, excluding the widgets' children:",
+            *(
+                f"  {name:<{width}} {taken * 1000:8.1f}ms "
+                f"({composes.counts[name]} compose{'' if composes.counts[name] == 1 else 's'})"
+                for name, taken in composing
+            ),
+            "",
+            "Phases, as time since startup:",
+            *(f"  {phase:<{width}} {at * 1000:8.1f}ms" for phase, at in phases.items()),
+        ]
+    )
+
+
+### profiling.py ends here
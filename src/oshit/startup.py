@@ -0,0 +1,83 @@
+"""Code for getting a head start on things while the application starts up."""
+
+##############################################################################
+# Python imports.
+from asyncio import Task, create_task
+from time import perf_counter
+
+##############################################################################
+# Local imports.
+from .hn import HN, Priority
+from .hn.item import Article
+
+
+##############################################################################
+class Startup:
+    """Holds the work started, and the metrics gathered, during startup."""
+
+    def __init__(self, started: float | None = None) -> None:
+        """Initialise the startup object.
+
+        Args:
+            started: The time at which the application started; defaults to now.
+        """
+        self.started = perf_counter() if started is None else started
+        """The time at which the application started."""
+        self.phases: dict[str, float] = {}
+        """The time (in seconds since startup) at which each phase was reached."""
+        self.first_story: float | None = None
+        """The time (in seconds since startup) until the first story was shown."""
+        self.client: HN | None = None
+        """The HackerNews client that was created during startup."""
+        self._warm_up: Task[None] | None = None
+        """The early warm-up of the connections to HackerNews."""
+        self._top_stories: Task[list[Article]] | None = None
+        """The early fetch of the top stories."""
+
+    def head_start(self, client: HN, max_top: int) -> None:
+        """Start talking to HackerNews before the application is ready.
+
+        Args:
+            client: The HackerNews client to use.
+            max_top: The maximum number of top stories to fetch.
+
+        Note:
+            This must be called from within a running event loop.
+        """
+        self.client = client
+        self._warm_up = create_task(client.warm_up())
+        self._top_stories = create_task(
+            client.top_stories(max_top, Priority.ACTIVE_TAB)
+        )
+
+    def take_top_stories(self) -> Task[list[Article]] | None:
+        """Take the early fetch of the top stories, if there is one.
+
+        Returns:
+            The task fetching the top stories, or `None` if there isn't one.
+
+        Note:
+            The fetch can only be taken once; after that `None` is returned.
+        """
+        top_stories, self._top_stories = self._top_stories, None
+        return top_stories
+
+    def mark(self, phase: str) -> float:
+        """Record that a phase of the startup has been reached.
+
+        Args:
+            phase: The name of the phase.
+
+        Returns:
+            The time (in seconds since startup) at which the phase was reached.
+        """
+        reached = self.phases[phase] = perf_counter() - self.started
+        return reached
+
+    def story_shown(self) -> None:
+        """Record that the first story has been shown to the user."""
+        if self.first_story is None:
+            self.first_story = self.mark("first story shown")
+
+
+### startup.py ends here